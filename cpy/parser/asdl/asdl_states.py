@@ -100,4 +100,3 @@ states = {
     'asdl': asdl,
 }
 states = States(**states)
-states.build_bootstrap()
@@ -69,6 +69,40 @@ class ASTNode(object):
                     logging.debug('not equal(%s): %r %r' % (attr, a, b))
                 return False
         return True
+
+    def moved(self, rows):
+        # copy of this node moved down by `rows` lines; the attributes are
+        # copied on first use, the nodes under it moved the same way, so
+        # making the copy costs the same for any node
+        moved = self.__dict__.get('_moved', None)
+        if moved is not None:
+            return moved[0].moved(moved[1] + rows)
+        new = object.__new__(type(self))
+        new._moved = (self, rows)
+        return new
+
+    def __getattr__(self, attr):
+        # only called for a slot not set, as those of a moved() copy are;
+        # `_moved` goes once they all are, as Tables drops its snapshot
+        moved = self.__dict__.get('_moved', None)
+        if moved is None:
+            return object.__getattribute__(self, attr)
+        node, rows = moved
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                value = getattr(node, name, NotEqual)
+                if value is NotEqual:
+                    continue
+                if name == 'lineno':
+                    value += rows
+                elif isinstance(value, ASTNode):
+                    value = value.moved(rows)
+                elif isinstance(value, list):
+                    value = [isinstance(v, ASTNode) and v.moved(rows) or v
+                        for v in value]
+                setattr(self, name, value)
+        self.__dict__.pop('_moved', None)
+        return getattr(self, attr)
 '''
 
 assigns = '''
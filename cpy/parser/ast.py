@@ -0,0 +1,947 @@
+# generated by cpy/parser/asdl/astdef.py
+import logging
+
+
+class Equal(object):
+    pass
+
+
+class NotEqual(object):
+    pass
+
+
+class ASTNode(object):
+    @classmethod
+    def compare(cls, a, b):
+        if type(a) is type:
+            if a.__name__ != type(b).__name__:
+                logging.debug(
+                    'ctx not equal: %s %s' % (a.__name__, type(b).__name__))
+                return False
+        else:
+            if a is Equal or b is Equal:
+                return True
+            if isinstance(a, list):
+                if not isinstance(b, list):
+                    return False
+                for ai, bi in zip(a, b):
+                    if not cls.compare(ai, bi):
+                        return False
+            elif a != b:
+                return False
+        return True
+
+    def __eq__(self, obj):
+        if obj is Equal:
+            return True
+        for attr in self.__slots__:
+            a = getattr(self, attr, NotEqual())
+            b = getattr(obj, attr, NotEqual())
+            if not self.compare(a, b):
+                if hasattr(b, 'lineno'):
+                    logging.debug(
+                        'not equal: %r %r at line %d,%d' % (
+                            a, b, b.lineno, b.col_offset))
+                else:
+                    logging.debug('not equal(%s): %r %r' % (attr, a, b))
+                return False
+        return True
+
+    def moved(self, rows):
+        # copy of this node moved down by `rows` lines; the attributes are
+        # copied on first use, the nodes under it moved the same way, so
+        # making the copy costs the same for any node
+        moved = self.__dict__.get('_moved', None)
+        if moved is not None:
+            return moved[0].moved(moved[1] + rows)
+        new = object.__new__(type(self))
+        new._moved = (self, rows)
+        return new
+
+    def __getattr__(self, attr):
+        # only called for a slot not set, as those of a moved() copy are;
+        # `_moved` goes once they all are, as Tables drops its snapshot
+        moved = self.__dict__.get('_moved', None)
+        if moved is None:
+            return object.__getattribute__(self, attr)
+        node, rows = moved
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                value = getattr(node, name, NotEqual)
+                if value is NotEqual:
+                    continue
+                if name == 'lineno':
+                    value += rows
+                elif isinstance(value, ASTNode):
+                    value = value.moved(rows)
+                elif isinstance(value, list):
+                    value = [isinstance(v, ASTNode) and v.moved(rows) or v
+                        for v in value]
+                setattr(self, name, value)
+        self.__dict__.pop('_moved', None)
+        return getattr(self, attr)
+
+
+class mod(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(mod, self).__init__(*argv, **kwargv)
+
+
+class Module(mod):
+    __slots__ = ('body',)
+
+    def __init__(self, body, *argv, **kwargv):
+        self.body = body
+        super(Module, self).__init__(*argv, **kwargv)
+
+
+class Interactive(mod):
+    __slots__ = ('body',)
+
+    def __init__(self, body, *argv, **kwargv):
+        self.body = body
+        super(Interactive, self).__init__(*argv, **kwargv)
+
+
+class Expression(mod):
+    __slots__ = ('body',)
+
+    def __init__(self, body, *argv, **kwargv):
+        self.body = body
+        super(Expression, self).__init__(*argv, **kwargv)
+
+
+class Suite(mod):
+    __slots__ = ('body',)
+
+    def __init__(self, body, *argv, **kwargv):
+        self.body = body
+        super(Suite, self).__init__(*argv, **kwargv)
+
+
+class stmt(ASTNode):
+    __slots__ = ('lineno', 'col_offset')
+
+    def __init__(self, lineno, col_offset, *argv, **kwargv):
+        self.lineno = lineno
+        self.col_offset = col_offset
+        super(stmt, self).__init__(*argv, **kwargv)
+
+
+class FunctionDef(stmt):
+    __slots__ = ('name', 'args', 'body', 'decorator_list', 'returns')
+
+    def __init__(self, name, args, body, decorator_list, returns, *argv, **kwargv):
+        self.name = name
+        self.args = args
+        self.body = body
+        self.decorator_list = decorator_list
+        self.returns = returns
+        super(FunctionDef, self).__init__(*argv, **kwargv)
+
+
+class ClassDef(stmt):
+    __slots__ = ('name', 'bases', 'keywords', 'starargs', 'kwargs', 'body', 'decorator_list')
+
+    def __init__(self, name, bases, keywords, starargs, kwargs, body, decorator_list, *argv, **kwargv):
+        self.name = name
+        self.bases = bases
+        self.keywords = keywords
+        self.starargs = starargs
+        self.kwargs = kwargs
+        self.body = body
+        self.decorator_list = decorator_list
+        super(ClassDef, self).__init__(*argv, **kwargv)
+
+
+class Return(stmt):
+    __slots__ = ('value',)
+
+    def __init__(self, value, *argv, **kwargv):
+        self.value = value
+        super(Return, self).__init__(*argv, **kwargv)
+
+
+class Delete(stmt):
+    __slots__ = ('targets',)
+
+    def __init__(self, targets, *argv, **kwargv):
+        self.targets = targets
+        super(Delete, self).__init__(*argv, **kwargv)
+
+
+class Assign(stmt):
+    __slots__ = ('targets', 'value')
+
+    def __init__(self, targets, value, *argv, **kwargv):
+        self.targets = targets
+        self.value = value
+        super(Assign, self).__init__(*argv, **kwargv)
+
+
+class AugAssign(stmt):
+    __slots__ = ('target', 'op', 'value')
+
+    def __init__(self, target, op, value, *argv, **kwargv):
+        self.target = target
+        self.op = op
+        self.value = value
+        super(AugAssign, self).__init__(*argv, **kwargv)
+
+
+class For(stmt):
+    __slots__ = ('target', 'iter', 'body', 'orelse')
+
+    def __init__(self, target, iter, body, orelse, *argv, **kwargv):
+        self.target = target
+        self.iter = iter
+        self.body = body
+        self.orelse = orelse
+        super(For, self).__init__(*argv, **kwargv)
+
+
+class While(stmt):
+    __slots__ = ('test', 'body', 'orelse')
+
+    def __init__(self, test, body, orelse, *argv, **kwargv):
+        self.test = test
+        self.body = body
+        self.orelse = orelse
+        super(While, self).__init__(*argv, **kwargv)
+
+
+class If(stmt):
+    __slots__ = ('test', 'body', 'orelse')
+
+    def __init__(self, test, body, orelse, *argv, **kwargv):
+        self.test = test
+        self.body = body
+        self.orelse = orelse
+        super(If, self).__init__(*argv, **kwargv)
+
+
+class With(stmt):
+    __slots__ = ('items', 'body')
+
+    def __init__(self, items, body, *argv, **kwargv):
+        self.items = items
+        self.body = body
+        super(With, self).__init__(*argv, **kwargv)
+
+
+class Raise(stmt):
+    __slots__ = ('exc', 'cause')
+
+    def __init__(self, exc, cause, *argv, **kwargv):
+        self.exc = exc
+        self.cause = cause
+        super(Raise, self).__init__(*argv, **kwargv)
+
+
+class Try(stmt):
+    __slots__ = ('body', 'handlers', 'orelse', 'finalbody')
+
+    def __init__(self, body, handlers, orelse, finalbody, *argv, **kwargv):
+        self.body = body
+        self.handlers = handlers
+        self.orelse = orelse
+        self.finalbody = finalbody
+        super(Try, self).__init__(*argv, **kwargv)
+
+
+class Assert(stmt):
+    __slots__ = ('test', 'msg')
+
+    def __init__(self, test, msg, *argv, **kwargv):
+        self.test = test
+        self.msg = msg
+        super(Assert, self).__init__(*argv, **kwargv)
+
+
+class Import(stmt):
+    __slots__ = ('names',)
+
+    def __init__(self, names, *argv, **kwargv):
+        self.names = names
+        super(Import, self).__init__(*argv, **kwargv)
+
+
+class ImportFrom(stmt):
+    __slots__ = ('module', 'names', 'level')
+
+    def __init__(self, module, names, level, *argv, **kwargv):
+        self.module = module
+        self.names = names
+        self.level = level
+        super(ImportFrom, self).__init__(*argv, **kwargv)
+
+
+class Global(stmt):
+    __slots__ = ('names',)
+
+    def __init__(self, names, *argv, **kwargv):
+        self.names = names
+        super(Global, self).__init__(*argv, **kwargv)
+
+
+class Nonlocal(stmt):
+    __slots__ = ('names',)
+
+    def __init__(self, names, *argv, **kwargv):
+        self.names = names
+        super(Nonlocal, self).__init__(*argv, **kwargv)
+
+
+class Expr(stmt):
+    __slots__ = ('value',)
+
+    def __init__(self, value, *argv, **kwargv):
+        self.value = value
+        super(Expr, self).__init__(*argv, **kwargv)
+
+
+class Pass(stmt):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Pass, self).__init__(*argv, **kwargv)
+
+
+class Break(stmt):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Break, self).__init__(*argv, **kwargv)
+
+
+class Continue(stmt):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Continue, self).__init__(*argv, **kwargv)
+
+
+class expr(ASTNode):
+    __slots__ = ('lineno', 'col_offset')
+
+    def __init__(self, lineno, col_offset, *argv, **kwargv):
+        self.lineno = lineno
+        self.col_offset = col_offset
+        super(expr, self).__init__(*argv, **kwargv)
+
+
+class BoolOp(expr):
+    __slots__ = ('op', 'values')
+
+    def __init__(self, op, values, *argv, **kwargv):
+        self.op = op
+        self.values = values
+        super(BoolOp, self).__init__(*argv, **kwargv)
+
+
+class BinOp(expr):
+    __slots__ = ('left', 'op', 'right')
+
+    def __init__(self, left, op, right, *argv, **kwargv):
+        self.left = left
+        self.op = op
+        self.right = right
+        super(BinOp, self).__init__(*argv, **kwargv)
+
+
+class UnaryOp(expr):
+    __slots__ = ('op', 'operand')
+
+    def __init__(self, op, operand, *argv, **kwargv):
+        self.op = op
+        self.operand = operand
+        super(UnaryOp, self).__init__(*argv, **kwargv)
+
+
+class Lambda(expr):
+    __slots__ = ('args', 'body')
+
+    def __init__(self, args, body, *argv, **kwargv):
+        self.args = args
+        self.body = body
+        super(Lambda, self).__init__(*argv, **kwargv)
+
+
+class IfExp(expr):
+    __slots__ = ('test', 'body', 'orelse')
+
+    def __init__(self, test, body, orelse, *argv, **kwargv):
+        self.test = test
+        self.body = body
+        self.orelse = orelse
+        super(IfExp, self).__init__(*argv, **kwargv)
+
+
+class Dict(expr):
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, keys, values, *argv, **kwargv):
+        self.keys = keys
+        self.values = values
+        super(Dict, self).__init__(*argv, **kwargv)
+
+
+class Set(expr):
+    __slots__ = ('elts',)
+
+    def __init__(self, elts, *argv, **kwargv):
+        self.elts = elts
+        super(Set, self).__init__(*argv, **kwargv)
+
+
+class ListComp(expr):
+    __slots__ = ('elt', 'generators')
+
+    def __init__(self, elt, generators, *argv, **kwargv):
+        self.elt = elt
+        self.generators = generators
+        super(ListComp, self).__init__(*argv, **kwargv)
+
+
+class SetComp(expr):
+    __slots__ = ('elt', 'generators')
+
+    def __init__(self, elt, generators, *argv, **kwargv):
+        self.elt = elt
+        self.generators = generators
+        super(SetComp, self).__init__(*argv, **kwargv)
+
+
+class DictComp(expr):
+    __slots__ = ('key', 'value', 'generators')
+
+    def __init__(self, key, value, generators, *argv, **kwargv):
+        self.key = key
+        self.value = value
+        self.generators = generators
+        super(DictComp, self).__init__(*argv, **kwargv)
+
+
+class GeneratorExp(expr):
+    __slots__ = ('elt', 'generators')
+
+    def __init__(self, elt, generators, *argv, **kwargv):
+        self.elt = elt
+        self.generators = generators
+        super(GeneratorExp, self).__init__(*argv, **kwargv)
+
+
+class Yield(expr):
+    __slots__ = ('value',)
+
+    def __init__(self, value, *argv, **kwargv):
+        self.value = value
+        super(Yield, self).__init__(*argv, **kwargv)
+
+
+class YieldFrom(expr):
+    __slots__ = ('value',)
+
+    def __init__(self, value, *argv, **kwargv):
+        self.value = value
+        super(YieldFrom, self).__init__(*argv, **kwargv)
+
+
+class Compare(expr):
+    __slots__ = ('left', 'ops', 'comparators')
+
+    def __init__(self, left, ops, comparators, *argv, **kwargv):
+        self.left = left
+        self.ops = ops
+        self.comparators = comparators
+        super(Compare, self).__init__(*argv, **kwargv)
+
+
+class Call(expr):
+    __slots__ = ('func', 'args', 'keywords', 'starargs', 'kwargs')
+
+    def __init__(self, func, args, keywords, starargs, kwargs, *argv, **kwargv):
+        self.func = func
+        self.args = args
+        self.keywords = keywords
+        self.starargs = starargs
+        self.kwargs = kwargs
+        super(Call, self).__init__(*argv, **kwargv)
+
+
+class Num(expr):
+    __slots__ = ('n',)
+
+    def __init__(self, n, *argv, **kwargv):
+        self.n = n
+        super(Num, self).__init__(*argv, **kwargv)
+
+
+class Str(expr):
+    __slots__ = ('s',)
+
+    def __init__(self, s, *argv, **kwargv):
+        self.s = s
+        super(Str, self).__init__(*argv, **kwargv)
+
+
+class Bytes(expr):
+    __slots__ = ('s',)
+
+    def __init__(self, s, *argv, **kwargv):
+        self.s = s
+        super(Bytes, self).__init__(*argv, **kwargv)
+
+
+class Ellipsis(expr):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Ellipsis, self).__init__(*argv, **kwargv)
+
+
+class Attribute(expr):
+    __slots__ = ('value', 'attr', 'ctx')
+
+    def __init__(self, value, attr, ctx, *argv, **kwargv):
+        self.value = value
+        self.attr = attr
+        self.ctx = ctx
+        super(Attribute, self).__init__(*argv, **kwargv)
+
+
+class Subscript(expr):
+    __slots__ = ('value', 'slice', 'ctx')
+
+    def __init__(self, value, slice, ctx, *argv, **kwargv):
+        self.value = value
+        self.slice = slice
+        self.ctx = ctx
+        super(Subscript, self).__init__(*argv, **kwargv)
+
+
+class Starred(expr):
+    __slots__ = ('value', 'ctx')
+
+    def __init__(self, value, ctx, *argv, **kwargv):
+        self.value = value
+        self.ctx = ctx
+        super(Starred, self).__init__(*argv, **kwargv)
+
+
+class Name(expr):
+    __slots__ = ('id', 'ctx')
+
+    def __init__(self, id, ctx, *argv, **kwargv):
+        self.id = id
+        self.ctx = ctx
+        super(Name, self).__init__(*argv, **kwargv)
+
+
+class List(expr):
+    __slots__ = ('elts', 'ctx')
+
+    def __init__(self, elts, ctx, *argv, **kwargv):
+        self.elts = elts
+        self.ctx = ctx
+        super(List, self).__init__(*argv, **kwargv)
+
+
+class Tuple(expr):
+    __slots__ = ('elts', 'ctx')
+
+    def __init__(self, elts, ctx, *argv, **kwargv):
+        self.elts = elts
+        self.ctx = ctx
+        super(Tuple, self).__init__(*argv, **kwargv)
+
+
+class expr_context(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(expr_context, self).__init__(*argv, **kwargv)
+
+
+class Load(expr_context):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Load, self).__init__(*argv, **kwargv)
+
+
+class Store(expr_context):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Store, self).__init__(*argv, **kwargv)
+
+
+class Del(expr_context):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Del, self).__init__(*argv, **kwargv)
+
+
+class AugLoad(expr_context):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(AugLoad, self).__init__(*argv, **kwargv)
+
+
+class AugStore(expr_context):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(AugStore, self).__init__(*argv, **kwargv)
+
+
+class Param(expr_context):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Param, self).__init__(*argv, **kwargv)
+
+
+class slice(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(slice, self).__init__(*argv, **kwargv)
+
+
+class Slice(slice):
+    __slots__ = ('lower', 'upper', 'step')
+
+    def __init__(self, lower, upper, step, *argv, **kwargv):
+        self.lower = lower
+        self.upper = upper
+        self.step = step
+        super(Slice, self).__init__(*argv, **kwargv)
+
+
+class ExtSlice(slice):
+    __slots__ = ('dims',)
+
+    def __init__(self, dims, *argv, **kwargv):
+        self.dims = dims
+        super(ExtSlice, self).__init__(*argv, **kwargv)
+
+
+class Index(slice):
+    __slots__ = ('value',)
+
+    def __init__(self, value, *argv, **kwargv):
+        self.value = value
+        super(Index, self).__init__(*argv, **kwargv)
+
+
+class boolop(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(boolop, self).__init__(*argv, **kwargv)
+
+
+class And(boolop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(And, self).__init__(*argv, **kwargv)
+
+
+class Or(boolop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Or, self).__init__(*argv, **kwargv)
+
+
+class operator(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(operator, self).__init__(*argv, **kwargv)
+
+
+class Add(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Add, self).__init__(*argv, **kwargv)
+
+
+class Sub(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Sub, self).__init__(*argv, **kwargv)
+
+
+class Mult(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Mult, self).__init__(*argv, **kwargv)
+
+
+class Div(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Div, self).__init__(*argv, **kwargv)
+
+
+class Mod(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Mod, self).__init__(*argv, **kwargv)
+
+
+class Pow(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Pow, self).__init__(*argv, **kwargv)
+
+
+class LShift(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(LShift, self).__init__(*argv, **kwargv)
+
+
+class RShift(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(RShift, self).__init__(*argv, **kwargv)
+
+
+class BitOr(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(BitOr, self).__init__(*argv, **kwargv)
+
+
+class BitXor(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(BitXor, self).__init__(*argv, **kwargv)
+
+
+class BitAnd(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(BitAnd, self).__init__(*argv, **kwargv)
+
+
+class FloorDiv(operator):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(FloorDiv, self).__init__(*argv, **kwargv)
+
+
+class unaryop(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(unaryop, self).__init__(*argv, **kwargv)
+
+
+class Invert(unaryop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Invert, self).__init__(*argv, **kwargv)
+
+
+class Not(unaryop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Not, self).__init__(*argv, **kwargv)
+
+
+class UAdd(unaryop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(UAdd, self).__init__(*argv, **kwargv)
+
+
+class USub(unaryop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(USub, self).__init__(*argv, **kwargv)
+
+
+class cmpop(ASTNode):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(cmpop, self).__init__(*argv, **kwargv)
+
+
+class Eq(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Eq, self).__init__(*argv, **kwargv)
+
+
+class NotEq(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(NotEq, self).__init__(*argv, **kwargv)
+
+
+class Lt(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Lt, self).__init__(*argv, **kwargv)
+
+
+class LtE(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(LtE, self).__init__(*argv, **kwargv)
+
+
+class Gt(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Gt, self).__init__(*argv, **kwargv)
+
+
+class GtE(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(GtE, self).__init__(*argv, **kwargv)
+
+
+class Is(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(Is, self).__init__(*argv, **kwargv)
+
+
+class IsNot(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(IsNot, self).__init__(*argv, **kwargv)
+
+
+class In(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(In, self).__init__(*argv, **kwargv)
+
+
+class NotIn(cmpop):
+    __slots__ = ()
+
+    def __init__(self, *argv, **kwargv):
+        super(NotIn, self).__init__(*argv, **kwargv)
+
+
+class comprehension(ASTNode):
+    __slots__ = ('target', 'iter', 'ifs')
+
+    def __init__(self, target, iter, ifs, *argv, **kwargv):
+        self.target = target
+        self.iter = iter
+        self.ifs = ifs
+        super(comprehension, self).__init__(*argv, **kwargv)
+
+
+class excepthandler(ASTNode):
+    __slots__ = ('lineno', 'col_offset')
+
+    def __init__(self, lineno, col_offset, *argv, **kwargv):
+        self.lineno = lineno
+        self.col_offset = col_offset
+        super(excepthandler, self).__init__(*argv, **kwargv)
+
+
+class ExceptHandler(excepthandler):
+    __slots__ = ('type', 'name', 'body')
+
+    def __init__(self, type, name, body, *argv, **kwargv):
+        self.type = type
+        self.name = name
+        self.body = body
+        super(ExceptHandler, self).__init__(*argv, **kwargv)
+
+
+class arguments(ASTNode):
+    __slots__ = ('args', 'vararg', 'varargannotation', 'kwonlyargs', 'kwarg', 'kwargannotation', 'defaults', 'kw_defaults')
+
+    def __init__(self, args, vararg, varargannotation, kwonlyargs, kwarg, kwargannotation, defaults, kw_defaults, *argv, **kwargv):
+        self.args = args
+        self.vararg = vararg
+        self.varargannotation = varargannotation
+        self.kwonlyargs = kwonlyargs
+        self.kwarg = kwarg
+        self.kwargannotation = kwargannotation
+        self.defaults = defaults
+        self.kw_defaults = kw_defaults
+        super(arguments, self).__init__(*argv, **kwargv)
+
+
+class arg(ASTNode):
+    __slots__ = ('arg', 'annotation')
+
+    def __init__(self, _arg, annotation, *argv, **kwargv):
+        self.arg = _arg
+        self.annotation = annotation
+        super(arg, self).__init__(*argv, **kwargv)
+
+
+class keyword(ASTNode):
+    __slots__ = ('arg', 'value')
+
+    def __init__(self, arg, value, *argv, **kwargv):
+        self.arg = arg
+        self.value = value
+        super(keyword, self).__init__(*argv, **kwargv)
+
+
+class alias(ASTNode):
+    __slots__ = ('name', 'asname')
+
+    def __init__(self, name, asname, *argv, **kwargv):
+        self.name = name
+        self.asname = asname
+        super(alias, self).__init__(*argv, **kwargv)
+
+
+class withitem(ASTNode):
+    __slots__ = ('context_expr', 'optional_vars')
+
+    def __init__(self, context_expr, optional_vars, *argv, **kwargv):
+        self.context_expr = context_expr
+        self.optional_vars = optional_vars
+        super(withitem, self).__init__(*argv, **kwargv)
+
+
+AssignTypes = (Attribute, Subscript, Starred, Name, List, Tuple)
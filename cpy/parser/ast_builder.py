@@ -1,6 +1,12 @@
 from . import ast
-from .pystates import symbols as syms
+from .pytables import symbols as syms
+from .pygrammar import grammar
 from .grammar.sourcefile import SourceFile
+from .grammar.outline import SKIPPED, parse_body
+from .grammar.incremental import ShiftedNode
+from .grammar.parse_tree import Node
+from .grammar.arraytree import ArrayTree
+from .grammar.budget import DepthLimitExceeded
 import token
 import six
 import re
@@ -64,15 +70,107 @@ compare_map = {
 
 xdigits = re.compile(r'^[0-9a-z]{2}$', re.IGNORECASE)
 
+# the rules of binary operators, all built by handle_expr
+binary_exprs = frozenset(syms[name] for name in ('expr', 'xor_expr',
+    'and_expr', 'shift_expr', 'arith_expr', 'term'))
+
+
+def renumbered(root, symbols):
+    '''`root` with its rules numbered as in the Python grammar, for a
+    tree of a subset grammar, which numbers its `symbols` from scratch
+
+    The nodes of renumbered rules are copied, the others kept.
+    '''
+    ids = {}
+    for name, sym in symbols.items():
+        try:
+            full = syms[name]
+        except KeyError:
+            raise ASTError('unknown symbol: %s' % name)
+        if full != sym:
+            ids[sym] = full
+    if not ids:
+        return root
+
+    def copy(node):
+        new = Node(ids.get(node.type, node.type), node.val, node.start,
+            node.end)
+        new.subs = list(node.subs)
+        return new
+    root = copy(root)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        subs = node.subs
+        for i, sub in enumerate(subs):
+            if sub.subs or sub.type in ids:
+                subs[i] = copy(sub)
+                stack.append(subs[i])
+    return root
+
+
+class OutlineBody(ast.Pass):
+    '''placeholder for the statements of a body skipped by an outline
+    parse; `node` is the outline.SKIPPED node, see ASTBuilder.expand'''
+    __slots__ = ('node',)
+
+    def __init__(self, node, *argv, **kwargv):
+        self.node = node
+        super(OutlineBody, self).__init__(*argv, **kwargv)
+
+    def moved(self, rows):
+        return OutlineBody(ShiftedNode(self.node, rows), self.lineno + rows,
+            self.col_offset)
+
 
 @six.add_metaclass(ASTMeta)
 class ASTBuilder(object):
-    def __init__(self, src):
+    '''build the ast of a parsed SourceFile
+
+    With `recover` a statement with a syntax error is left out of the ast
+    and the error is added to `errors`, which starts with the errors of a
+    Grammar.parse(recover=True); the ERRORTOKEN nodes of such a parse are
+    skipped. `ast` is None when no partial ast can be built.
+
+    With a budget.Budget the depth and size of the parse tree are checked
+    before building, and the deadline before every statement; a tree too
+    deep to build recursively raises budget.DepthLimitExceeded too.
+
+    The tree of a subset grammar is renumbered() before building.
+    '''
+    def __init__(self, src, reuse=None, recover=False, budget=None):
         if not isinstance(src, SourceFile):
             raise Exception('invalid sourcefile')
         self.src = src
-        self.root = src.parse_tree.root
-        self.ast = self.build()
+        tree = src.parse_tree
+        self.root = tree.root
+        if tree.symbols is not syms:
+            self.root = renumbered(tree.root, tree.symbols)
+        # id(stmt Node) -> (stmt Node, lineno, ast stmts) of top level stmts,
+        # left empty for an ArrayTree: its handles go stale with the tree
+        self.stmt_asts = {}
+        self.keep_stmts = not isinstance(tree, ArrayTree)
+        self.reuse = reuse is not None and reuse.stmt_asts or {}
+        self.recover = recover
+        self.errors = list(src.errors)
+        self.budget = budget
+        if budget is not None:
+            budget.check_tree(self.root)
+        try:
+            if recover and self.root != syms.file_input:
+                try:
+                    self.ast = self.build()
+                except (SyntaxError, ASTError) as e:
+                    if isinstance(e, SyntaxError):
+                        self.errors.append(e)
+                    self.ast = None
+            else:
+                self.ast = self.build()
+        except RecursionError:
+            if budget is None:
+                raise
+            # the tree is deeper than the Python stack, whatever max_depth
+            raise DepthLimitExceeded('nested too deep to build the ast')
 
     def syntax_error(self, msg, node):
         return SyntaxError(msg, (self.src.name, node.start[0], node.start[1],
@@ -80,6 +178,9 @@ class ASTBuilder(object):
 
     def build(self):
         n = self.root
+        if n != syms.file_input and (not n.subs or n[0] == token.ERRORTOKEN):
+            # a recovering parse that failed in its only statement
+            raise ASTError('nothing parsed')
         if n == syms.single_input:
             # single_input: NEWLINE | simple_stmt | compound_stmt NEWLINE
             if n[0] == token.NEWLINE:
@@ -89,13 +190,58 @@ class ASTBuilder(object):
             # file_input: (NEWLINE | stmt)* ENDMARKER
             stmts = []
             for stmt in n.filter(syms.stmt):
-                stmts.extend(self.handle(stmt[0]))
+                stmts.extend(self.build_stmt(stmt))
             return ast.Module(stmts)
         elif n == syms.eval_input:
             # eval_input: testlist NEWLINE* ENDMARKER
             return ast.Expression(self.handle_testlist(n[0]))
         raise ASTError('invalid root node')
 
+    def build_stmt(self, stmt):
+        # stmts moved over by Grammar.reparse keep the ast built last time,
+        # or a moved() copy of it when their lines moved
+        lineno = stmt.start[0]
+        node = stmt
+        if isinstance(node, ShiftedNode):
+            node = node.node
+        cached = self.reuse.get(id(node), None)
+        if cached is not None and cached[0] is node:
+            body = cached[2]
+            if lineno != cached[1]:
+                rows = lineno - cached[1]
+                body = [n.moved(rows) for n in body]
+        else:
+            nerrors = len(self.errors)
+            body = self.build_stmt_or_error(stmt)
+            if len(self.errors) != nerrors:
+                return body
+        if self.keep_stmts:
+            self.stmt_asts[id(node)] = (node, lineno, body)
+        return body
+
+    def build_stmt_or_error(self, stmt):
+        if stmt == token.ERRORTOKEN:
+            return []
+        if stmt == SKIPPED:
+            return [OutlineBody(stmt, *stmt.start)]
+        if self.budget is not None:
+            self.budget.check_deadline()
+        if not self.recover:
+            return self.handle(stmt[0])
+        try:
+            return self.handle(stmt[0])
+        except SyntaxError as e:
+            self.errors.append(e)
+            return []
+
+    def expand(self, body):
+        '''parse and build the statements an OutlineBody stands for'''
+        stmts = []
+        for stmt in parse_body(grammar, self.src, body.node):
+            if stmt == syms.stmt:
+                stmts.extend(self.build_stmt_or_error(stmt))
+        return stmts
+
     def handle(self, node):
         handler = self.handlers.get(node.type, None)
         if handler is None:
@@ -127,12 +273,16 @@ class ASTBuilder(object):
         if len(testlist) == 1:
             return self.handle_test(testlist[0])
         exprs = []
-        for test in testlist.filter(syms.test):
+        for test in testlist.subs[::2]:
             exprs.append(self.handle_test(test))
         return ast.Tuple(exprs, ast.Load, *testlist.start)
 
     def handle_test(self, test):
         # test: or_test ['if' or_test 'else' test] | lambdef
+        if test != syms.test:
+            # the rules of parse_tree.CHAIN with one child are left out of
+            # a collapsed tree: hand the node down to its own handler
+            return self.handle(test)
         if len(test) == 1:
             if test[0] == syms.lambdef:
                 return self.handle_lambdef(test[0])
@@ -144,28 +294,38 @@ class ASTBuilder(object):
 
     def handle_or_test(self, or_test):
         # or_test: and_test ('or' and_test)*
+        if or_test != syms.or_test:
+            return self.handle(or_test)
         if len(or_test) == 1:
             return self.handle_and_test(or_test[0])
         return ast.BoolOp(ast.Or,
-            [self.handle_and_test(x) for x in or_test.filter(syms.and_test)],
+            [self.handle_and_test(x) for x in or_test.subs[::2]],
             *or_test.start)
 
     def handle_and_test(self, and_test):
         #and_test: not_test ('and' not_test)*
+        if and_test != syms.and_test:
+            return self.handle(and_test)
         if len(and_test) == 1:
             return self.handle_not_test(and_test[0])
         return ast.BoolOp(ast.And,
-            [self.handle_not_test(x) for x in and_test.filter(syms.not_test)],
+            [self.handle_not_test(x) for x in and_test.subs[::2]],
             *and_test.start)
 
     def handle_not_test(self, node):
         # not_test: 'not' not_test | comparison
+        if node != syms.not_test:
+            return self.handle(node)
         if len(node) == 2:
             return ast.UnaryOp(
                 ast.Not, self.handle_not_test(node[1]), *node.start)
+        return self.handle_comparison(node[0])
+
+    def handle_comparison(self, node):
         # comparison: expr (comp_op expr)*
         # comp_op: '<'|'>'|'=='|'>='|'<='|'<>'|'!='|'in'|'not' 'in'|'is'|'is' 'not'
-        node = node[0]
+        if node != syms.comparison:
+            return self.handle(node)
         expr = self.handle_expr(node[0])
         if len(node) == 1:
             return expr
@@ -176,6 +336,8 @@ class ASTBuilder(object):
                 op = node[i][0].val
             else:
                 op = '%s %s' % (node[i][0].val, node[i][1].val)
+            if op not in compare_map:
+                raise self.syntax_error('invalid comparison', node[i])
             operators.append(compare_map[op])
             operands.append(self.handle_expr(node[i + 1]))
         return ast.Compare(expr, operators, operands, *node.start)
@@ -263,8 +425,8 @@ class ASTBuilder(object):
         # shift_expr: arith_expr (('<<'|'>>') arith_expr)*
         # arith_expr: term (('+'|'-') term)*
         # term: factor (('*'|'/'|'%'|'//') factor)*
-        if node == syms.factor:
-            return self.handle_factor(node)
+        if node.type not in binary_exprs:
+            return self.handle(node)
         if len(node) == 1:
             return self.handle_expr(node[0])
         binop = ast.BinOp(
@@ -276,9 +438,13 @@ class ASTBuilder(object):
             binop = ast.BinOp(binop, operator_map[node[i].val],
                 self.handle_expr(node[i + 1]), *node.start)
         return binop
+    handle_xor_expr = handle_and_expr = handle_shift_expr = handle_expr
+    handle_arith_expr = handle_term = handle_expr
 
     def handle_factor(self, node):
         # factor: ('+'|'-'|'~') factor | power
+        if node != syms.factor:
+            return self.handle(node)
         if len(node) == 1:
             return self.handle_power(node[0])
         uop = node[0].val
@@ -299,7 +465,7 @@ class ASTBuilder(object):
             if n != syms.trailer:
                 break
             atom = self.get_trailer(n, atom)
-        if node[-1] == syms.factor:
+        if node[-2].val == '**':
             return ast.BinOp(
                 atom, ast.Pow, self.handle_factor(node[-1]), *node.start)
         return atom
@@ -333,23 +499,22 @@ class ASTBuilder(object):
         # subscript: test | [test] ':' [test] [sliceop]
         # sliceop: ':' [test]
         if len(node) == 1:
-            if node[0] == syms.test:
+            if node[0] != token.OP:
                 return ast.Index(self.handle_test(node[0]))
             return ast.Slice(None, None, None)
-        if node[0] == syms.test:
+        if node[0] != token.OP:
             lower = self.handle_test(node[0])
             next = 2
         else:
             lower, next = None, 1
-        if next < len(node):
+        upper = step = None
+        if next < len(node) and node[next] != syms.sliceop:
             upper, next = self.handle_test(node[next]), next + 1
-            step = None
-            if next < len(node):
-                sliceop = node[next]
-                if len(sliceop) == 2:
-                    step = self.handle_test(sliceop[1])
-            return ast.Slice(lower, upper, step)
-        return ast.Slice(lower, None, None)
+        if next < len(node):
+            sliceop = node[next]
+            if len(sliceop) == 2:
+                step = self.handle_test(sliceop[1])
+        return ast.Slice(lower, upper, step)
 
     def get_arglist(self, node):
         # arglist: (argument ',')* (argument [',']
@@ -393,7 +558,7 @@ class ASTBuilder(object):
             k = self.handle_test(node[0])
             if not isinstance(k, ast.Name):
                 raise self.syntax_error(
-                    'keyword must be a NAME', *node[0].start)
+                    'keyword must be a NAME', node[0])
             v = self.handle_test(node[2])
             return ast.keyword(k.id, v)
         return ast.GeneratorExp(self.handle_test(node[0]),
@@ -424,7 +589,7 @@ class ASTBuilder(object):
     def get_comp_if(self, node):
         # comp_if: 'if' test_nocond [comp_iter]
         # comp_iter: comp_for | comp_if
-        comp = self.test_nocond(node[1])
+        comp = self.handle_test_nocond(node[1])
         if len(node) == 3:
             if node[2][0] == syms.comp_if:
                 subs = self.get_comp_if(node[2][0])
@@ -436,11 +601,11 @@ class ASTBuilder(object):
     def handle_exprlist(self, node):
         # exprlist: (expr|star_expr) (',' (expr|star_expr))* [',']
         exprs = []
-        for n in node.subs:
-            if n == syms.expr:
-                exprs.append(self.handle_expr(n))
-            elif n == syms.star_expr:
+        for n in node.subs[::2]:
+            if n == syms.star_expr:
                 exprs.append(self.handle_star_expr(n))
+            else:
+                exprs.append(self.handle_expr(n))
         if len(exprs) == 1 and node[-1] != token.OP:
             return exprs[0]
         return ast.Tuple(exprs, ast.Store, *node.start)
@@ -448,7 +613,7 @@ class ASTBuilder(object):
     def handle_test_nocond(self, node):
         # test_nocond: or_test | lambdef_nocond
         # lambdef_nocond: 'lambda' [varargslist] ':' test_nocond
-        if node[0] == syms.or_test:
+        if node[0] != syms.lambdef_nocond:
             return self.handle_or_test(node[0])
         node = node[0]
         if len(node) == 3:
@@ -501,8 +666,8 @@ class ASTBuilder(object):
                     'cannot mix bytes and nonbytes literals', node)
             strs.append(s)
         if t is ast.Str:
-            return ast.Str(''.join(strs), *node.start)
-        return ast.Bytes(b''.join(strs), *node.start)
+            return ast.Str(''.join(s.s for s in strs), *node.start)
+        return ast.Bytes(b''.join(s.s for s in strs), *node.start)
 
     def parse_string(self, node):
         is_str, is_re = True, False
@@ -524,10 +689,13 @@ class ASTBuilder(object):
                     s = s[pos + 1:-1]
                 break
             pos += 1
+        if not is_str and not s.isascii():
+            raise self.syntax_error(
+                'bytes can only contain ASCII literal characters', node)
         if is_re:
             if is_str:
                 return ast.Str(s, *node.start)
-            return ast.Bytes(s, *node.start)
+            return ast.Bytes(s.encode('ascii'), *node.start)
         chars = []
         pos = 0
         while pos < len(s):
@@ -535,7 +703,7 @@ class ASTBuilder(object):
             if c == '\\':
                 if pos == len(s) - 1:
                     raise self.syntax_error(
-                        'EOL while scanning string literal', *node.end)
+                        'EOL while scanning string literal', node)
                 pos += 1
                 next = s[pos]
                 if next == "'":
@@ -579,7 +747,7 @@ class ASTBuilder(object):
                     v = '\\' if is_str else ord('\\')
                 chars.append(v)
             else:
-                chars.append(c)
+                chars.append(c if is_str else ord(c))
             pos += 1
 
         if is_str:
@@ -599,10 +767,10 @@ class ASTBuilder(object):
 
     def get_testlist_comp(self, outter, node):
         # testlist_comp: (test|star_expr) ( comp_for | (',' (test|star_expr))* [','] )
-        if node[0] == syms.test:
-            expr = self.handle_test(node[0])
-        else:
+        if node[0] == syms.star_expr:
             expr = self.handle_star_expr(node[0])
+        else:
+            expr = self.handle_test(node[0])
         if len(node) == 1:
             # (test|star_expr)
             if outter == '(':
@@ -616,10 +784,10 @@ class ASTBuilder(object):
         i = 2
         elts = [expr]
         while i < len(node):
-            if node[i] == syms.test:
-                elts.append(self.handle_test(node[i]))
-            else:
+            if node[i] == syms.star_expr:
                 elts.append(self.handle_star_expr(node[i]))
+            else:
+                elts.append(self.handle_test(node[i]))
             i += 2
         if outter == '(':
             return ast.Tuple(elts, ast.Load, *node.start)
@@ -706,11 +874,11 @@ class ASTBuilder(object):
     def handle_testlist_star_expr(self, node):
         # testlist_star_expr: (test|star_expr) (',' (test|star_expr))* [',']
         exprs = []
-        for n in node.subs:
-            if n == syms.test:
-                exprs.append(self.handle_test(n))
-            elif n == syms.star_expr:
+        for n in node.subs[::2]:
+            if n == syms.star_expr:
                 exprs.append(self.handle_star_expr(n))
+            else:
+                exprs.append(self.handle_test(n))
         if len(exprs) == 1 and  node[-1] != token.OP:
             return exprs[0]
         return ast.Tuple(exprs, ast.Store, *node.start)
@@ -811,11 +979,13 @@ class ASTBuilder(object):
 
     def handle_global_stmt(self, node):
         # global_stmt: 'global' NAME (',' NAME)*
-        return ast.Global(list(node.filter(token.NAME)), *node.start)
+        return ast.Global([n.val for n in node.subs[1::2]],
+            *node.start)
 
     def handle_nonlocal_stmt(self, node):
         # nonlocal_stmt: 'nonlocal' NAME (',' NAME)*
-        return ast.Nonlocal(list(node.filter(token.NAME)), *node.start)
+        return ast.Nonlocal([n.val for n in node.subs[1::2]],
+            *node.start)
 
     def handle_assert_stmt(self, node):
         # assert_stmt: 'assert' test [',' test]
@@ -835,7 +1005,7 @@ class ASTBuilder(object):
             return ast.Suite(stmts)
         stmts = []
         for i in range(2, len(node) - 1):
-            stmts.extend(self.handle_stmt(node[i]))
+            stmts.extend(self.build_stmt_or_error(node[i]))
         if get_stmts:
             return stmts
         return ast.Suite(stmts)
@@ -0,0 +1,87 @@
+'''parser benchmarks
+
+    python -m cpy.parser.bench [file.py ...]
+'''
+import os
+import subprocess
+import sys
+import time
+from .grammar.sourcefile import SourceFile
+from .grammar.profile import Profile
+from .pygrammar import grammar
+
+
+def load_sources(paths):
+    sources = []
+    for path in paths:
+        src = open(path, 'rb').read()
+        try:
+            grammar.parse(src)
+        except SyntaxError:
+            continue
+        sources.append(src)
+    return sources
+
+
+def timeit(func, sources, repeat=3):
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        for src in sources:
+            func(src)
+        t = time.time() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+
+def bench_import(sources):
+    '''import of the parser in a new interpreter'''
+    code = ('import time; t = time.time(); import cpy.parser.pygrammar; '
+        'print(time.time() - t)')
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    return min(float(subprocess.check_output([sys.executable, '-c', code],
+        cwd=root)) for i in range(3))
+
+
+def bench_tokenize(sources):
+    def tokenize(src):
+        for tk in SourceFile(src=src).tokens():
+            pass
+    return timeit(tokenize, sources)
+
+
+def bench_tables(sources):
+    return timeit(grammar.parse, sources)
+
+
+def bench_compiled(sources):
+    return timeit(grammar.compile().parse, sources)
+
+
+def bench_profiled(sources):
+    profile = Profile.collect(grammar, sources)
+    return timeit(grammar.compile(profile=profile).parse, sources)
+
+
+benchmarks = [
+    ('import', bench_import),
+    ('tokenize', bench_tokenize),
+    ('tables', bench_tables),
+    ('compiled', bench_compiled),
+    ('profiled', bench_profiled),
+]
+
+
+def main(argv):
+    if not argv:
+        argv = [__file__.replace('bench.py', 'ast_builder.py')]
+    sources = load_sources(argv)
+    print('%d files' % len(sources))
+    for name, bench in benchmarks:
+        print('%-12s %8.3fs' % (name, bench(sources)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,315 @@
+'''parse tree kept in parallel arrays instead of one object per node'''
+from array import array
+from bisect import bisect_right
+import marshal
+from .prescan import line_starts
+
+
+class StaleNodeError(ReferenceError):
+    '''an ArrayNode used after the parse it is of was released'''
+
+
+class ArenaBusyError(Exception):
+    '''an Arena asked to parse while the tree of its last parse is held'''
+
+
+_arrays = ('types', 'values', 'firsts', 'nexts', 'parents', 'starts', 'ends',
+    'lines')
+
+
+class ArrayNode(object):
+    '''handle on the node `index` of an ArrayTree, made when reached
+
+    It reads like a parse_tree.Node: `type`, `val`, `start`, `end` and
+    `subs` come from the arrays of the tree as they are read, the list of
+    the children made on first use. A handle is only good for the parse
+    it was made in: once the tree is reset reading from it raises
+    StaleNodeError.
+    '''
+    __slots__ = 'tree', 'index', 'generation', '_subs'
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+        self.generation = tree.generation
+        self._subs = None
+
+    def live(self):
+        '''the tree, if the node is still of its current parse'''
+        if self.generation != self.tree.generation:
+            raise StaleNodeError('node of a released parse')
+        return self.tree
+
+    @property
+    def type(self):
+        return self.live().types[self.index]
+
+    @property
+    def val(self):
+        tree = self.live()
+        return tree.strings[tree.values[self.index]]
+
+    def children(self):
+        tree = self.live()
+        nexts = tree.nexts
+        subs = self._subs = []
+        append = subs.append
+        child = tree.firsts[self.index]
+        while child >= 0:
+            append(ArrayNode(tree, child))
+            child = nexts[child]
+        return subs
+
+    @property
+    def subs(self):
+        subs = self._subs
+        if subs is None or self.generation != self.tree.generation:
+            return self.children()
+        return subs
+
+    @property
+    def start(self):
+        tree = self.live()
+        return tree.position(tree.starts[self.index])
+
+    @property
+    def end(self):
+        tree = self.live()
+        end = tree.ends[self.index]
+        if end < 0 or end == tree.starts[self.index]:
+            return tree.position(end)
+        row, col = tree.position(end - 1)
+        return row, col + 1
+
+    @property
+    def parent(self):
+        parent = self.live().parents[self.index]
+        return parent >= 0 and ArrayNode(self.tree, parent) or None
+
+    def filter(self, type, **kwargv):
+        if 'val' in kwargv:
+            val = kwargv['val']
+            for node in self.subs:
+                if node.type == type and node.val == val:
+                    yield node
+        else:
+            for node in self.subs:
+                if node.type == type:
+                    yield node
+
+    def __eq__(self, type):
+        return self.type == type
+
+    def __ne__(self, type):
+        return self.type != type
+
+    __hash__ = object.__hash__
+
+    def __iter__(self):
+        yield from self.subs
+
+    def __getitem__(self, k):
+        subs = self._subs
+        if subs is None or self.generation != self.tree.generation:
+            subs = self.children()
+        return subs[k]
+
+    def __len__(self):
+        subs = self._subs
+        if subs is None or self.generation != self.tree.generation:
+            subs = self.children()
+        return len(subs)
+
+    def __repr__(self):
+        if self.generation != self.tree.generation:
+            return '<ArrayNode %d of a released parse>' % self.index
+        return '<ArrayNode %d(%r)>' % (self.type, self.val)
+
+
+class ArrayTree(object):
+    '''ParseTree of `text` in parallel arrays, one item per node
+
+    `types`, `values` (indexes in `strings`, the table of the distinct
+    token strings, None first for the rules), `firsts` (first child),
+    `nexts` (next sibling) and `parents` link the nodes, -1 for none;
+    `starts` and `ends` are offsets in the text, -1 for none. The end of
+    a rule is that of its last token. `root` is an ArrayNode.
+
+    The arrays are kept through reset(), which readies the tree for
+    another parse: their items are written over and only grow past the
+    largest tree yet. `generation` counts the resets.
+    '''
+    def __init__(self, symbols, name, text):
+        self.symbols = symbols
+        self.types = array('H')
+        self.values = array('I')
+        self.firsts = array('i')
+        self.nexts = array('i')
+        self.parents = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.generation = 0
+        self.reset(name, text)
+
+    def release(self):
+        '''make the ArrayNodes made so far stale'''
+        self.generation += 1
+
+    def reset(self, name, text):
+        '''start the tree of `text` again, from the rule `name`'''
+        self.release()
+        self.size = 0  # of the nodes in the arrays
+        self.strings = [None]
+        self.index = {None: 0}
+        self.lines = lines = line_starts(text)
+        # the start of the line after the last, maybe after the newline a
+        # text doesn't end with
+        end = len(text) + (bool(text) and text[-1] not in '\r\n')
+        if end > lines[-1]:
+            lines.append(end)
+        self.stack = []  # open rules
+        self.lasts = []  # last child of each open rule
+        self.last = -1  # end of the last token
+        self.add(self.symbols[name], None, -1, -1)
+        self.stack.append(0)
+        self.lasts.append(-1)
+        self.root = ArrayNode(self, 0)
+
+    def offset(self, pos):
+        row, col = pos
+        lines = self.lines
+        if row > len(lines):
+            return lines[-1]
+        return lines[row - 1] + col
+
+    def position(self, offset):
+        '''(row, col) of a start `offset`, None for -1'''
+        if offset < 0:
+            return None
+        row = bisect_right(self.lines, offset)
+        return row, offset - self.lines[row - 1]
+
+    def add(self, type, val, start, end):
+        i = self.index.get(val, None)
+        if i is None:
+            i = self.index[val] = len(self.strings)
+            self.strings.append(val)
+        node = self.size
+        self.size = node + 1
+        if node < len(self.types):
+            self.types[node] = type
+            self.values[node] = i
+            self.firsts[node] = self.nexts[node] = -1
+            self.starts[node] = start
+            self.ends[node] = end
+        else:
+            self.types.append(type)
+            self.values.append(i)
+            self.firsts.append(-1)
+            self.nexts.append(-1)
+            self.parents.append(-1)
+            self.starts.append(start)
+            self.ends.append(end)
+        if self.stack:
+            parent = self.stack[-1]
+            if self.lasts[-1] < 0:
+                self.firsts[parent] = node
+            else:
+                self.nexts[self.lasts[-1]] = node
+            self.lasts[-1] = node
+        else:
+            parent = -1
+        self.parents[node] = parent
+        return node
+
+    def __len__(self):
+        return self.size
+
+    def snapshot(self):
+        '''the tree as one marshal string, see from_snapshot'''
+        items = []
+        for name in _arrays:
+            values = getattr(self, name)
+            if name != 'lines':
+                values = values[:self.size]
+            items.append((values.typecode, values.tobytes()))
+        return marshal.dumps(tuple(items) + (self.strings,))
+
+    @classmethod
+    def from_snapshot(cls, symbols, data):
+        '''tree of a snapshot() string, complete like the one it was of'''
+        tree = cls.__new__(cls)
+        tree.symbols = symbols
+        items = marshal.loads(data)
+        for name, (typecode, buf) in zip(_arrays, items):
+            setattr(tree, name, array(typecode, buf))
+        tree.strings = items[-1]
+        tree.index = dict((val, i) for i, val in enumerate(tree.strings))
+        tree.size = len(tree.types)
+        tree.generation = 1
+        tree.stack = []
+        tree.lasts = []
+        tree.last = -1
+        tree.root = ArrayNode(tree, 0)
+        return tree
+
+    # the events of a Parser, see events.EventHandler
+
+    def enter_rule(self, sym, start):
+        node = self.add(sym, None, self.offset(start), -1)
+        self.stack.append(node)
+        self.lasts.append(-1)
+
+    def token(self, type, val, start, end):
+        start = self.offset(start)
+        self.last = start + len(val)
+        self.add(type, val, start, self.last)
+
+    def exit_rule(self, sym):
+        if len(self.stack) > 1:
+            self.ends[self.stack.pop()] = self.last
+            self.lasts.pop()
+        elif self.stack:
+            self.ends[0] = self.last
+
+
+class Arena(object):
+    '''one ArrayTree that the parses of `grammar` fill in turn
+
+    parse() gives the SourceFile the tree as its parse_tree, to keep until
+    release(), or the end of a `with arena:` block. The tree is then
+    taken back for the next parse: its ArrayNodes raise StaleNodeError
+    and parsing again before the release raises ArenaBusyError. Nothing
+    but the arrays of the tree, grown to the largest parse, is kept.
+    '''
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.tree = None
+        self.owner = None  # the SourceFile holding the tree
+
+    def parse(self, src=None, path=None, init=None, budget=None,
+            mmap=False):
+        '''Grammar.parse(arrays=True) into the tree of the arena'''
+        if self.owner is not None:
+            raise ArenaBusyError('the tree of %s is not released'
+                % self.owner.name)
+        if self.tree is None:
+            self.tree = ArrayTree(self.grammar.symbols,
+                init or self.grammar.default_state, '')
+        src = self.grammar.parse(src, path, init, budget=budget, mmap=mmap,
+            arrays=self.tree)
+        self.owner = src
+        return src
+
+    def release(self):
+        '''take the tree back from the last parse'''
+        if self.owner is not None:
+            self.owner.parse_tree = None
+            self.owner = None
+            self.tree.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.release()
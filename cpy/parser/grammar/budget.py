@@ -0,0 +1,97 @@
+'''limits on the work done for one parse of untrusted input'''
+import time
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class TokenLimitExceeded(BudgetExceeded):
+    pass
+
+
+class DepthLimitExceeded(BudgetExceeded):
+    pass
+
+
+class NodeLimitExceeded(BudgetExceeded):
+    pass
+
+
+class DeadlineExceeded(BudgetExceeded):
+    pass
+
+
+class Budget(object):
+    '''Limits for a Grammar.parse and the ASTBuilder run on its result.
+
+    `max_depth` bounds the nesting of the parse tree, which is also the
+    state stack of the parser and the recursion of ASTBuilder; a tree
+    deeper than the Python stack allows raises DepthLimitExceeded in
+    ASTBuilder whatever the limit. Nodes are the tokens and the rule
+    nodes of the parse tree. The deadline is `timeout` seconds after the
+    budget was created and is checked every `interval` tokens or nodes. A
+    budget keeps its counts, so use a new one for each input.
+    '''
+    def __init__(self, max_tokens=None, max_depth=None, max_nodes=None,
+            timeout=None, interval=256):
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.deadline = None
+        if timeout is not None:
+            self.deadline = time.monotonic() + timeout
+        self.interval = interval
+        self.tokens = 0
+        self.nodes = 0
+
+    def check_deadline(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineExceeded('parse took too long')
+
+    def count_tokens(self, tokens):
+        '''iterate `tokens`, counting them against the budget'''
+        max_tokens = self.max_tokens
+        interval = self.interval
+        for tk in tokens:
+            self.tokens += 1
+            self.nodes += 1
+            if max_tokens is not None and self.tokens > max_tokens:
+                raise TokenLimitExceeded(
+                    'more than %d tokens' % max_tokens)
+            if self.tokens % interval == 0:
+                self.check_nodes()
+                self.check_deadline()
+            yield tk
+
+    def push(self, depth, nodes):
+        '''`nodes` rule nodes were opened, nesting the tree `depth` deep'''
+        self.nodes += nodes
+        if self.max_depth is not None and depth > self.max_depth:
+            raise DepthLimitExceeded('nested more than %d deep'
+                % self.max_depth)
+        self.check_nodes()
+
+    def check_nodes(self):
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise NodeLimitExceeded('more than %d nodes' % self.max_nodes)
+
+    def check_tree(self, root):
+        '''check a whole parse tree without recursion'''
+        interval = self.interval
+        max_depth = self.max_depth
+        max_nodes = self.max_nodes
+        stack = [(root, 1)]
+        count = 0
+        while stack:
+            node, depth = stack.pop()
+            count += 1
+            if node.subs and max_depth is not None and depth > max_depth:
+                raise DepthLimitExceeded('nested more than %d deep'
+                    % max_depth)
+            if max_nodes is not None and count > max_nodes:
+                raise NodeLimitExceeded('more than %d nodes' % max_nodes)
+            if count % interval == 0:
+                self.check_deadline()
+            depth += 1
+            stack.extend((sub, depth) for sub in node.subs)
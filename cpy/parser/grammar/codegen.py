@@ -0,0 +1,262 @@
+'''generate a recursive descent parser module from Tables'''
+from tokenize import ENDMARKER
+import os
+import tempfile
+import six
+from .parse_tree import Node, ParseTree
+from .sourcefile import SourceFile
+from .tables import ERROR, POP
+
+
+_modules = {}  # (tables digest, profile digest) -> generated namespace
+
+
+class RuleGenerator(object):
+    '''emit one function per rule
+
+    The function gets the node of the rule and the current token with its
+    label, consumes the tokens of the rule and returns the next token and
+    label. The DFA state of the rule lives in the local variable `s`; sub
+    rules are plain calls, so there is no explicit state stack.
+    '''
+    def __init__(self, tables, names, indent='    '):
+        self.tables = tables
+        self.names = names  # symbol -> rule name
+        self.indent = indent
+
+    def rule_states(self, sym):
+        return [i for i, s in enumerate(self.tables.state_symbols)
+            if s == sym]
+
+    def branches(self, state):
+        tables = self.tables
+        row = state * tables.nlabels
+        groups = {}
+        for label in range(tables.nlabels):
+            action = tables.actions[row + label]
+            if action in (ERROR, POP):
+                continue
+            if action > 0:
+                key = (None, action - 1)
+            else:
+                nxt, syms, subs = tables.chains[-action - 2]
+                key = (syms[0], nxt)
+            groups.setdefault(key, []).append(label)
+        return [(key, labels) for key, labels in groups.items()]
+
+    def order_states(self, states):
+        return states
+
+    def order(self, state, branches):
+        return sorted(branches, key=lambda b: b[1][0])
+
+    def condition(self, labels):
+        if len(labels) == 1:
+            return 'lb == %d' % labels[0]
+        return 'lb in {%s}' % ', '.join(str(l) for l in labels)
+
+    def consume(self, sub, ind):
+        if sub is None:
+            yield '%ssubs.append(Node(tk[0], tk[1], tk[2], tk[3]))\n' % ind
+            yield '%stk, lb = advance()\n' % ind
+        else:
+            yield '%ssub = Node(%d, None, tk[2])\n' % (ind, sub)
+            yield '%ssubs.append(sub)\n' % ind
+            yield '%stk, lb = r_%s(sub, tk, lb)\n' % (ind, self.names[sub])
+
+    def goto(self, state, nxt, ind):
+        yield '%ss = %d\n' % (ind, nxt)
+
+    def generate(self, sym, ind):
+        tables = self.tables
+        states = self.rule_states(sym)
+        yield '%sdef r_%s(node, tk, lb):\n' % (ind, self.names[sym])
+        ind2 = ind + self.indent
+        ind3 = ind2 + self.indent
+        ind4 = ind3 + self.indent
+        ind5 = ind4 + self.indent
+        yield '%ssubs = node.subs\n' % ind2
+        yield '%ss = %d\n' % (ind2, states[0])
+        yield '%swhile True:\n' % ind2
+        for i, state in enumerate(self.order_states(states)):
+            yield '%s%s s == %d:\n' % (ind3, i and 'elif' or 'if', state)
+            branches = self.order(state, self.branches(state))
+            for j, ((sub, nxt), labels) in enumerate(branches):
+                yield '%s%s %s:\n' % (
+                    ind4, j and 'elif' or 'if', self.condition(labels))
+                yield from self.consume(sub, ind5)
+                yield from self.goto(state, nxt, ind5)
+            if branches:
+                yield '%selse:\n' % ind4
+                ind = ind5
+            else:
+                ind = ind4
+            if tables.finals[state]:
+                yield '%sreturn tk, lb\n' % ind
+            else:
+                yield '%sraise error(tk, %d)\n' % (ind, state)
+
+    def generate_module(self):
+        buf = six.StringIO()
+        buf.write('# generated by cpy.parser.grammar.codegen\n\n\n')
+        buf.write('def parser(Node, advance, error):\n')
+        syms = sorted(set(self.tables.state_symbols))
+        for sym in syms:
+            buf.write(''.join(self.generate(sym, self.indent)))
+            buf.write('\n')
+        buf.write('%sreturn {\n' % self.indent)
+        for sym in syms:
+            buf.write('%s%r: r_%s,\n' % (
+                self.indent * 2, self.names[sym], self.names[sym]))
+        buf.write('%s}\n' % self.indent)
+        return buf.getvalue()
+
+
+class ProfiledRuleGenerator(RuleGenerator):
+    '''RuleGenerator driven by a Profile
+
+    States and branches are tested hottest first, and after every
+    transition the dominant branch of the target state (a shift, a sub
+    rule call or a return) is inlined, so common token sequences such as
+    NAME '(' or NAME '.' skip the dispatch on `s`.
+    '''
+    def __init__(self, tables, names, profile, indent='    '):
+        super(ProfiledRuleGenerator, self).__init__(tables, names, indent)
+        self.profile = profile
+
+    def order_states(self, states):
+        return sorted(states, key=lambda s: -self.profile.visits(s))
+
+    def order(self, state, branches):
+        branches = super(ProfiledRuleGenerator, self).order(state, branches)
+        return sorted(branches,
+            key=lambda b: -self.profile.count(state, b[1]))
+
+    def hot_branch(self, state):
+        visits = self.profile.visits(state)
+        if not visits:
+            return None
+        branches = self.branches(state)
+        if self.tables.finals[state]:
+            pops = self.profile.pop_labels(state)
+            if pops:
+                branches.append((None, pops))
+        key, labels = max(branches,
+            key=lambda b: self.profile.count(state, b[1]))
+        if self.profile.count(state, labels) * 2 < visits:
+            return None
+        return key, labels
+
+    def goto(self, state, nxt, ind):
+        hot = self.hot_branch(nxt)
+        if hot is None:
+            yield '%ss = %d\n' % (ind, nxt)
+            return
+        key, labels = hot
+        ind2 = ind + self.indent
+        yield '%sif %s:\n' % (ind, self.condition(labels))
+        if key is None:
+            yield '%sreturn tk, lb\n' % ind2
+        else:
+            yield from self.consume(key[0], ind2)
+            yield '%ss = %d\n' % (ind2, key[1])
+        yield '%selse:\n' % ind
+        yield '%ss = %d\n' % (ind2, nxt)
+
+
+def generate_parser(tables, profile=None):
+    names = dict((v, k) for k, v in tables.symbols.items())
+    if profile is None:
+        return RuleGenerator(tables, names).generate_module()
+    return ProfiledRuleGenerator(tables, names, profile).generate_module()
+
+
+def load_parser(tables, cache_dir=None, profile=None):
+    '''generated parser factory for `tables`, cached by digest'''
+    digest = tables.digest()
+    if profile is not None:
+        digest += '_' + profile.profile_digest()
+    ns = _modules.get(digest, None)
+    if ns is not None:
+        return ns['parser']
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, 'parser_%s.py' % digest)
+    if path is not None and os.path.exists(path):
+        with open(path) as f:
+            source = f.read()
+    else:
+        source = generate_parser(tables, profile)
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # a parser exec'd by another process never sees half a file
+            fd, tmp = tempfile.mkstemp(dir=cache_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(source)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+    ns = {}
+    exec(compile(source, path or '<parser %s>' % digest, 'exec'), ns)
+    _modules[digest] = ns
+    return ns['parser']
+
+
+class CompiledParser(object):
+    '''Grammar.parse on a generated parser module
+
+    Input nested too deep for the recursive calls of the module is parsed
+    by the Grammar's table parser instead.
+    '''
+    def __init__(self, grammar, cache_dir=None, profile=None):
+        self.grammar = grammar
+        self.tables = grammar.tables
+        self.factory = load_parser(self.tables, cache_dir, profile)
+
+    def parse(self, src=None, path=None, init=None):
+        src = SourceFile(path=path, src=src)
+        if init is None:
+            init = self.grammar.default_state
+        tables = self.tables
+        types = tables.types
+        values = tables.values
+        tokens = src.tokens()
+        last = [None]
+
+        def advance():
+            tk = next(tokens, None)
+            if tk is None:
+                return None, -1
+            last[0] = tk
+            vals = values.get(tk[0], None)
+            return tk, vals and vals.get(tk[1], None) or types.get(tk[0], 0)
+
+        def error(tk, state):
+            if tk is None:
+                tk = last[0]
+                msg = 'unexpected end'
+            elif tables.accepts_type(state, tk.type):
+                msg = 'invalid grammar1'
+            else:
+                msg = 'invalid grammar0'
+            return SyntaxError(msg,
+                (src.name, tk.start[0], tk.start[1], tk.line))
+
+        rules = self.factory(Node, advance, error)
+        tree = ParseTree(self.grammar.symbols, init)
+        tk, lb = advance()
+        try:
+            tk, lb = rules[init](tree.root, tk, lb)
+        except RecursionError:
+            # nested deeper than the Python stack allows: the table parser
+            # keeps its own stack
+            return self.grammar.parse(src, init=init)
+        if tk is not None and tk.type == ENDMARKER:
+            tk, lb = advance()
+        if tk is not None:
+            raise SyntaxError('too more tokens',
+                (src.name, tk.start[0], tk.start[1], tk.line))
+        src.parse_tree = tree
+        return src
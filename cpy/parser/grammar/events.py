@@ -0,0 +1,61 @@
+'''parse into a stream of events instead of a ParseTree'''
+from itertools import islice
+from .sourcefile import SourceFile
+
+
+ENTER = 'enter'
+TOKEN = 'token'
+EXIT = 'exit'
+
+
+class EventHandler(object):
+    '''receives the events of Grammar.parse(events=...)
+
+    Rules are entered when their first token is seen, so every rule is
+    entered with the start of that token; the root rule is entered with
+    None. Tokens come in source order and every entered rule is exited.
+    '''
+    def enter_rule(self, sym, start):
+        pass
+
+    def token(self, type, val, start, end):
+        pass
+
+    def exit_rule(self, sym):
+        pass
+
+
+class EventQueue(EventHandler):
+    '''collects events as (ENTER, sym, start), (TOKEN, type, val, start,
+    end) and (EXIT, sym) tuples'''
+    def __init__(self):
+        self.events = []
+
+    def enter_rule(self, sym, start):
+        self.events.append((ENTER, sym, start))
+
+    def token(self, type, val, start, end):
+        self.events.append((TOKEN, type, val, start, end))
+
+    def exit_rule(self, sym):
+        self.events.append((EXIT, sym))
+
+
+def iterparse(grammar, src=None, path=None, init=None, chunk=256):
+    '''generate the events of parsing `src`, reading `chunk` tokens ahead'''
+    src = SourceFile(path=path, src=src)
+    queue = EventQueue()
+    parser = grammar.parser(init, src.name, events=queue)
+    tokens = src.tokens()
+    events = queue.events
+    while True:
+        tks = list(islice(tokens, chunk))
+        if not tks:
+            break
+        parser.feed_tokens(tks)
+        for event in events:
+            yield event
+        del events[:]
+    parser.close()
+    for event in events:
+        yield event
@@ -1,69 +1,157 @@
-from .parse_tree import Node, ParseTree
+from tokenize import TokenError
+from collections import OrderedDict
+import hashlib
+import os
+import tempfile
 from .sourcefile import SourceFile
+from .symbols import make_symbols
+from .tables import Tables
+from .codegen import CompiledParser
+from .parser import Parser
+from .parse_tree import ParseTree, LosslessTree, CHAIN
+from .arraytree import ArrayTree
+from .incremental import reparse
+from .events import iterparse
 
 
+_grammars = OrderedDict()  # grammar source key -> Grammar, oldest first
+MAX_GRAMMARS = 16
+
 class Grammar(object):
-    def __init__(self, symbols, states, default_state='file_input'):
+    def __init__(self, symbols, states=None, default_state='file_input',
+            tables=None):
+        if states is None and tables is None:
+            raise Exception('states or tables can\'t be None')
         self.symbols = symbols
         self.states = states
         self.default_state = default_state
+        self._tables = tables
 
-    def parse(self, src=None, path=None, init=None):
-        src = SourceFile(path=path, src=src)
-        tokens = src.tokens()
-        if init is None:
-            init = self.default_state
-        tree = ParseTree(self.symbols, init)
-        stack = [self.states[init]]
+    @classmethod
+    def from_grammar_source(cls, text, start_symbols, allow=None,
+            cache_dir=None):
+        '''Grammar for pgen grammar `text` with the rules reachable from
+        `start_symbols`, see States.subset
 
-        tk = next(tokens)
-        while stack:
-            state = stack[-1]
-            #get arc
-            val_arcs = state.bootstrap.get(tk.type, None)
-            if val_arcs is None:
-                if state.is_final:
-                    stack = stack[:-1]
-                    if stack:
-                        tree.up()
-                    continue
-                print(tk)
-                raise SyntaxError('invalid grammar0',
-                    (src.name, tk.start[0], tk.start[1], tk.line))
-            arc = val_arcs.get(tk.string, None) or val_arcs.get(None, None)
-            if arc is None:
-                if state.is_final:
-                    stack = stack[:-1]
-                    if stack:
-                        tree.up()
-                    continue
-                raise SyntaxError('invalid grammar1',
-                    (src.name, tk.start[0], tk.start[1], tk.line))
-            #process arc
-            stack[-1] = arc[1]
-            if arc[0] is not None:
-                stack.append(arc[0])
-                tree.add_down(Node(arc[0].symbol, None, tk.start))
-            else:
-                tree.add(Node(tk.type, tk.string, tk.start, tk.end))
+        The tables are kept in memory and, with `cache_dir`, in a file
+        named after the sha1 of the text and the arguments, so a grammar
+        is only compiled once per process and once per cache. The process
+        keeps the MAX_GRAMMARS grammars used last.
+        '''
+        start_symbols = list(start_symbols)
+        h = hashlib.sha1(text.encode('utf8'))
+        h.update(repr((start_symbols, allow is not None and sorted(allow)))
+            .encode('utf8'))
+        key = h.hexdigest()
+        grammar = _grammars.get(key, None)
+        if grammar is not None:
+            _grammars.move_to_end(key)
+            return grammar
+        path = None
+        if cache_dir is not None:
+            path = os.path.join(cache_dir, 'grammar_%s.tables' % key)
+        if path is not None and os.path.exists(path):
+            with open(path, 'rb') as f:
+                tables = Tables.load(f)
+        else:
+            from ..pygram_gen.grammar_parser import GrammarParser
+            states = GrammarParser(text).states
+            tables = states.tables(start_symbols, allow, True)
+            if path is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=cache_dir)
                 try:
-                    tk = next(tokens)
-                except StopIteration:
-                    if arc[1].is_final:
-                        stack = stack[:-1]
-                        if stack:
-                            tree.up()
-                        break
-                    raise SyntaxError('unexpected end',
-                        (src.name, tk.start[0], tk.start[1], tk.line))
+                    with os.fdopen(fd, 'wb') as f:
+                        tables.dump(f)
+                    os.replace(tmp, path)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+        grammar = cls(make_symbols(tables.symbols), None, start_symbols[0],
+            tables)
+        _grammars[key] = grammar
+        while len(_grammars) > MAX_GRAMMARS:
+            _grammars.popitem(last=False)
+        return grammar
 
-        #check no more tokens
-        try:
-            tk = next(tokens)
-            raise SyntaxError('too more tokens: %r',
-                (src.name, tk.start[0], tk.start[1], tk.line))
-        except StopIteration:
-            pass
+    @property
+    def tables(self):
+        if self._tables is None:
+            self._tables = Tables.from_states(self.symbols, self.states)
+        return self._tables
+
+    def compile(self, cache_dir=None, profile=None):
+        '''parser generated from the tables, see codegen.CompiledParser'''
+        return CompiledParser(self, cache_dir, profile)
+
+    def parser(self, init=None, name='<string>', profile=None,
+            recover=False, budget=None, events=None, outline=False):
+        '''push parser, see parser.Parser'''
+        return Parser(self, init, name, profile, recover, budget, events,
+            outline)
 
-        src.parse_tree = tree
+    def parse(self, src=None, path=None, init=None, profile=None,
+            recover=False, budget=None, events=None, outline=False,
+            mmap=False, lossless=False, arrays=False, collapse=False):
+        '''parse into src.parse_tree
+
+        With `recover` syntax errors don't stop the parse: they are listed
+        in src.errors and the statements they are in become ERRORTOKEN
+        nodes of the tree. A budget.Budget makes the parse raise a
+        budget.BudgetExceeded as soon as one of its limits is passed.
+        With an events.EventHandler as `events` the parse is reported to
+        it and src.parse_tree stays None. With `outline` the bodies of
+        functions and classes are skipped, see outline.parse_body. With
+        `mmap` the file at `path` is mapped in memory instead of read.
+        `src` can also be a SourceFile, parsed again after its edits.
+        A `lossless` parse builds a parse_tree.LosslessTree, which keeps
+        the comments and whitespace and gives back the source text. With
+        `arrays` the tree is an arraytree.ArrayTree, its nodes kept in
+        parallel arrays; `arrays` can be one to reset and fill, see
+        arraytree.Arena. With `collapse` the rules it names (those of
+        parse_tree.CHAIN if True) are left out where they have one child.
+        '''
+        if not isinstance(src, SourceFile):
+            src = SourceFile(path=path, src=src, mmap=mmap)
+        tree = None
+        name = init or self.default_state
+        if collapse is True:
+            collapse = CHAIN
+        if lossless and arrays:
+            raise ValueError('an ArrayTree is not lossless')
+        if arrays and collapse:
+            raise ValueError('an ArrayTree keeps every node')
+        if lossless:
+            if events is not None or outline:
+                raise ValueError('a lossless parse builds the whole tree')
+            tree = LosslessTree(self.symbols, name, src.text(),
+                collapse or ())
+        elif arrays:
+            if events is not None or outline or recover:
+                raise ValueError('an ArrayTree is built from a whole parse')
+            if arrays is True:
+                tree = ArrayTree(self.symbols, name, src.text())
+            else:
+                tree = arrays
+                tree.reset(name, src.text())
+        elif collapse:
+            if events is not None:
+                raise ValueError('events make no tree to collapse')
+            tree = ParseTree(self.symbols, name, collapse)
+        parser = Parser(self, init, src.name, profile, recover, budget,
+            events, outline, tree)
+        try:
+            parser.feed_tokens(src.tokens(recover))
+        except (TokenError, SyntaxError) as e:
+            parser.abort(e)
+        src.parse_tree = parser.close()
+        src.errors = parser.errors
         return src
+
+    def iterparse(self, src=None, path=None, init=None):
+        '''generate the parse events of `src`, see events.iterparse'''
+        return iterparse(self, src, path, init)
+
+    def reparse(self, src, edits):
+        '''see incremental.reparse'''
+        return reparse(self, src, edits)
@@ -0,0 +1,215 @@
+'''reparse only the top level statements touched by an edit'''
+from tokenize import TokenError, ENDMARKER, INDENT, DEDENT
+from .parse_tree import Node, ParseTree
+from .sourcefile import SourceFile
+
+
+def apply_edits(source, edits):
+    '''apply (start, end, text) edits given as offsets in `source`
+
+    Returns the new source and the envelope (start, end) of the edits in
+    `source` together with the change of length.
+    '''
+    if not edits:
+        raise ValueError('no edits to apply')
+    edits = sorted(edits, key=lambda e: e[0])
+    parts, pos = [], 0
+    for start, end, text in edits:
+        if start < pos or end < start or end > len(source):
+            raise ValueError('invalid edit (%d, %d)' % (start, end))
+        parts.append(source[pos:start])
+        parts.append(text)
+        pos = end
+    parts.append(source[pos:])
+    new = source[:0].join(parts)
+    return new, edits[0][0], edits[-1][1], len(new) - len(source)
+
+
+def line_start(source, nl, offset, line, target):
+    '''offset of the start of line `target`, walking from `offset` which
+    is on line `line`'''
+    pos = source.rfind(nl, 0, offset) + 1
+    while line > target:
+        pos = source.rfind(nl, 0, pos - 1) + 1
+        line -= 1
+    while line < target:
+        nxt = source.find(nl, pos)
+        if nxt < 0:
+            return len(source)
+        pos = nxt + 1
+        line += 1
+    return pos
+
+
+class ShiftedNode(object):
+    '''view of `node` moved down by `rows` lines, read like a Node
+
+    Positions are moved as they are read and the children are wrapped on
+    first use, so moving a statement costs the same however big it is.
+    '''
+    __slots__ = 'node', 'rows', 'type', 'val', '_subs'
+
+    def __init__(self, node, rows):
+        if isinstance(node, ShiftedNode):
+            node, rows = node.node, node.rows + rows
+        self.node = node
+        self.rows = rows
+        self.type = node.type
+        self.val = node.val
+        if isinstance(self.val, tuple):  # the position of a SKIPPED body
+            self.val = (self.val[0] + rows, self.val[1])
+        self._subs = None
+
+    @property
+    def start(self):
+        pos = self.node.start
+        return pos and (pos[0] + self.rows, pos[1])
+
+    @property
+    def end(self):
+        pos = self.node.end
+        return pos and (pos[0] + self.rows, pos[1])
+
+    @property
+    def subs(self):
+        if self._subs is None:
+            subs = self.node.subs
+            rows = self.rows
+            self._subs = subs and [ShiftedNode(n, rows) for n in subs]
+        return self._subs
+
+    filter = Node.filter
+    __eq__ = Node.__eq__
+    __ne__ = Node.__ne__
+    __iter__ = Node.__iter__
+    __getitem__ = Node.__getitem__
+
+    def __len__(self):
+        return len(self.node.subs)
+
+    def __repr__(self):
+        return '<ShiftedNode %d(%r) %+d>' % (self.type, self.val, self.rows)
+
+
+def reparse(grammar, src, edits, retries=2):
+    '''new SourceFile for `src` with `edits` applied
+
+    Only the top level statements of the file_input tree whose lines
+    overlap the edits are tokenized and parsed again; the other nodes are
+    kept, those after the edits as ShiftedNode views when the edits
+    added or removed lines. If the edited region does not parse on its own
+    (an unclosed bracket swallowing the next statement, a changed
+    indentation), it grows by one statement on each side up to
+    `retries` times before falling back to parsing the whole source.
+    With no edits `src` itself is returned.
+    '''
+    symbols = grammar.symbols
+    root = src.parse_tree.root
+    if root.type != symbols['file_input']:
+        raise ValueError('reparse needs a file_input tree')
+    if not edits:
+        return src
+    source = src.source
+    if not isinstance(source, (str, bytes)):
+        source = bytes(source)  # a mapped file is edited as a copy
+    new_source, lo, hi, delta = apply_edits(source, edits)
+    nl = isinstance(source, str) and '\n' or b'\n'
+    first = source.count(nl, 0, lo) + 1
+    last = first + source.count(nl, lo, hi)
+    line_delta = new_source.count(nl, lo, hi + delta) - source.count(
+        nl, lo, hi)
+
+    children = root.subs
+    new = None
+    i = 0
+    while i + 2 < len(children) and children[i + 1].start[0] <= first:
+        i += 1
+    j = i + 1
+    while j < len(children) - 1 and children[j].start[0] <= last:
+        j += 1
+
+    for attempt in range(len(children) > 1 and retries + 1 or 0):
+        start_line = i and children[i].start[0] or 1
+        end_line = children[j].start[0]
+        start = line_start(source, nl, lo, first, start_line)
+        if children[j].type == ENDMARKER:
+            end = len(source)
+        else:
+            end = line_start(source, nl, hi, last, end_line)
+        fragment = new_source[start:end + delta]
+        if not fragment:
+            new = []
+            break
+        if children[j].type == ENDMARKER:
+            end_pos = None
+        else:
+            end_pos = (end_line + line_delta, 0)
+        try:
+            new = parse_fragment(grammar, fragment, start_line - 1, end_pos,
+                src.name)
+            break
+        except (SyntaxError, TokenError):
+            if i == 0 and j == len(children) - 1:
+                break
+            i, j = max(i - 1, 0), min(j + 1, len(children) - 1)
+
+    if new is None:
+        result = grammar.parse(new_source)
+    else:
+        result = SourceFile(src=new_source)
+    result.name = src.name
+    result.path = src.path
+    if new is None:
+        return result
+
+    tail = children[j:]
+    if line_delta:
+        tail = [ShiftedNode(node, line_delta) for node in tail]
+    tree = ParseTree(symbols, 'file_input')
+    tree.root.subs = children[:i] + new + tail
+    result.parse_tree = tree
+    return result
+
+
+def parse_fragment(grammar, fragment, line_offset, end_pos, name,
+        indented=False):
+    '''parse whole top level statements, shifted down by `line_offset`
+
+    The DEDENTs closing the last statement are put at `end_pos`, the first
+    token after the fragment, where a tokenizer running over the whole
+    source would put them. An `indented` fragment is the body of a block:
+    the INDENT before it and the DEDENT after it are dropped.
+    '''
+    parser = grammar.parser('file_input', name)
+
+    def tokens():
+        tks = SourceFile(src=fragment).tokens()
+        dedent = indented
+        if indented:
+            tk = next(tks)
+            if tk.type != INDENT:
+                raise SyntaxError('expected an indented block',
+                    (name, line_offset + 1, 0, tk.line))
+        for tk in tks:
+            if tk.type == ENDMARKER:
+                break
+            if dedent and tk.type == DEDENT and tk.line == '' and \
+                    tk.start[1] == 0:
+                dedent = False
+                continue
+            if tk.type == DEDENT and end_pos is not None and \
+                    tk.start[1] == 0 and tk.line == '':
+                yield tk._replace(start=end_pos, end=end_pos)
+                continue
+            yield tk._replace(start=(tk.start[0] + line_offset, tk.start[1]),
+                end=(tk.end[0] + line_offset, tk.end[1]))
+    parser.feed_tokens(tokens())
+    stack = parser.stack
+    finals = parser.tables.finals
+    while len(stack) > 1:
+        if not finals[stack[-1]]:
+            raise SyntaxError('unexpected end',
+                (name, line_offset + 1, 0, None))
+        stack.pop()
+        parser.tree.up()
+    return parser.tree.root.subs
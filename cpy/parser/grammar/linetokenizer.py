@@ -0,0 +1,201 @@
+from tokenize import (TokenInfo, TokenError, OP, NEWLINE, INDENT, DEDENT,
+    ERRORTOKEN, ENDMARKER)
+from .scanner import Checkpoint, indent_width, scan, _opening, _closing
+import codecs
+
+
+class LineTokenizer(object):
+    '''tokenize text that arrives in chunks, one logical line at a time
+
+    Text is buffered until it holds a complete logical line, which is
+    tokenized on its own with its indentation stripped; INDENT and DEDENT
+    are computed from the indentation stack kept here, and positions are
+    moved to where the line sits in the whole input. The scan of a logical
+    line still incomplete stops at a Checkpoint at the start of its last
+    physical line, and the next line resumes it there: each chunk costs
+    time proportional to its own size, however long the logical line.
+
+    In interactive mode a blank line ends the current statement the way
+    the REPL does: it closes all open blocks and yields a NEWLINE. With
+    `recover` a stray closing bracket is an ERRORTOKEN, see scanner.scan.
+    '''
+    def __init__(self, interactive=False, recover=False):
+        self.interactive = interactive
+        self.recover = recover
+        self.indents = [0]
+        self.lineno = 0  # physical lines tokenized so far
+        # the physical lines of an incomplete logical line, the first
+        # without its indentation, and where its scan stopped: the tokens
+        # before the scanner.Checkpoint `state`, and whether in a string
+        self.pending = []
+        self.body = None
+        self.tokens = []
+        self.state = None
+        self.in_string = False
+        # below zero after a stray closing bracket: the scanner then goes
+        # on with the next lines as continuation lines
+        self.depth = 0
+        self.partial = ''  # text after the last newline
+        self.decoder = None
+
+    @property
+    def idle(self):
+        return not self.pending and not self.partial
+
+    def feed(self, chunk):
+        if isinstance(chunk, bytes):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = self.decoder.decode(chunk)
+        tokens = []
+        text = self.partial + chunk
+        start = 0
+        while True:
+            end = text.find('\n', start) + 1
+            if not end:
+                break
+            tokens.extend(self.line(text[start:end]))
+            start = end
+        self.partial = text[start:]
+        return tokens
+
+    def close(self):
+        tokens = []
+        if self.decoder is not None:
+            self.partial += self.decoder.decode(b'', True)
+        if self.partial:
+            line, self.partial = self.partial + '\n', ''
+            tokens.extend(self.line(line))
+        if self.pending or self.depth:
+            raise TokenError('EOF in multi-line statement',
+                (self.lineno + 1, 0))
+        pos = (self.lineno + 1, 0)
+        while len(self.indents) > 1:
+            self.indents.pop()
+            tokens.append(TokenInfo(DEDENT, '', pos, pos, ''))
+        tokens.append(TokenInfo(ENDMARKER, '', pos, pos, ''))
+        return tokens
+
+    def line(self, line):
+        if not self.pending:
+            if self.depth < 0:
+                self.body = line
+                self.state = Checkpoint(1, 0, (0,), self.depth, False)
+            else:
+                stripped = line.strip()
+                if not stripped or stripped[0] == '#':
+                    self.lineno += 1
+                    if not stripped and self.interactive:
+                        return self.end_block(line)
+                    return []
+                self.body = line.lstrip(' \t\f')
+            self.pending.append(line)
+            text = self.body
+        else:
+            self.pending.append(line)
+            if self.in_string and "'''" not in line and '"""' not in line:
+                return []  # the string can't end on this line
+            text = self.rest()
+        checkpoints = []
+        saved = 0
+        tokens = []
+        try:
+            for tk in scan(text, state=self.state, checkpoints=checkpoints,
+                    recover=self.recover):
+                if len(checkpoints) > saved:
+                    saved = len(checkpoints)
+                    if self.save(tokens, checkpoints[-1]):
+                        tokens = []
+                tokens.append(tk)
+                if tk.type == NEWLINE:
+                    break
+        except TokenError as e:
+            if len(checkpoints) > saved:
+                self.save(tokens, checkpoints[-1])
+            self.in_string = e.args[0] == 'EOF in multi-line string'
+            if self.in_string or checkpoints and not checkpoints[-1].bol:
+                return []  # the logical line goes on in the next line
+            self.reset()
+            raise
+        except Exception:
+            self.reset()
+            raise
+        tokens = self.tokens + tokens
+        lines = self.pending
+        first = lines[0]
+        ws = first[:len(first) - len(self.body)]
+        depth = self.depth
+        self.reset()
+        row = self.lineno
+        self.lineno += len(lines)
+
+        if depth < 0:
+            result = []
+        else:
+            result = self.indent(ws, row + 1, first)
+        col = len(ws)
+        for tk in tokens:
+            if tk.type == OP:
+                if tk.string in _opening:
+                    depth += 1
+                elif tk.string in _closing:
+                    depth -= 1
+            (srow, scol), (erow, ecol) = tk.start, tk.end
+            if srow == 1:
+                scol += col
+                if erow == 1:
+                    ecol += col
+            result.append(TokenInfo(tk.type, tk.string, (srow + row, scol),
+                (erow + row, ecol), lines[srow - 1]))
+        self.depth = min(depth, 0)
+        return result
+
+    def rest(self):
+        '''the pending lines from the checkpoint on, the first stripped'''
+        if self.state is None or self.state.row == 1:
+            return ''.join([self.body] + self.pending[1:])
+        return ''.join(self.pending[self.state.row - 1:])
+
+    def save(self, tokens, state):
+        '''keep the tokens scanned before the Checkpoint `state` and
+        resume the scan there, at the start of its line in rest()'''
+        for tk in tokens:
+            if tk.type == ERRORTOKEN and tk.string in ('"', "'"):
+                # a quote not closed on its line: a backslash may continue
+                # the string, so scan again from before it
+                return False
+        self.tokens.extend(tokens)
+        self.state = state._replace(offset=0)
+        return True
+
+    def reset(self):
+        self.pending = []
+        self.body = None
+        self.tokens = []
+        self.state = None
+        self.in_string = False
+
+    def indent(self, ws, row, line):
+        width = indent_width(ws)
+        pos = (row, len(ws))
+        if width > self.indents[-1]:
+            self.indents.append(width)
+            return [TokenInfo(INDENT, ws, (row, 0), pos, line)]
+        tokens = []
+        while width < self.indents[-1]:
+            self.indents.pop()
+            tokens.append(TokenInfo(DEDENT, '', pos, pos, line))
+        if width != self.indents[-1]:
+            raise IndentationError(
+                'unindent does not match any outer indentation level',
+                ('<tokenize>', row, len(ws), line))
+        return tokens
+
+    def end_block(self, line):
+        pos = (self.lineno, 0)
+        tokens = []
+        while len(self.indents) > 1:
+            self.indents.pop()
+            tokens.append(TokenInfo(DEDENT, '', pos, pos, line))
+        tokens.append(TokenInfo(NEWLINE, '', pos, pos, line))
+        return tokens
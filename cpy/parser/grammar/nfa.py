@@ -1,21 +1,70 @@
+from itertools import count
+import time
 from .dfa import DFA
 
 '''inspired by pypy'''
 
 
-def simplify_dfa(dfa):
-    changed = True
-    while changed:
-        changed = False
-        for i, state in enumerate(dfa):
-            for j in range(i + 1, len(dfa)):
-                other_state = dfa[j]
-                if state == other_state:
-                    del dfa[j]
-                    for sub_state in dfa:
-                        sub_state.unify_state(other_state, state)
-                    changed = True
-                    break
+_ids = count()
+
+
+def minimize_dfa(dfa):
+    '''minimal DFA equivalent to the list of states `dfa`, start first
+
+    Hopcroft's partition refinement, following only the arcs that exist
+    (a state without an arc for a label differs from one with the arc),
+    so every block of the initial partition is used as a splitter.
+    '''
+    index = dict((state, i) for i, state in enumerate(dfa))
+    preds = [[] for state in dfa]  # target -> [(label, source)]
+    for i, state in enumerate(dfa):
+        for label, target in state.arcs.items():
+            preds[index[target]].append((label, i))
+
+    finals = set(i for i, state in enumerate(dfa) if state.is_final)
+    others = set(range(len(dfa))) - finals
+    blocks = [b for b in (finals, others) if b]
+    block_of = [0] * len(dfa)
+    for b, states in enumerate(blocks):
+        for i in states:
+            block_of[i] = b
+    work = set(range(len(blocks)))
+    while work:
+        sources = {}  # label -> states with an arc into the splitter
+        for target in blocks[work.pop()]:
+            for label, i in preds[target]:
+                sources.setdefault(label, set()).add(i)
+        for label_sources in sources.values():
+            # group by block only now, earlier labels may have split them
+            split = {}
+            for i in label_sources:
+                split.setdefault(block_of[i], set()).add(i)
+            for b, inside in split.items():
+                if len(inside) == len(blocks[b]):
+                    continue
+                # O(len(inside)) either way: the smaller half leaves b
+                if 2 * len(inside) <= len(blocks[b]):
+                    blocks[b] -= inside
+                else:
+                    blocks[b], inside = inside, blocks[b] - inside
+                new = len(blocks)
+                blocks.append(inside)
+                for i in inside:
+                    block_of[i] = new
+                # b stays in `work` if it was there, else its smaller
+                # half is enough to split by
+                work.add(new)
+
+    reps = {}
+    result = []
+    for i, state in enumerate(dfa):
+        if block_of[i] not in reps:
+            reps[block_of[i]] = state
+            result.append(state)
+    for state in result:
+        state.arcs = dict((label, reps[block_of[index[target]]])
+            for label, target in state.arcs.items())
+    return result
 
 
 class NFA(object):
@@ -23,36 +72,63 @@ class NFA(object):
     def __init__(self, is_end=False):
         self.arcs = []
         self.is_end = is_end
+        self.id = next(_ids)  # creation order, to build DFAs reproducibly
+        self.closure = None
 
     def arc(self, state, label=None):
         self.arcs.append((label, state))
 
     def epsilon_closure(self, into):
-        if self in into:
-            return
-        into.add(self)
-        for label, state in self.arcs:
-            if label is None:
-                state.epsilon_closure(into)
-
-    def DFA(self, end):
+        '''add the states reachable by epsilon arcs to `into`'''
+        if self.closure is None:
+            closure = set()
+            stack = [self]
+            while stack:
+                nfa = stack.pop()
+                if nfa in closure:
+                    continue
+                closure.add(nfa)
+                for label, state in nfa.arcs:
+                    if label is None and state not in closure:
+                        stack.append(state)
+            self.closure = frozenset(closure)
+        into |= self.closure
+
+    def DFA(self, end, stats=None):
+        '''minimal DFA of the NFA from this state to `end`
+
+        Subset construction with the DFA states hashed by the frozenset
+        of their NFA states. With a `stats` dict the state counts and the
+        time spent are recorded in it.
+        '''
+        t0 = time.time()
         base_nfas = set()
         self.epsilon_closure(base_nfas)
-        state_stack = [DFA(base_nfas, end)]
+        base_nfas = frozenset(base_nfas)
+        states = {base_nfas: DFA(base_nfas, end)}
+        state_stack = [states[base_nfas]]
+        nnfas = set(base_nfas)
         for state in state_stack:
             arcs = {}
-            for nfa in state.nfas:
+            for nfa in sorted(state.nfas, key=lambda n: n.id):
                 for label, sub_nfa in nfa.arcs:
                     if label is not None:
                         sub_nfa.epsilon_closure(
                             arcs.setdefault(label, set()))
             for label, nfa_set in arcs.items():
-                for st in state_stack:
-                    if st.nfas == nfa_set:
-                        break
-                else:
-                    st = DFA(nfa_set, end)
+                nfa_set = frozenset(nfa_set)
+                st = states.get(nfa_set, None)
+                if st is None:
+                    st = states[nfa_set] = DFA(nfa_set, end)
                     state_stack.append(st)
+                    nnfas.update(nfa_set)
                 state.arc(st, label)
-        simplify_dfa(state_stack)
-        return state_stack
+        t1 = time.time()
+        dfa = minimize_dfa(state_stack)
+        if stats is not None:
+            stats['nfa'] = len(nnfas)
+            stats['dfa'] = len(state_stack)
+            stats['min'] = len(dfa)
+            stats['subset'] = t1 - t0
+            stats['minimize'] = time.time() - t1
+        return dfa
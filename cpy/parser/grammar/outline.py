@@ -0,0 +1,27 @@
+'''bodies skipped by an outline parse, and parsing them later'''
+import token
+from .incremental import parse_fragment
+
+
+# type of the node standing for a skipped body: its start and end are those
+# of the skipped tokens and its val is the start of the DEDENT closing the
+# body, the position the tokenizer gives to the DEDENTs of nested blocks
+SKIPPED = token.N_TOKENS
+
+
+def body_span(src, node):
+    '''(start, end) offsets in src.source of the lines of a skipped body'''
+    return src.line_offset(node.start[0]), src.line_offset(node.val[0])
+
+
+def parse_body(grammar, src, node):
+    '''parse the statements of a skipped body
+
+    Returns the stmt nodes with their positions in the whole source.
+    '''
+    start, end = body_span(src, node)
+    fragment = src.source[start:end]
+    if not isinstance(fragment, str):
+        fragment = str(fragment, src.encoding)
+    return parse_fragment(grammar, fragment, node.start[0] - 1, node.val,
+        src.name, indented=True)
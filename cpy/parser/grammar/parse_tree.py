@@ -1,13 +1,23 @@
 import tokenize
 from .state import STATE_LABEL
+from .prescan import line_starts
+
+
+# the children of every token node, which has none
+EMPTY = ()
 
 
 class Node(object):
+    '''node of a parse tree: a rule, with a None `val`, or a token
+
+    `start` and `end` are (row, col) positions. Tokens share EMPTY as
+    their `subs`.
+    '''
     __slots__ = 'type', 'val', 'subs', 'start', 'end'
     def __init__(self, type, val, start=None, end=None):
         self.type = type
         self.val = val
-        self.subs = []
+        self.subs = [] if val is None else EMPTY
         self.start = start
         self.end = end
 
@@ -41,12 +51,35 @@ class Node(object):
         return '<Node %d(%r)>' % (self.type, self.val)
 
 
+class Leaf(Node):
+    '''token node of a LosslessTree, with the text before the token'''
+    __slots__ = 'prefix',
+
+    def __init__(self, type, val, start, end, prefix):
+        Node.__init__(self, type, val, start, end)
+        self.prefix = prefix
+
+
+# the rules of the Python grammar an expression goes down through to its
+# atom, one node each
+CHAIN = ('test', 'or_test', 'and_test', 'not_test', 'comparison', 'expr',
+    'xor_expr', 'and_expr', 'shift_expr', 'arith_expr', 'term', 'factor',
+    'power')
+
+
 class ParseTree(object):
-    def __init__(self, symbols, name):
+    '''tree of Nodes built from the events of a Parser
+
+    The rules named in `collapse` are left out of the tree when they end
+    with one child, which takes their place, as in the trees of lib2to3.
+    '''
+    def __init__(self, symbols, name, collapse=()):
         self.symbols = symbols
         self.root = Node(symbols[name], None)
         self.stack = []
         self.cur = self.root
+        self.collapse = frozenset(symbols[name] for name in collapse)
+        self.strings = {}  # the token values, each kept once
 
     def add(self, node):
         self.cur.subs.append(node)
@@ -54,13 +87,36 @@ class ParseTree(object):
     def up(self):
         if len(self.stack) == 0:
             raise Exception('up fail')
-        self.cur, self.stack = self.stack[-1], self.stack[:-1]
+        self.cur = self.stack.pop()
 
     def add_down(self, node):
         self.cur.subs.append(node)
         self.stack.append(self.cur)
         self.cur = node
 
+    # the events of a Parser, see events.EventHandler
+
+    def enter_rule(self, sym, start):
+        node = Node(sym, None, start)
+        self.cur.subs.append(node)
+        self.stack.append(self.cur)
+        self.cur = node
+
+    def token(self, type, val, start, end):
+        val = self.strings.setdefault(val, val)
+        self.cur.subs.append(Node(type, val, start, end))
+
+    def leaf(self, type, val, start, end):
+        '''node of a token, added by the caller'''
+        return Node(type, self.strings.setdefault(val, val), start, end)
+
+    def exit_rule(self, sym):
+        if self.stack:
+            node = self.cur
+            self.cur = self.stack.pop()
+            if len(node.subs) == 1 and node.type in self.collapse:
+                self.cur.subs[-1] = node.subs[0]
+
     def printtree(self):
         def printnode(node, indent):
             if node.type > STATE_LABEL:
@@ -71,3 +127,52 @@ class ParseTree(object):
             for n in node.subs:
                 printnode(n, indent + '  ')
         printnode(self.root, '')
+
+
+class LosslessTree(ParseTree):
+    '''ParseTree of `text` that keeps all of it: every token is a Leaf
+    with the comments, blank lines and whitespace before it as prefix
+
+    The prefixes are sliced from the text as the tokens come in, by the
+    offsets of their positions. A NEWLINE the text doesn't end with has
+    an empty val.
+    '''
+    def __init__(self, symbols, name, text, collapse=()):
+        ParseTree.__init__(self, symbols, name, collapse)
+        self.text = text
+        self.starts = line_starts(text)
+        self.offset = 0  # end of the last token
+
+    def leaf(self, type, val, start, end):
+        row, col = start
+        if row > len(self.starts):
+            offset = len(self.text)
+        else:
+            offset = self.starts[row - 1] + col
+        if offset == len(self.text):
+            val = ''
+        prefix = self.text[self.offset:offset]
+        self.offset = offset + len(val)
+        return Leaf(type, self.strings.setdefault(val, val), start, end,
+            prefix)
+
+    def token(self, type, val, start, end):
+        self.cur.subs.append(self.leaf(type, val, start, end))
+
+    def source(self, node=None):
+        '''text of the leaves under `node` with their prefixes; all the
+        text for the root'''
+        if node is None:
+            node = self.root
+        parts = []
+        stack = [node]
+        while stack:
+            leaf = stack.pop()
+            if isinstance(leaf, Leaf):
+                parts.append(leaf.prefix)
+                parts.append(leaf.val)
+            else:
+                stack.extend(reversed(leaf.subs))
+        if node is self.root:
+            parts.append(self.text[self.offset:])
+        return ''.join(parts)
@@ -0,0 +1,328 @@
+from tokenize import (TokenError, ENDMARKER, ERRORTOKEN, NEWLINE, INDENT,
+    DEDENT, STRING)
+from .parse_tree import Node, ParseTree
+from .linetokenizer import LineTokenizer
+from .tables import POP
+from .outline import SKIPPED
+
+
+class Parser(object):
+    '''push parser on the tables of a Grammar
+
+    Tokens can be pushed with feed_tokens() and source text with feed();
+    the state stack and the ParseTree are kept between calls, so every
+    call only costs the new input. close() checks that the input is
+    complete and returns the ParseTree.
+
+    With `recover` syntax errors are collected in `errors` instead of
+    raised. The statement being parsed is moved into an ERRORTOKEN node
+    together with the tokens skipped up to the end of its line (and the
+    block indented under it), and parsing resumes at the next statement
+    of the enclosing block.
+
+    A budget.Budget limits the tokens, nodes, nesting and time spent.
+
+    With an events.EventHandler as `events` no tree is built: the rules
+    and tokens are reported to the handler as they are parsed, and close()
+    returns None. Error recovery needs the tree.
+
+    In `outline` mode the indented bodies of funcdef and classdef (or of
+    the rules named by `outline`) are skipped apart from a leading
+    docstring: their tokens are counted by INDENT and DEDENT only and
+    replaced by one outline.SKIPPED token.
+
+    `tree` is the ParseTree to build, like a parse_tree.LosslessTree.
+    '''
+    def __init__(self, grammar, init=None, name='<string>', profile=None,
+            recover=False, budget=None, events=None, outline=False,
+            tree=None):
+        if init is None:
+            init = grammar.default_state
+        self.grammar = grammar
+        self.tables = grammar.tables
+        self.init = init
+        self.name = name
+        self.profile = profile
+        if events is None:
+            if tree is None:
+                tree = ParseTree(grammar.symbols, init)
+            self.tree = events = tree
+        else:
+            if recover:
+                raise ValueError('error recovery needs a ParseTree')
+            self.tree = None
+            events.enter_rule(grammar.symbols[init], None)
+        self.events = events
+        self.stack = [self.tables.starts[init]]
+        self.tokenizer = None
+        self.last = None
+        self.recover = recover
+        self.budget = budget
+        self.errors = []
+        self.sync = None
+        self.skip = None  # skip_token or skip_body while skipping tokens
+        self.skip_node = None  # ERRORTOKEN node taking skipped tokens
+        self.skip_depth = 0  # INDENTs skipped and not yet closed
+        self.skip_line = False  # skipped the NEWLINE of the bad line
+        self.skip_all = False  # no statement to resume at
+        self.outline = None
+        if outline:
+            symbols = self.tables.symbols
+            if outline is True:
+                outline = ('funcdef', 'classdef')
+            self.outline = set(symbols[name] for name in outline)
+            self.suite = symbols['suite']
+            self.stmt = symbols['stmt']
+        self.body_level = 0  # stack size in the skipped body
+        self.body_doc = None  # None, or whether the docstring has ended
+        self.body_depth = 0
+        self.body_start = self.body_end = None
+
+    def error(self, msg, tk):
+        if tk is None:  # nothing was fed
+            return SyntaxError(msg, (self.name, 1, 0, None))
+        return SyntaxError(msg, (self.name, tk.start[0], tk.start[1], tk.line))
+
+    @property
+    def complete(self):
+        '''whether the input fed so far forms complete statements'''
+        if self.tokenizer is not None and not self.tokenizer.idle:
+            return False
+        if len(self.stack) <= 1:
+            return True
+        finals = self.tables.finals
+        for state in self.stack:
+            if not finals[state]:
+                return False
+        return True
+
+    def feed(self, chunk):
+        if self.tokenizer is None:
+            self.tokenizer = LineTokenizer(self.init == 'single_input',
+                self.recover)
+        self.feed_tokens(self.tokenizer.feed(chunk))
+
+    def fail(self, msg, tk):
+        '''raise the error, or record it and start skipping tokens
+
+        Returns whether `tk` has to be fed again: a DEDENT or ENDMARKER
+        that ends the statement the error was in also ends its block.
+        '''
+        if not self.recover:
+            raise self.error(msg, tk)
+        self.errors.append(self.error(msg, tk))
+        popped = self.resync(tk)
+        if popped and tk.type in (DEDENT, ENDMARKER):
+            self.skip = None
+            return True
+        self.skip_depth = 0
+        self.skip_line = False
+        self.skip_token(tk)
+        return False
+
+    def resync(self, tk, top=None):
+        '''pop the stack to the innermost block that takes statements (or
+        to `top`) and put the broken statement into an ERRORTOKEN node'''
+        if self.sync is None:
+            sym = self.tables.symbols.get('stmt', None)
+            self.sync = sym is not None and self.tables.sync_states(sym) or ()
+        stack, tree = self.stack, self.tree
+        if top is None:
+            top = len(stack) - 1
+            while top > 0 and stack[top] not in self.sync:
+                top -= 1
+        self.skip_all = not stack or stack[top] not in self.sync
+        popped = max(len(stack) - 1 - top, 0)
+        for i in range(popped):
+            stack.pop()
+            tree.up()
+        node = Node(ERRORTOKEN, None, tk.start, tk.start)
+        if popped:
+            node.subs.append(tree.cur.subs.pop())
+            node.start = node.subs[0].start
+        tree.add(node)
+        self.skip_node = node
+        self.skip = self.skip_token
+        return popped
+
+    def skip_token(self, tk):
+        '''add `tk` to the error node, or end skipping and return False
+        when it starts the next statement'''
+        if self.skip_all:
+            if tk.type == ENDMARKER:
+                del self.stack[:]
+        else:
+            if tk.type == ENDMARKER:
+                self.skip = None
+                return False
+            if tk.type == INDENT:
+                self.skip_depth += 1
+            elif tk.type == DEDENT:
+                if not self.skip_depth:
+                    self.skip = None
+                    return False
+                self.skip_depth -= 1
+                self.skip_line = not self.skip_depth
+            elif self.skip_line and not self.skip_depth:
+                self.skip = None
+                return False
+            elif tk.type == NEWLINE and not self.skip_depth:
+                self.skip_line = True
+        node = self.skip_node
+        node.subs.append(self.tree.leaf(tk.type, tk.string, tk.start, tk.end))
+        node.end = tk.end
+        return True
+
+    def enter_body(self):
+        '''start skipping when an INDENT opened a body to outline'''
+        stack = self.stack
+        state_symbols = self.tables.state_symbols
+        if len(stack) < 2 or state_symbols[stack[-1]] != self.suite or \
+                state_symbols[stack[-2]] not in self.outline:
+            return
+        self.body_level = len(stack)
+        self.body_doc = None
+        self.body_depth = 1
+        self.body_start = None
+        self.skip = self.skip_first
+
+    def skip_first(self, tk):
+        if tk.type == STRING:
+            self.body_doc = False
+            self.skip = self.skip_doc
+            return False
+        self.skip = self.skip_body
+        return self.skip_body(tk)
+
+    def skip_doc(self, tk):
+        if tk.type == NEWLINE:
+            self.body_doc = True
+            self.skip = self.skip_body
+        return False
+
+    def skip_body(self, tk):
+        if tk.type == INDENT:
+            self.body_depth += 1
+        elif tk.type == DEDENT:
+            self.body_depth -= 1
+            if not self.body_depth:
+                self.exit_body(tk)
+                return False
+        if self.body_start is None:
+            self.body_start = tk.start
+            stack = self.stack
+            state_symbols = self.tables.state_symbols
+            # close the docstring statement
+            while len(stack) > self.body_level:
+                self.events.exit_rule(state_symbols[stack.pop()])
+        self.body_end = tk.end
+        return True
+
+    def exit_body(self, tk):
+        self.skip = None
+        if self.body_start is None:
+            return
+        self.events.token(SKIPPED, tk.start, self.body_start, self.body_end)
+        if self.body_doc is None:
+            self.stack[-1] = self.tables.goto(self.stack[-1], self.stmt)
+
+    def abort(self, exc):
+        '''record an error raised by the tokenizer, which ends the input'''
+        if not self.recover:
+            raise exc
+        if isinstance(exc, TokenError):
+            msg, (lineno, offset) = exc.args
+            exc = SyntaxError(msg, (self.name, lineno, offset, None))
+        self.errors.append(exc)
+        if len(self.stack) > 1:
+            self.resync(self.last, 0)
+        self.skip = None
+        del self.stack[:]
+
+    def feed_tokens(self, tokens):
+        tables = self.tables
+        nlabels = tables.nlabels
+        actions = tables.actions
+        chains = tables.chains
+        types = tables.types
+        values = tables.values
+        counts = self.profile is not None and self.profile.counts or None
+        state_symbols = tables.state_symbols
+        events = self.events
+        enter_rule = events.enter_rule
+        token = events.token
+        exit_rule = events.exit_rule
+        stack = self.stack
+        budget = self.budget
+        if budget is not None:
+            tokens = budget.count_tokens(tokens)
+        outline = self.outline is not None
+        tk = None
+
+        try:
+            for tk in tokens:
+                if self.skip is not None and self.skip(tk):
+                    continue
+                if not stack:
+                    if tk.type == ENDMARKER:
+                        continue
+                    self.fail('too more tokens', tk)
+                    continue
+                vals = values.get(tk.type, None)
+                label = vals and vals.get(tk.string, None) or \
+                    types.get(tk.type, 0)
+                while True:
+                    index = stack[-1] * nlabels + label
+                    if counts is not None:
+                        counts[index] += 1
+                    action = actions[index]
+                    if action > 0:
+                        stack[-1] = action - 1
+                        token(tk.type, tk.string, tk.start, tk.end)
+                        break
+                    elif action < POP:
+                        stack[-1], syms, subs = chains[-action - 2]
+                        stack.extend(subs)
+                        if budget is not None:
+                            budget.push(len(stack), len(syms))
+                        for sym in syms:
+                            enter_rule(sym, tk.start)
+                        token(tk.type, tk.string, tk.start, tk.end)
+                        break
+                    elif action == POP:
+                        exit_rule(state_symbols[stack.pop()])
+                        if not stack:
+                            if tk.type != ENDMARKER:
+                                self.fail('too more tokens', tk)
+                            break
+                    else:
+                        if tables.accepts_type(stack[-1], tk.type):
+                            msg = 'invalid grammar1'
+                        else:
+                            msg = 'invalid grammar0'
+                        if not self.fail(msg, tk):
+                            break
+                if outline and tk.type == INDENT:
+                    self.enter_body()
+        finally:
+            if tk is not None:
+                self.last = tk
+
+    def close(self):
+        if self.tokenizer is not None:
+            try:
+                tokens = self.tokenizer.close()
+            except (TokenError, SyntaxError) as e:
+                self.abort(e)
+                tokens = []
+            self.feed_tokens(tokens)
+        stack = self.stack
+        while stack:
+            if not self.tables.finals[stack[-1]]:
+                if self.recover:
+                    self.errors.append(
+                        self.error('unexpected end', self.last))
+                    break
+                raise self.error('unexpected end', self.last)
+            self.events.exit_rule(self.tables.state_symbols[stack.pop()])
+        return self.tree
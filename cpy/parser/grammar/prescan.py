@@ -0,0 +1,46 @@
+'''line starts of a whole source buffer, computed in bulk'''
+from array import array
+import re
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_newlines = re.compile('\n')
+_bytes_newlines = re.compile(b'\n')
+
+
+def lines(source):
+    '''line_starts() by a regular expression'''
+    newlines = isinstance(source, str) and _newlines or _bytes_newlines
+    starts = array('l', [0])
+    starts.extend(m.end() for m in newlines.finditer(source))
+    if len(starts) > 1 and starts[-1] == len(source):
+        starts.pop()
+    return starts
+
+
+def vector_lines(data):
+    '''line_starts() of the bytes-like `data` by NumPy'''
+    data = numpy.frombuffer(data, numpy.uint8)
+    starts = numpy.concatenate(([0], numpy.flatnonzero(data == 10) + 1))
+    if len(starts) > 1 and starts[-1] == len(data):
+        starts = starts[:-1]
+    return array('l', starts.astype('l').tobytes())
+
+
+def line_starts(source):
+    '''array of the offsets the lines of `source` start at
+
+    `source` is a str or any bytes-like object, a memoryview of a mapped
+    file too: it is searched in place, by NumPy when it is installed and
+    the offsets are those of the bytes.
+    '''
+    if numpy is None or not len(source):
+        return lines(source)
+    if isinstance(source, str):
+        if not source.isascii():
+            return lines(source)
+        source = source.encode('ascii')
+    return vector_lines(source)
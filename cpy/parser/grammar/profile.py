@@ -0,0 +1,67 @@
+'''arc frequencies recorded by Grammar.parse'''
+from array import array
+import hashlib
+import marshal
+from .tables import POP
+
+
+class ProfileError(Exception):
+    pass
+
+
+class Profile(object):
+    '''How often each (state, label) entry of a Tables was looked up.
+
+    Pass it to Grammar.parse(profile=...) while parsing a sample corpus,
+    then to Grammar.compile(profile=...) to generate a parser whose checks
+    are ordered by frequency and which has inline fast paths for the
+    dominant transitions.
+    '''
+    def __init__(self, tables, counts=None):
+        self.digest = tables.digest()
+        self.nlabels = tables.nlabels
+        self.tables = tables
+        if counts is None:
+            counts = array('L', [0]) * len(tables.actions)
+        elif len(counts) != len(tables.actions):
+            raise ProfileError('profile does not match the tables')
+        self.counts = counts
+
+    @classmethod
+    def collect(cls, grammar, sources, init=None):
+        profile = cls(grammar.tables)
+        for src in sources:
+            grammar.parse(src, init=init, profile=profile)
+        return profile
+
+    def profile_digest(self):
+        return hashlib.sha1(self.counts.tobytes()).hexdigest()
+
+    def count(self, state, labels):
+        row = state * self.nlabels
+        counts = self.counts
+        return sum(counts[row + label] for label in labels)
+
+    def visits(self, state):
+        return self.count(state, range(self.nlabels))
+
+    def pop_labels(self, state):
+        row = state * self.nlabels
+        actions = self.tables.actions
+        return [label for label in range(self.nlabels)
+            if actions[row + label] == POP and self.counts[row + label]]
+
+    def dump(self, path):
+        with open(path, 'wb') as f:
+            marshal.dump((self.digest, self.counts.typecode,
+                self.counts.tobytes()), f)
+
+    @classmethod
+    def load(cls, path, tables):
+        with open(path, 'rb') as f:
+            digest, typecode, data = marshal.load(f)
+        if digest != tables.digest():
+            raise ProfileError('profile was recorded with other tables')
+        counts = array(typecode)
+        counts.frombytes(data)
+        return cls(tables, counts)
@@ -0,0 +1,325 @@
+'''tokenizer scanning the whole source with one regular expression'''
+from codecs import BOM_UTF8
+from collections import namedtuple
+from io import BytesIO
+from tokenize import (TokenInfo, TokenError, NAME, NUMBER, STRING, OP,
+    NEWLINE, INDENT, DEDENT, ERRORTOKEN, ENDMARKER)
+import tokenize
+import re
+
+
+def _group(pattern):
+    # the patterns of tokenize capture; only the top level groups may
+    return re.sub(r'(?<!\\)\((?!\?)', '(?:', pattern)
+
+
+_prefix = _group(tokenize.StringPrefix)
+COMMENT, NL, CONTINUATION, NUMBER_, NAME_, OP_, TRIPLE, OPEN_TRIPLE, \
+    SINGLE, NAME_PREFIX, ERROR = range(1, 12)
+_pattern = r'''[ \f\t]*(?:
+    (\#[^\r\n]*)
+    |(\r?\n)
+    |(\\\r?\n)
+    |(%(number)s)
+    |(\w+(?![\w'"]))
+    |(%(op)s)
+    |(%(prefix)s(?:'\'\'[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'\'\'
+        |"""[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*"""))
+    |(%(prefix)s(?:'\'\'|"""))
+    |(%(prefix)s(?:'[^\n'\\]*(?:\\(?:\r\n|[\s\S])[^\n'\\]*)*'
+        |"[^\n"\\]*(?:\\(?:\r\n|[\s\S])[^\n"\\]*)*"))
+    |(\w+)
+    |(.)
+    )''' % {'number': _group(tokenize.Number), 'op': _group(tokenize.Special),
+        'prefix': _prefix}
+_token = re.compile(_pattern, re.VERBOSE)
+# the same on UTF-8 bytes, where any non ASCII byte is part of a name
+_bytes_token = re.compile(_pattern.replace(r'\w', r'\w\x80-\xff').replace(
+    r'\w\x80-\xff+', r'[\w\x80-\xff]+').encode(), re.VERBOSE)
+# the blanks starting a line, and whether nothing but a comment follows
+_indent = re.compile(r'[ \f\t]*(?=([#\r\n])?)')
+_bytes_indent = re.compile(_indent.pattern.encode())
+_bytes_newline = re.compile(b'\n')
+_word = re.compile(r'\w*')
+_opening = frozenset('([{')
+_closing = frozenset(')]}')
+
+
+# state of the scanner at the start of a physical line, after a newline:
+# its number and offset, the indentation stack, the bracket depth and
+# whether the line starts a logical line. A line inside a string never
+# gets one: strings are matched whole.
+Checkpoint = namedtuple('Checkpoint', 'row offset indents depth bol')
+
+
+def indent_width(ws, tabsize=8):
+    col = 0
+    for c in ws:
+        if c == '\t':
+            col = (col // tabsize + 1) * tabsize
+        elif c == ' ':
+            col += 1
+        else:
+            col = 0
+    return col
+
+
+def detect_encoding(source):
+    '''encoding of the bytes-like `source`, detected as tokenize does'''
+    # the cookie is on one of the first two lines, don't copy the rest
+    m = _bytes_newline.search(source)
+    m = m and _bytes_newline.search(source, m.end())
+    head = bytes(source[:m and m.end() or len(source)])
+    return tokenize.detect_encoding(BytesIO(head).readline)[0]
+
+
+def decode(source):
+    '''text and encoding of `source`, decoded as tokenize would
+
+    Bytes-like objects other than bytes, like a memoryview of a mapped
+    file, are left as they are when in UTF-8: scan reads them directly.
+    '''
+    if isinstance(source, str):
+        return source, None
+    encoding = detect_encoding(source)
+    if not isinstance(source, bytes) and encoding in ('utf-8', 'utf-8-sig'):
+        return source, encoding
+    return str(source, encoding), encoding
+
+
+def scan(source, encoding='utf-8', state=None, checkpoints=None, every=1,
+        recover=False):
+    '''generate the tokens tokenize.generate_tokens gives for `source`,
+    leaving out NL and COMMENT
+
+    One match of a single regular expression finds every token and tells
+    its kind, and comments, blank lines and line continuations are passed
+    over without creating a token for them. The line of a token is only
+    sliced from the source once per physical line, and a missing newline
+    at the end is handled without copying the source.
+
+    `source` is a str, or a bytes-like object in UTF-8 `encoding`: tokens
+    and lines are then decoded one by one and the columns are counted in
+    characters, as in the decoded text.
+
+    The scan starts from the Checkpoint `state` if given, and appends one
+    to the list `checkpoints` at least every `every` lines.
+
+    With `recover` a closing bracket with none open is an ERRORTOKEN and
+    leaves the depth at zero, so the lines after it still end statements
+    for a parser to resume at.
+    '''
+    text = isinstance(source, str)
+    size = len(source)
+    pos = 0
+    if text:
+        match = _token.match
+        indent = _indent.match
+        find = source.find
+        missing = size and source[-1] not in '\r\n'
+    else:
+        match = _bytes_token.match
+        indent = _bytes_indent.match
+        search = _bytes_newline.search
+
+        def find(nl, pos):
+            m = search(source, pos)
+            if m is None:
+                return -1
+            return m.start()
+
+        missing = size and source[size - 1] not in b'\r\n'
+        if encoding == 'utf-8-sig':
+            # a BOM further on is a character, not to be dropped
+            encoding = 'utf-8'
+            if bytes(source[:3]) == BOM_UTF8:
+                pos = 3
+
+    def physical(pos):
+        # end and decoded text of the line at pos, and whether it is wide:
+        # with characters of more than one byte
+        end = find('\n', pos) + 1 or size
+        if text:
+            line = source[pos:end]
+            wide = False
+        else:
+            line = str(source[pos:end], encoding)
+            wide = len(line) != end - pos
+        if missing and end == size:
+            line += '\n'
+        return end, line, wide
+
+    def column(offset):
+        return len(str(source[line_start:offset], encoding))
+
+    def save(row, pos, indents, depth, bol):
+        checkpoints.append(Checkpoint(row, pos, tuple(indents), depth, bol))
+        return row + every
+
+    new = tuple.__new__
+    indents = [0]
+    widths = {}
+    depth = 0
+    row = 1
+    bol = True  # at the start of a logical line
+    kind = None
+    if state is not None:
+        row, pos, indents, depth, bol = state
+        indents = list(indents)
+        if not bol and not depth:
+            kind = CONTINUATION
+    line_start = pos  # offset of the current physical line
+    line_end, line, wide = physical(pos)
+    mark = checkpoints is None and size + 2 or row + every
+    while pos < size:
+        if bol:
+            m = indent(source, pos)
+            ws = m.end()
+            if ws == size or m.lastindex:  # blank line, skipped whole
+                row += 1
+                pos = line_start = line_end
+                line_end, line, wide = physical(pos)
+                if row >= mark and (pos < size or not missing):
+                    mark = save(row, pos, indents, depth, bol)
+                continue
+            bol = False
+            blanks = source[pos:ws]
+            if not text:
+                blanks = str(blanks, 'ascii')
+            width = widths.get(blanks, None)
+            if width is None:
+                width = widths[blanks] = indent_width(blanks)
+            if width > indents[-1]:
+                indents.append(width)
+                yield new(TokenInfo, (INDENT, line[:ws - pos], (row, 0),
+                    (row, ws - pos), line))
+            while width < indents[-1]:
+                if width not in indents:
+                    raise IndentationError('unindent does not match any '
+                        'outer indentation level',
+                        ('<tokenize>', row, ws - pos, line))
+                indents.pop()
+                yield new(TokenInfo, (DEDENT, '', (row, ws - pos),
+                    (row, ws - pos), line))
+            pos = ws
+        m = match(source, pos)
+        if m is None:  # trailing spaces
+            pos = size
+            break
+        kind = m.lastindex
+        start, pos = m.span(kind)
+        if wide:
+            scol, ecol = column(start), column(pos)
+        else:
+            scol, ecol = start - line_start, pos - line_start
+        if kind == NAME_ or kind == NAME_PREFIX:
+            string = m[kind]
+            if not text:
+                string = str(string, encoding)
+                word = wide and _word.match(string).end()
+                if wide and word < len(string):
+                    # a character no name has: end the name before it and
+                    # scan again after it, as in the text
+                    pos = start + len(string[:word + 1].encode())
+                    if word:
+                        yield new(TokenInfo, (NAME, string[:word],
+                            (row, scol), (row, scol + word), line))
+                    else:
+                        for i in range(m.start(), start):
+                            yield new(TokenInfo, (ERRORTOKEN,
+                                chr(source[i]), (row, i - start + scol),
+                                (row, i - start + scol + 1), line))
+                    yield new(TokenInfo, (ERRORTOKEN, string[word],
+                        (row, scol + word), (row, scol + word + 1), line))
+                    kind = ERROR
+                    continue
+            yield new(TokenInfo, (NAME, string, (row, scol), (row, ecol),
+                line))
+        elif kind == OP_:
+            string = m[kind]
+            if not text:
+                string = string.decode()
+            if string in _opening:
+                depth += 1
+            elif string in _closing:
+                if recover and depth <= 0:
+                    yield new(TokenInfo, (ERRORTOKEN, string, (row, scol),
+                        (row, ecol), line))
+                    continue
+                depth -= 1
+            yield new(TokenInfo, (OP, string, (row, scol), (row, ecol),
+                line))
+        elif kind == NUMBER_:
+            string = m[kind]
+            if not text:
+                string = string.decode()
+            yield new(TokenInfo, (NUMBER, string, (row, scol), (row, ecol),
+                line))
+        elif kind == NL:
+            if depth <= 0:
+                string = m[kind]
+                if not text:
+                    string = string.decode()
+                yield new(TokenInfo, (NEWLINE, string, (row, scol),
+                    (row, ecol), line))
+                bol = depth == 0
+            row += 1
+            line_start = pos
+            line_end, line, wide = physical(pos)
+            if row >= mark:
+                mark = save(row, pos, indents, depth, bol)
+        elif kind == TRIPLE or kind == SINGLE:
+            string = raw = m[kind]
+            if not text:
+                string = str(raw, encoding)
+            lines = string.count('\n')
+            if not lines:
+                yield new(TokenInfo, (STRING, string, (row, scol),
+                    (row, ecol), line))
+                continue
+            first, first_start = row, line_start
+            row += lines
+            line_start = start + raw.rfind(text and '\n' or b'\n') + 1
+            line_end, line, wide = physical(line_start)
+            ecol = wide and column(pos) or pos - line_start
+            lines = source[first_start:line_end]  # those of the token
+            if not text:
+                lines = str(lines, encoding)
+            if missing and line_end == size:
+                lines += '\n'
+            yield new(TokenInfo, (STRING, string, (first, scol),
+                (row, ecol), lines))
+        elif kind == CONTINUATION:
+            row += 1
+            line_start = pos
+            line_end, line, wide = physical(pos)
+            if row >= mark:
+                mark = save(row, pos, indents, depth, bol)
+        elif kind == OPEN_TRIPLE:
+            raise TokenError('EOF in multi-line string', (row, scol))
+        elif kind == ERROR:
+            if missing and pos == size:
+                char = m[kind]
+                if char in ('\\', b'\\'):
+                    # a backslash continuing the newline only the end has
+                    raise TokenError('EOF in multi-line statement',
+                        (row + 1, 0))
+                if char in (' ', '\f', '\t', b' ', b'\f', b'\t'):
+                    break  # trailing spaces
+            # like tokenize, every blank before the character is an error
+            for i in range(m.start(), pos):
+                yield new(TokenInfo, (ERRORTOKEN, text and source[i] or
+                    chr(source[i]), (row, i - start + scol),
+                    (row, i - start + scol + 1), line))
+    if missing and not bol and pos == size:
+        # the newline the source doesn't end with
+        col = wide and column(size) or size - line_start
+        if depth <= 0:
+            yield new(TokenInfo, (NEWLINE, '\n', (row, col), (row, col + 1),
+                line))
+        row += 1
+    if depth or kind == CONTINUATION:
+        raise TokenError('EOF in multi-line statement', (row, 0))
+    for indent in indents[1:]:
+        yield new(TokenInfo, (DEDENT, '', (row, 0), (row, 0), ''))
+    yield new(TokenInfo, (ENDMARKER, '', (row, 0), (row, 0), ''))
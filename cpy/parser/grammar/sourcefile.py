@@ -1,13 +1,32 @@
-from io import BytesIO, StringIO
-import tokenize
+import mmap
 import os
+from .scanner import decode, scan
+from .prescan import line_starts
+from .tokenarray import TokenArray
+
+
+def map_file(path):
+    '''read-only memoryview of the file at `path`, mapped in memory'''
+    with open(path, 'rb') as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file can't be mapped
+            return b''
+    return memoryview(mapping)
 
 
 class SourceFile(object):
-    def __init__(self, path=None, src=None):
+    '''source to parse: a str, bytes, or a bytes-like object like the
+    memoryview of a mapped file, which is tokenized without being copied
+    '''
+    def __init__(self, path=None, src=None, mmap=False):
         if path:
             self.name = os.path.split(path)[-1]
-            src = open(path, 'rb').read()
+            if mmap:
+                src = map_file(path)
+            else:
+                with open(path, 'rb') as f:
+                    src = f.read()
         elif not src:
             raise Exception('path or src can\'t be None')
         else:
@@ -15,35 +34,90 @@ class SourceFile(object):
         self.path = path
 
         self.source = src
-        if isinstance(src, str):
-            if src and src[-1] != '\n':
-                src += '\n'
-            self._gen = tokenize.generate_tokens(StringIO(src).readline)
-        else:
-            if src and src[-1] != b'\n':
-                src += b'\n'
-            self._gen = tokenize.tokenize(BytesIO(src).readline)
         self.encoding = 'utf8'
         self.parse_tree = None
-        self._lines = None
+        self.errors = []
+        self._line_starts = None
+        self.stream = None
+        self.token_array = None
+
+    def line_starts(self):
+        '''offsets of the lines in the source, indexed on first use'''
+        if self._line_starts is None:
+            self._line_starts = line_starts(self.source)
+        return self._line_starts
+
+    def line_offset(self, lineno):
+        '''offset of the start of line `lineno` (from 1), or of the end'''
+        starts = self.line_starts()
+        if lineno > len(starts):
+            return len(self.source)
+        return starts[lineno - 1]
 
     def get_line(self, lineno):
-        if self._lines is None:
-            if not isinstance(self.source, str):
-                self.source = self.source.decode(self.encoding)
-            self._lines = self.source.split('\n')
-        if lineno >= len(self._lines):
+        '''line `lineno` (from 1) without its newline'''
+        if lineno < 1 or lineno > len(self.line_starts()):
             return None
-        return self._lines[lineno]
-
-    def tokens(self):
-        tk = next(self._gen)
-        if tk.type == tokenize.ENCODING:
-            self.encoding = tk.string
-        elif tk.type not in (tokenize.NL, tokenize.COMMENT):
-            yield tk
-
-        while True:
-            tk = next(self._gen)
-            if tk.type not in (tokenize.NL, tokenize.COMMENT):
-                yield tk
+        line = self.source[self.line_offset(lineno):
+            self.line_offset(lineno + 1)]
+        if not isinstance(line, str):
+            line = str(line, self.encoding)
+        if line.endswith('\n'):
+            line = line[:-1]
+        return line
+
+    def text(self):
+        '''the source decoded, as the tokens have it'''
+        text, encoding = decode(self.source)
+        if not isinstance(text, str):
+            text = str(text, encoding)
+        return text
+
+    def lines(self, first, last):
+        '''lines `first` to `last` (from 1) with their newlines, as in the
+        `line` of a token on them'''
+        starts = self.line_starts()
+        if first > len(starts):
+            return ''
+        text = self.source[starts[first - 1]:self.line_offset(last + 1)]
+        if not isinstance(text, str):
+            text = str(text, self.encoding)
+        if last >= len(starts) and text and text[-1] not in '\r\n':
+            text += '\n'
+        return text
+
+    def keep_tokens(self):
+        '''tokenize the source once into a tokenarray.TokenArray, which
+        tokens() iterates from then on'''
+        if self.token_array is None:
+            self.token_array = TokenArray(self, self.tokens())
+        return self.token_array
+
+    def edit(self, edits):
+        '''apply (start, end, text) edits given as offsets in the decoded
+        source, keeping its tokens in a tokenstream.TokenStream
+
+        Only the lines around the edits are tokenized again, once the
+        first edit has tokenized the source whole. Returns the (first, end)
+        lines tokenized again, see TokenStream.edit.
+        '''
+        from .tokenstream import TokenStream
+        if self.stream is None:
+            self.stream = TokenStream(self.source)
+        lines = self.stream.edit(edits)
+        self.source = self.stream.source
+        self._line_starts = self.token_array = None
+        return lines
+
+    def tokens(self, recover=False):
+        '''the tokens of the source, see scanner.scan for `recover`'''
+        if self.token_array is not None:
+            yield from self.token_array
+            return
+        if self.stream is not None:
+            yield from self.stream
+            return
+        text, encoding = decode(self.source)
+        if encoding is not None:
+            self.encoding = encoding
+        yield from scan(text, encoding, recover=recover)
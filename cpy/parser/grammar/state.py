@@ -156,6 +156,9 @@ class States(object):
     def items(self):
         yield from self.states.items()
 
+    def values(self):
+        yield from self.states.values()
+
     def from_dfas(self, dfas):
         states = {}
         def dfa2state(dfa):
@@ -182,6 +185,64 @@ class States(object):
         for state in self.all_states:
             state.build_bootstrap()
 
+    def rule_states(self, name):
+        '''all states of the rule `name`'''
+        start = self.states[name]
+        states, stack = [start], [start]
+        seen = set(states)
+        while stack:
+            for st in stack.pop().arcs.values():
+                if st not in seen:
+                    seen.add(st)
+                    states.append(st)
+                    stack.append(st)
+        return states
+
+    def subset(self, starts, allow=None):
+        '''new States with the rules reachable from `starts`
+
+        With `allow` only the rules it names (and the start rules) are
+        kept; arcs into other rules are dropped, so the subset parses a
+        restricted language. The kept rules are numbered from scratch in
+        the order they are reached.
+        '''
+        if allow is not None:
+            allow = set(allow) | set(starts)
+        names = list(starts)
+        seen = set(names)
+        for name in names:
+            for st in self.rule_states(name):
+                for label in st.arcs:
+                    if label.type != STATE_LABEL:
+                        continue
+                    sub = label.val.name
+                    if sub not in seen and (allow is None or sub in allow):
+                        seen.add(sub)
+                        names.append(sub)
+
+        copies = {}
+        for name in names:
+            st = self.states[name]
+            copies[st] = State(st.is_final, name)
+        for name in names:
+            for st in self.rule_states(name):
+                copy = copies.get(st, None)
+                if copy is None:
+                    copy = copies[st] = State(st.is_final)
+                for label, nxt in st.arcs.items():
+                    if label.type == STATE_LABEL:
+                        if label.val.name not in seen:
+                            continue
+                        label = Label(STATE_LABEL, copies[label.val])
+                    if nxt not in copies:
+                        copies[nxt] = State(nxt.is_final)
+                    copy.arc(label, copies[nxt])
+        states = States()
+        for name in names:
+            states[name] = copies[self.states[name]]
+        states.build_bootstrap()
+        return states
+
     def generate(self):
         buf = six.StringIO()
         buf.write('# generated by cpy.parser.state.States\n')
@@ -200,3 +261,22 @@ class States(object):
             buf.write('\n\n')
             buf.write(''.join(state.generate(name, IDs())))
         return buf.getvalue()
+
+    def tables(self, starts=None, allow=None, compact=False):
+        '''Tables for `starts`; with `allow` or `compact` they are built
+        from subset(starts, allow), so the symbols are renumbered'''
+        from .tables import Tables
+        if starts is None:
+            starts = list(self.states)
+        if allow is not None or compact:
+            return self.subset(starts, allow).tables(starts)
+        starts = OrderedDict((name, self.states[name]) for name in starts)
+        return Tables.from_states(self.symbols, starts)
+
+    def generate_tables(self, starts=None, allow=None, compact=False):
+        return self.tables(starts, allow, compact).generate()
+
+    def generate_parser(self, starts=None, profile=None, allow=None,
+            compact=False):
+        from .codegen import generate_parser
+        return generate_parser(self.tables(starts, allow, compact), profile)
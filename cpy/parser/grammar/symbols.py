@@ -22,3 +22,11 @@ class Symbols(object):
         elif isinstance(k, int):
             return self._reverse_symbols[k]
         raise AttributeError(k)
+
+    def items(self):
+        return self._symbols.items()
+
+
+def make_symbols(symbols):
+    '''Symbols instance for a name -> id dict'''
+    return SymbolsMeta('_Symbols', (Symbols,), dict(symbols))()
@@ -0,0 +1,261 @@
+'''dense integer transition tables compiled from State bootstraps'''
+from array import array
+import hashlib
+import marshal
+import six
+from .state import STATE_LABEL
+
+
+ERROR = 0
+POP = -1
+
+
+class Tables(object):
+    '''Integer form of a set of States.
+
+    Every DFA state gets an integer id and every token class (a generic
+    token type, or a token type with a fixed value such as a keyword or an
+    operator) gets a label id.  `actions[state * nlabels + label]` is:
+
+        ERROR (0)   no arc for the token
+        POP (-1)    no arc for the token, but the state is final
+        n > 0       shift the token and go to state n - 1
+        n < -1      chains[-n - 2] is (next, symbols, subs): go to state
+                    `next`, push one node per symbol with the matching
+                    state of `subs` and shift the token into the last one
+
+    A chain is the whole run of rules a token descends through before it
+    is shifted (test -> or_test -> ... -> atom for the first NAME of an
+    expression), precomputed so the parse loop applies it in one step.
+
+    Valued labels fall back to the generic label of their token type in
+    rows that have no entry for the value, so the parse loop only does a
+    single lookup per token.
+    '''
+    def __init__(self, symbols, starts, types, values, label_types,
+            actions, finals, state_symbols, chains):
+        self.symbols = symbols  # name -> id
+        self.starts = starts  # name -> state id
+        self.types = types  # token type -> generic label id
+        self.values = values  # token type -> {value: label id}
+        self.label_types = label_types  # label id -> token type
+        self.nlabels = len(label_types)
+        self.actions = actions
+        self.finals = finals
+        self.state_symbols = state_symbols  # state id -> symbol id
+        self.chains = chains
+
+    def classify(self, type, val):
+        vals = self.values.get(type, None)
+        if vals is not None:
+            label = vals.get(val, None)
+            if label is not None:
+                return label
+        return self.types.get(type, 0)
+
+    def digest(self):
+        h = hashlib.sha1()
+        h.update(repr((sorted(self.symbols.items()),
+            sorted(self.starts.items()), sorted(self.types.items()),
+            sorted((t, sorted(v.items())) for t, v in self.values.items()),
+            self.label_types, self.chains)).encode('utf8'))
+        h.update(self.actions.tobytes())
+        h.update(self.finals)
+        return h.hexdigest()
+
+    def accepts_type(self, state, type):
+        row = state * self.nlabels
+        for label, t in enumerate(self.label_types):
+            if t == type and self.actions[row + label] not in (ERROR, POP):
+                return True
+        return False
+
+    def sync_states(self, sym):
+        '''states with an arc into a `sym` node, where error recovery can
+        resume parsing'''
+        chains = self.chains
+        states = set()
+        for index, action in enumerate(self.actions):
+            if action < POP and chains[-action - 2][1][0] == sym:
+                states.add(index // self.nlabels)
+        return states
+
+    def goto(self, state, sym):
+        '''state reached from `state` over a whole `sym` node'''
+        row = state * self.nlabels
+        for action in self.actions[row:row + self.nlabels]:
+            if action < POP:
+                chain = self.chains[-action - 2]
+                if chain[1][0] == sym:
+                    return chain[0]
+        return None
+
+    @classmethod
+    def from_states(cls, symbols, starts):
+        '''build tables from start states (name -> State)'''
+        ids = {}
+        states = []
+        state_symbols = array('H')
+        rules = list(starts.values())
+        seen = set(rules)
+        for rule in rules:
+            sym = symbols[rule.name]
+            stack = [rule]
+            while stack:
+                st = stack.pop(0)
+                if st in ids:
+                    continue
+                ids[st] = len(states)
+                states.append(st)
+                state_symbols.append(sym)
+                if not hasattr(st, 'bootstrap'):
+                    st.build_bootstrap()
+                for label, sub in st.arcs.items():
+                    if sub not in ids:
+                        stack.append(sub)
+                    if label.type == STATE_LABEL and label.val not in seen:
+                        seen.add(label.val)
+                        rules.append(label.val)
+
+        label_keys = set()
+        for st in states:
+            for t, vals in st.bootstrap.items():
+                for v in vals:
+                    label_keys.add((t, v))
+        label_types = [0]
+        types, values = {}, {}
+        for t, v in sorted(label_keys, key=lambda k: (k[0], k[1] is not None,
+                k[1] or '')):
+            if v is None:
+                types[t] = len(label_types)
+            else:
+                values.setdefault(t, {})[v] = len(label_types)
+            label_types.append(t)
+
+        nlabels = len(label_types)
+        actions = array('i', [ERROR]) * (len(states) * nlabels)
+        finals = bytearray(len(states))
+        pushes = {}  # (state id, label) -> (next id, symbol, sub id)
+        for i, st in enumerate(states):
+            finals[i] = st.is_final
+            row = i * nlabels
+            if st.is_final:
+                for label in range(nlabels):
+                    actions[row + label] = POP
+            for t, vals in st.bootstrap.items():
+                arcs = []
+                for v, arc in vals.items():
+                    if v is None:
+                        arcs.append((types[t], arc))
+                    else:
+                        arcs.append((values[t][v], arc))
+                if None in vals:
+                    for v, label in values.get(t, {}).items():
+                        if v not in vals:
+                            arcs.append((label, vals[None]))
+                for label, (sub, nxt) in arcs:
+                    if sub is None:
+                        actions[row + label] = ids[nxt] + 1
+                    else:
+                        pushes[i, label] = (
+                            ids[nxt], symbols[sub.name], ids[sub])
+
+        chains, chain_ids = [], {}
+        for (i, label), (nxt, sym, sub) in sorted(pushes.items()):
+            syms, subs = [sym], []
+            while (sub, label) in pushes:
+                n, sym, sub2 = pushes[sub, label]
+                syms.append(sym)
+                subs.append(n)
+                sub = sub2
+            action = actions[sub * nlabels + label]
+            if action <= 0:
+                raise Exception('invalid bootstrap')
+            subs.append(action - 1)
+            chain = (nxt, tuple(syms), tuple(subs))
+            c = chain_ids.get(chain, None)
+            if c is None:
+                c = chain_ids[chain] = len(chains)
+                chains.append(chain)
+            actions[i * nlabels + label] = -c - 2
+
+        return cls(dict((name, symbols[name]) for name in
+                (rule.name for rule in rules)),
+            dict((name, ids[st]) for name, st in starts.items()),
+            types, values, label_types, actions, bytes(finals),
+            state_symbols, chains)
+
+    def snapshot(self):
+        '''the tables as one marshal string, see from_snapshot'''
+        return marshal.dumps((self.symbols, self.starts, self.types,
+            self.values, self.label_types, self.actions.typecode,
+            self.actions.tobytes(), self.finals,
+            self.state_symbols.typecode, self.state_symbols.tobytes(),
+            self.chains))
+
+    @classmethod
+    def from_snapshot(cls, data):
+        '''tables of a snapshot() string
+
+        Nothing is unmarshaled before the first use of the tables, so a
+        module can create them at import time for free.
+        '''
+        tables = cls.__new__(cls)
+        tables._snapshot = data
+        return tables
+
+    def __getattr__(self, name):
+        # only called for missing attributes: hydrate a snapshot. The
+        # snapshot is dropped only once all the attributes are set, so
+        # threads that get here at the same time each hydrate it, and one
+        # that gets here just after reads what the other one set.
+        data = self.__dict__.get('_snapshot', None)
+        if data is None:
+            return object.__getattribute__(self, name)
+        (symbols, starts, types, values, label_types, typecode, actions,
+            finals, sym_typecode, state_symbols, chains) = marshal.loads(data)
+        self.__init__(symbols, starts, types, values, label_types,
+            array(typecode, actions), finals,
+            array(sym_typecode, state_symbols), chains)
+        self.__dict__.pop('_snapshot', None)
+        return getattr(self, name)
+
+    def dump(self, f):
+        '''write the tables to the binary file `f` with marshal'''
+        f.write(self.snapshot())
+
+    @classmethod
+    def load(cls, f):
+        return cls.from_snapshot(f.read())
+
+    def generate(self, snapshot=None):
+        '''source of a module defining `symbols` and `tables`
+
+        With a `snapshot` file name the module loads the tables from that
+        file next to it, which is written by the caller, instead of
+        holding them in a bytes literal.
+        '''
+        buf = six.StringIO()
+        buf.write('# generated by cpy.parser.grammar.tables.Tables\n')
+        if snapshot is not None:
+            buf.write('import os\n')
+        buf.write('from cpy.parser.grammar.tables import Tables\n')
+        buf.write('from cpy.parser.grammar.symbols import Symbols\n\n\n')
+
+        buf.write('class _Symbols(Symbols):\n')
+        for name, sym in sorted(self.symbols.items(), key=lambda x: x[1]):
+            buf.write('    %s = %d\n' % (name, sym))
+        buf.write('symbols = _Symbols()\n\n\n')
+
+        if snapshot is not None:
+            buf.write('_path = os.path.join(os.path.dirname(__file__), %r)\n'
+                % snapshot)
+            buf.write('with open(_path, \'rb\') as f:\n')
+            buf.write('    tables = Tables.load(f)\n')
+            return buf.getvalue()
+        buf.write('tables = Tables.from_snapshot(')
+        data = self.snapshot()
+        for i in range(0, len(data), 16):
+            buf.write('\n    %r' % data[i:i + 16])
+        buf.write(')\n')
+        return buf.getvalue()
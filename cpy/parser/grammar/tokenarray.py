@@ -0,0 +1,55 @@
+'''tokens of a source kept in compact arrays'''
+from array import array
+from tokenize import TokenInfo, STRING
+
+
+class TokenArray(object):
+    '''the tokens of the SourceFile `src`, in parallel arrays
+
+    `types` holds the token types, `values` indexes in `strings`, the
+    table of the distinct token strings, and `rows` and `cols` the start
+    positions. The end of a token follows from its string and its line
+    is sliced from the source, so iterating gives the tokens back as
+    TokenInfo tuples, made one at a time.
+    '''
+    def __init__(self, src, tokens):
+        self.src = src
+        self.types = types = array('B')
+        self.values = values = array('I')
+        self.rows = rows = array('I')
+        self.cols = cols = array('I')
+        self.strings = strings = []
+        index = {}
+        for tk in tokens:
+            string = tk[1]
+            i = index.get(string, None)
+            if i is None:
+                i = index[string] = len(strings)
+                strings.append(string)
+            types.append(tk[0])
+            values.append(i)
+            rows.append(tk[2][0])
+            cols.append(tk[2][1])
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        new = tuple.__new__
+        strings = self.strings
+        lines = self.src.lines
+        last = line = None
+        for type, value, row, col in zip(self.types, self.values, self.rows,
+                self.cols):
+            string = strings[value]
+            if type == STRING and '\n' in string:
+                end = row + string.count('\n')
+                yield new(TokenInfo, (type, string, (row, col),
+                    (end, len(string) - string.rfind('\n') - 1),
+                    lines(row, end)))
+                continue
+            if row != last:
+                last = row
+                line = lines(row, row)
+            yield new(TokenInfo, (type, string, (row, col),
+                (row, col + len(string)), line))
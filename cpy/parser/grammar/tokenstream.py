@@ -0,0 +1,129 @@
+'''tokens of a source kept up to date through edits'''
+from bisect import bisect_right
+from tokenize import TokenError
+from .scanner import Checkpoint, decode, scan
+from .incremental import apply_edits
+
+
+def shift(tokens, rows):
+    new = tuple.__new__
+    return [new(type(tk), (tk[0], tk[1], (tk[2][0] + rows, tk[2][1]),
+        (tk[3][0] + rows, tk[3][1]), tk[4])) for tk in tokens]
+
+
+class TokenStream(object):
+    '''the tokens of `source`, kept in segments that each start at a
+    Checkpoint of the scanner, taken every `every` lines
+
+    An edit is tokenized again from the last checkpoint before it, until
+    the scanner gets to a line past the edit with a checkpoint in the old
+    stream and the same state: the tokens from there on are kept, their
+    rows moved by the number of lines the edit added. Iterating gives the
+    tokens of the whole source, which a parser can be fed.
+    '''
+    def __init__(self, source, every=32):
+        text, encoding = decode(source)
+        if not isinstance(text, str):
+            text = str(text, encoding)
+        self.source = text
+        self.every = every
+        self.checkpoints = None
+        self.segments = None  # the tokens after each checkpoint
+        self.shifts = None  # rows to add to the tokens of each segment
+
+    def scan(self, state, end=None, offset=0):
+        '''(checkpoints, segments, index, rows) of the source from `state`
+
+        With an `end` the scan stops at the first line from there on where
+        the state is that of the old checkpoint `offset` lower: `index` is
+        the index of that checkpoint and `rows` the lines it moved down.
+        '''
+        checkpoints = [state]
+        tokens = []
+        index = rows = None
+        if end is not None:
+            old = dict((cp.offset, i)
+                for i, cp in enumerate(self.checkpoints))
+        seen = 1
+        for tk in scan(self.source, state=state, checkpoints=checkpoints):
+            if end is not None:
+                for cp in checkpoints[seen:]:
+                    if cp.offset < end:
+                        continue
+                    i = old.get(cp.offset - offset, None)
+                    if i is not None and self.checkpoints[i][2:] == cp[2:]:
+                        index = i
+                        rows = cp.row - self.checkpoints[i].row
+                        del checkpoints[checkpoints.index(cp):]
+                        break
+                seen = len(checkpoints)
+                if index is not None:
+                    break
+            tokens.append(tk)
+
+        # keep one checkpoint every `every` lines and split the tokens
+        kept = [state]
+        for cp in checkpoints[1:]:
+            if cp.row >= kept[-1].row + self.every:
+                kept.append(cp)
+        starts = [cp.row for cp in kept]
+        segments = [[] for cp in kept]
+        i = 0
+        for tk in tokens:
+            if i + 1 < len(starts) and tk[2][0] >= starts[i + 1]:
+                i = bisect_right(starts, tk[2][0]) - 1
+            segments[i].append(tk)
+        return kept, segments, index, rows
+
+    def tokenize(self):
+        start = Checkpoint(1, 0, (0,), 0, True)
+        self.checkpoints, self.segments = self.scan(start)[:2]
+        self.shifts = [0] * len(self.segments)
+
+    def edit(self, edits):
+        '''apply (start, end, text) edits given as offsets in the source
+
+        Returns the (first, end) range of the lines of the new source that
+        were tokenized again, with an end of None for all the lines after
+        first. If it doesn't tokenize the error is raised, and the whole
+        source is tokenized again on the next use.
+        '''
+        self.source, lo, hi, delta = apply_edits(self.source, edits)
+        if self.checkpoints is None:
+            self.tokenize()
+            return 1, None
+        checkpoints = self.checkpoints
+        first = bisect_right([cp.offset for cp in checkpoints], lo) - 1
+        try:
+            kept, segments, index, rows = self.scan(checkpoints[first],
+                hi + delta, delta)
+        except (TokenError, SyntaxError):
+            self.checkpoints = self.segments = self.shifts = None
+            raise
+        shifts = [0] * len(segments)
+        if index is None:
+            end = None
+            self.checkpoints = checkpoints[:first] + kept
+            self.segments = self.segments[:first] + segments
+            self.shifts = self.shifts[:first] + shifts
+        else:
+            end = checkpoints[index].row + rows
+            self.checkpoints = checkpoints[:first] + kept + [
+                cp._replace(row=cp.row + rows, offset=cp.offset + delta)
+                for cp in checkpoints[index:]]
+            self.segments = self.segments[:first] + segments + \
+                self.segments[index:]
+            self.shifts = self.shifts[:first] + shifts + [
+                n + rows for n in self.shifts[index:]]
+        return checkpoints[first].row, end
+
+    def __iter__(self):
+        if self.checkpoints is None:
+            self.tokenize()
+        segments, shifts = self.segments, self.shifts
+        for i in range(len(segments)):
+            if shifts[i]:
+                segments[i] = shift(segments[i], shifts[i])
+                shifts[i] = 0
+            for tk in segments[i]:
+                yield tk
@@ -0,0 +1,84 @@
+'''parsing in forked worker processes that share the parent's tables'''
+import gc
+import multiprocessing
+from .pygrammar import grammar
+from .ast_builder import ASTBuilder
+
+
+_preloaded = False
+
+
+def preload():
+    '''load everything parsing and building asts needs before forking
+
+    The tables are hydrated from their snapshot, so the bulk of them is
+    array buffers that no refcount or GC pass ever writes to. Everything
+    alive is then moved to the permanent GC generation: collections in
+    the children don't traverse it, which would write to every object's
+    header and copy the pages holding the parent's objects. Only the first
+    call in a process does this.
+    '''
+    global _preloaded
+    if _preloaded:
+        return
+    _preloaded = True
+    tables = grammar.tables
+    tables.actions
+    ASTBuilder.handlers
+    gc.collect()
+    gc.freeze()
+
+
+def _init_worker(func, recover):
+    global _func, _recover
+    _func = func
+    _recover = recover
+
+
+def _build(task):
+    src, path = task
+    src = grammar.parse(src, path, recover=_recover)
+    return _func(ASTBuilder(src, recover=_recover))
+
+
+def _ast(builder):
+    return builder.ast
+
+
+class ParsePool(object):
+    '''pool of worker processes, forked after preload() with `freeze`
+
+    Every source is parsed and built by an ASTBuilder in a worker, and
+    `func(builder)` (by default the ast) is sent back. `func` is inherited
+    by the fork, so it doesn't have to be picklable, but its result does.
+    '''
+    def __init__(self, processes=None, func=None, recover=False,
+            freeze=True):
+        if freeze:
+            preload()
+        if func is None:
+            func = _ast
+        self.pool = multiprocessing.get_context('fork').Pool(processes,
+            _init_worker, (func, recover))
+
+    def imap(self, srcs=None, paths=None, chunksize=1):
+        '''results for `srcs` or `paths`, in order'''
+        if paths is not None:
+            tasks = [(None, path) for path in paths]
+        else:
+            tasks = [(src, None) for src in srcs]
+        return self.pool.imap(_build, tasks, chunksize)
+
+    def map(self, srcs=None, paths=None, chunksize=1):
+        return list(self.imap(srcs, paths, chunksize))
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.pool.terminate()
+        self.pool.join()
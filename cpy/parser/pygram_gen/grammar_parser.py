@@ -1,4 +1,5 @@
 import tokenize
+import time
 from ..grammar.nfa import NFA
 import six
 from ..grammar.state import STATE_LABEL, Label, State, States
@@ -12,8 +13,12 @@ class GrammarSyntaxError(Exception):
 
 
 class GrammarParser(object):
-    '''Python Grammar Parser'''
-    def __init__(self, gramsrc):
+    '''Python Grammar Parser
+
+    With `starts` only the rules reachable from them are kept (and only
+    those in `allow` if given), see States.subset.
+    '''
+    def __init__(self, gramsrc, starts=None, allow=None):
         self.type = tokenize.ENDMARKER
         self.val = ''
         self.range = ((0, 0), (0, 0))
@@ -23,6 +28,8 @@ class GrammarParser(object):
         stream = six.StringIO(gramsrc)
         self.tokens = tokenize.generate_tokens(stream.readline)
         self.parse(gramsrc)
+        if starts is not None:
+            self.states = self.states.subset(starts, allow)
 
     def next(self):
         #extract next token
@@ -53,13 +60,17 @@ class GrammarParser(object):
         return self.type == type and self.val == val
 
     def parse(self, gramsrc):
+        self.timings = OrderedDict()  # rule name -> stats of NFA.DFA
         self.next()
         while self.type != tokenize.ENDMARKER:
             while self.type == tokenize.NEWLINE:
                 self.next()
+            t = time.time()
             name, start_state, end_state = self.parse_rule()
-            dfa = start_state.DFA(end_state)
+            stats = {'parse': time.time() - t}
+            dfa = start_state.DFA(end_state, stats)
             self.dfas[name] = dfa
+            self.timings[name] = stats
         '''for name, dfa in self.dfas.items():
             self.dfa2state(dfa)
         for state in self.states.values():
@@ -73,6 +84,19 @@ class GrammarParser(object):
         self.states.from_dfas(self.dfas)
         self.states.build_bootstrap()
 
+    def timing_report(self, limit=None):
+        '''per rule state counts and build times, slowest first'''
+        rows = sorted(self.timings.items(), key=lambda item: -(
+            item[1]['parse'] + item[1]['subset'] + item[1]['minimize']))
+        lines = ['%-20s %6s %6s %6s %9s %9s %9s' % ('rule', 'nfa', 'dfa',
+            'min', 'parse', 'subset', 'minimize')]
+        for name, stats in rows[:limit]:
+            lines.append('%-20s %6d %6d %6d %8.2fms %8.2fms %8.2fms' % (
+                name, stats['nfa'], stats['dfa'], stats['min'],
+                stats['parse'] * 1000, stats['subset'] * 1000,
+                stats['minimize'] * 1000))
+        return '\n'.join(lines) + '\n'
+
     def dfa2state(self, dfa):
         if isinstance(dfa, list):
             dfa = dfa[0]
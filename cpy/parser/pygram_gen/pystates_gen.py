@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 if __name__ == '__main__':
+    import argparse
     import os
     import sys
 
@@ -8,7 +9,33 @@ if __name__ == '__main__':
     sys.path.insert(0, os.path.realpath(os.path.join(thisdir, '../../../')))
     from cpy.parser.pygram_gen.grammar_parser import GrammarParser
 
+    argparser = argparse.ArgumentParser(
+        description='generate pystates.py and pytables.py, or with '
+        '--start the tables of a subset of the grammar')
+    argparser.add_argument('--start', nargs='+',
+        help='start symbols of the subset')
+    argparser.add_argument('--allow', nargs='+',
+        help='rules the subset may use besides the start symbols')
+    argparser.add_argument('--output', help='tables module of the subset')
+    argparser.add_argument('--timings', action='store_true',
+        help='print the build time of every rule to stderr')
+    args = argparser.parse_args()
+
     g = GrammarParser(open(os.path.join(thisdir, 'Grammar3.3')).read())
+    if args.timings:
+        sys.stderr.write(g.timing_report())
+    if args.start:
+        source = g.states.generate_tables(args.start, args.allow, True)
+        if args.output:
+            open(args.output, 'w').write(source)
+        else:
+            sys.stdout.write(source)
+        exit(0)
     open(os.path.join(thisdir, '..', 'pystates.py'), 'w').write(
         g.states.generate())
+    tables = g.states.tables(['single_input', 'file_input', 'eval_input'])
+    with open(os.path.join(thisdir, '..', 'pytables.tables'), 'wb') as f:
+        tables.dump(f)
+    open(os.path.join(thisdir, '..', 'pytables.py'), 'w').write(
+        tables.generate('pytables.tables'))
     exit(0)
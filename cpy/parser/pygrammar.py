@@ -1,8 +1,5 @@
 from .grammar import Grammar
-from .pystates import single_input, file_input, eval_input, symbols
+from .pytables import symbols, tables
 
 
-grammar = Grammar(symbols, {
-    'single_input': single_input,
-    'file_input': file_input,
-    'eval_input': eval_input})
+grammar = Grammar(symbols, tables=tables)
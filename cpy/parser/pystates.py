@@ -0,0 +1,4306 @@
+# generated by cpy.parser.state.States
+from .grammar.state import State, Label
+from .grammar.symbols import Symbols
+
+
+class _Symbols(Symbols):
+    single_input = 257
+    file_input = 258
+    eval_input = 259
+    decorator = 260
+    decorators = 261
+    decorated = 262
+    funcdef = 263
+    parameters = 264
+    typedargslist = 265
+    tfpdef = 266
+    varargslist = 267
+    vfpdef = 268
+    stmt = 269
+    simple_stmt = 270
+    small_stmt = 271
+    expr_stmt = 272
+    testlist_star_expr = 273
+    augassign = 274
+    del_stmt = 275
+    pass_stmt = 276
+    flow_stmt = 277
+    break_stmt = 278
+    continue_stmt = 279
+    return_stmt = 280
+    yield_stmt = 281
+    raise_stmt = 282
+    import_stmt = 283
+    import_name = 284
+    import_from = 285
+    import_as_name = 286
+    dotted_as_name = 287
+    import_as_names = 288
+    dotted_as_names = 289
+    dotted_name = 290
+    global_stmt = 291
+    nonlocal_stmt = 292
+    assert_stmt = 293
+    compound_stmt = 294
+    if_stmt = 295
+    while_stmt = 296
+    for_stmt = 297
+    try_stmt = 298
+    with_stmt = 299
+    with_item = 300
+    except_clause = 301
+    suite = 302
+    test = 303
+    test_nocond = 304
+    lambdef = 305
+    lambdef_nocond = 306
+    or_test = 307
+    and_test = 308
+    not_test = 309
+    comparison = 310
+    comp_op = 311
+    star_expr = 312
+    expr = 313
+    xor_expr = 314
+    and_expr = 315
+    shift_expr = 316
+    arith_expr = 317
+    term = 318
+    factor = 319
+    power = 320
+    atom = 321
+    testlist_comp = 322
+    trailer = 323
+    subscriptlist = 324
+    subscript = 325
+    sliceop = 326
+    exprlist = 327
+    testlist = 328
+    dictorsetmaker = 329
+    classdef = 330
+    arglist = 331
+    argument = 332
+    comp_iter = 333
+    comp_for = 334
+    comp_if = 335
+    encoding_decl = 336
+    yield_expr = 337
+    yield_arg = 338
+symbols = _Symbols()
+
+
+single_input = State(False, 'single_input', 257)
+file_input = State(False, 'file_input', 258)
+eval_input = State(False, 'eval_input', 259)
+decorator = State(False, 'decorator', 260)
+decorators = State(False, 'decorators', 261)
+decorated = State(False, 'decorated', 262)
+funcdef = State(False, 'funcdef', 263)
+parameters = State(False, 'parameters', 264)
+typedargslist = State(False, 'typedargslist', 265)
+tfpdef = State(False, 'tfpdef', 266)
+varargslist = State(False, 'varargslist', 267)
+vfpdef = State(False, 'vfpdef', 268)
+stmt = State(False, 'stmt', 269)
+simple_stmt = State(False, 'simple_stmt', 270)
+small_stmt = State(False, 'small_stmt', 271)
+expr_stmt = State(False, 'expr_stmt', 272)
+testlist_star_expr = State(False, 'testlist_star_expr', 273)
+augassign = State(False, 'augassign', 274)
+del_stmt = State(False, 'del_stmt', 275)
+pass_stmt = State(False, 'pass_stmt', 276)
+flow_stmt = State(False, 'flow_stmt', 277)
+break_stmt = State(False, 'break_stmt', 278)
+continue_stmt = State(False, 'continue_stmt', 279)
+return_stmt = State(False, 'return_stmt', 280)
+yield_stmt = State(False, 'yield_stmt', 281)
+raise_stmt = State(False, 'raise_stmt', 282)
+import_stmt = State(False, 'import_stmt', 283)
+import_name = State(False, 'import_name', 284)
+import_from = State(False, 'import_from', 285)
+import_as_name = State(False, 'import_as_name', 286)
+dotted_as_name = State(False, 'dotted_as_name', 287)
+import_as_names = State(False, 'import_as_names', 288)
+dotted_as_names = State(False, 'dotted_as_names', 289)
+dotted_name = State(False, 'dotted_name', 290)
+global_stmt = State(False, 'global_stmt', 291)
+nonlocal_stmt = State(False, 'nonlocal_stmt', 292)
+assert_stmt = State(False, 'assert_stmt', 293)
+compound_stmt = State(False, 'compound_stmt', 294)
+if_stmt = State(False, 'if_stmt', 295)
+while_stmt = State(False, 'while_stmt', 296)
+for_stmt = State(False, 'for_stmt', 297)
+try_stmt = State(False, 'try_stmt', 298)
+with_stmt = State(False, 'with_stmt', 299)
+with_item = State(False, 'with_item', 300)
+except_clause = State(False, 'except_clause', 301)
+suite = State(False, 'suite', 302)
+test = State(False, 'test', 303)
+test_nocond = State(False, 'test_nocond', 304)
+lambdef = State(False, 'lambdef', 305)
+lambdef_nocond = State(False, 'lambdef_nocond', 306)
+or_test = State(False, 'or_test', 307)
+and_test = State(False, 'and_test', 308)
+not_test = State(False, 'not_test', 309)
+comparison = State(False, 'comparison', 310)
+comp_op = State(False, 'comp_op', 311)
+star_expr = State(False, 'star_expr', 312)
+expr = State(False, 'expr', 313)
+xor_expr = State(False, 'xor_expr', 314)
+and_expr = State(False, 'and_expr', 315)
+shift_expr = State(False, 'shift_expr', 316)
+arith_expr = State(False, 'arith_expr', 317)
+term = State(False, 'term', 318)
+factor = State(False, 'factor', 319)
+power = State(False, 'power', 320)
+atom = State(False, 'atom', 321)
+testlist_comp = State(False, 'testlist_comp', 322)
+trailer = State(False, 'trailer', 323)
+subscriptlist = State(False, 'subscriptlist', 324)
+subscript = State(False, 'subscript', 325)
+sliceop = State(False, 'sliceop', 326)
+exprlist = State(False, 'exprlist', 327)
+testlist = State(False, 'testlist', 328)
+dictorsetmaker = State(False, 'dictorsetmaker', 329)
+classdef = State(False, 'classdef', 330)
+arglist = State(False, 'arglist', 331)
+argument = State(False, 'argument', 332)
+comp_iter = State(False, 'comp_iter', 333)
+comp_for = State(False, 'comp_for', 334)
+comp_if = State(False, 'comp_if', 335)
+encoding_decl = State(False, 'encoding_decl', 336)
+yield_expr = State(False, 'yield_expr', 337)
+yield_arg = State(False, 'yield_arg', 338)
+
+
+single_input0 = single_input
+single_input1 = State(True)
+single_input1.bootstrap = {}
+single_input0.arc(Label(4, None), single_input1)
+single_input0.arc(Label(256, simple_stmt), single_input1)
+single_input2 = State(False)
+single_input2.arc(Label(4, None), single_input1)
+single_input2.bootstrap = {
+    4: {
+        None: (None, single_input1),},}
+single_input0.arc(Label(256, compound_stmt), single_input2)
+single_input0.bootstrap = {
+    4: {
+        None: (None, single_input1),},
+    1: {
+        'not': (simple_stmt, single_input1),
+        None: (simple_stmt, single_input1),
+        'None': (simple_stmt, single_input1),
+        'True': (simple_stmt, single_input1),
+        'False': (simple_stmt, single_input1),
+        'lambda': (simple_stmt, single_input1),
+        'del': (simple_stmt, single_input1),
+        'pass': (simple_stmt, single_input1),
+        'break': (simple_stmt, single_input1),
+        'continue': (simple_stmt, single_input1),
+        'return': (simple_stmt, single_input1),
+        'raise': (simple_stmt, single_input1),
+        'yield': (simple_stmt, single_input1),
+        'import': (simple_stmt, single_input1),
+        'from': (simple_stmt, single_input1),
+        'global': (simple_stmt, single_input1),
+        'nonlocal': (simple_stmt, single_input1),
+        'assert': (simple_stmt, single_input1),
+        'if': (compound_stmt, single_input2),
+        'while': (compound_stmt, single_input2),
+        'for': (compound_stmt, single_input2),
+        'try': (compound_stmt, single_input2),
+        'with': (compound_stmt, single_input2),
+        'def': (compound_stmt, single_input2),
+        'class': (compound_stmt, single_input2),},
+    54: {
+        '+': (simple_stmt, single_input1),
+        '-': (simple_stmt, single_input1),
+        '~': (simple_stmt, single_input1),
+        '(': (simple_stmt, single_input1),
+        '[': (simple_stmt, single_input1),
+        '{': (simple_stmt, single_input1),
+        '...': (simple_stmt, single_input1),
+        '*': (simple_stmt, single_input1),
+        '@': (compound_stmt, single_input2),},
+    2: {
+        None: (simple_stmt, single_input1),},
+    3: {
+        None: (simple_stmt, single_input1),},}
+
+
+file_input0 = file_input
+file_input0.arc(Label(4, None), file_input0)
+file_input0.arc(Label(256, stmt), file_input0)
+file_input1 = State(True)
+file_input1.bootstrap = {}
+file_input0.arc(Label(0, None), file_input1)
+file_input0.bootstrap = {
+    4: {
+        None: (None, file_input0),},
+    1: {
+        'not': (stmt, file_input0),
+        None: (stmt, file_input0),
+        'None': (stmt, file_input0),
+        'True': (stmt, file_input0),
+        'False': (stmt, file_input0),
+        'lambda': (stmt, file_input0),
+        'del': (stmt, file_input0),
+        'pass': (stmt, file_input0),
+        'break': (stmt, file_input0),
+        'continue': (stmt, file_input0),
+        'return': (stmt, file_input0),
+        'raise': (stmt, file_input0),
+        'yield': (stmt, file_input0),
+        'import': (stmt, file_input0),
+        'from': (stmt, file_input0),
+        'global': (stmt, file_input0),
+        'nonlocal': (stmt, file_input0),
+        'assert': (stmt, file_input0),
+        'if': (stmt, file_input0),
+        'while': (stmt, file_input0),
+        'for': (stmt, file_input0),
+        'try': (stmt, file_input0),
+        'with': (stmt, file_input0),
+        'def': (stmt, file_input0),
+        'class': (stmt, file_input0),},
+    54: {
+        '+': (stmt, file_input0),
+        '-': (stmt, file_input0),
+        '~': (stmt, file_input0),
+        '(': (stmt, file_input0),
+        '[': (stmt, file_input0),
+        '{': (stmt, file_input0),
+        '...': (stmt, file_input0),
+        '*': (stmt, file_input0),
+        '@': (stmt, file_input0),},
+    2: {
+        None: (stmt, file_input0),},
+    3: {
+        None: (stmt, file_input0),},
+    0: {
+        None: (None, file_input1),},}
+
+
+eval_input0 = eval_input
+eval_input1 = State(False)
+eval_input1.arc(Label(4, None), eval_input1)
+eval_input2 = State(True)
+eval_input2.bootstrap = {}
+eval_input1.arc(Label(0, None), eval_input2)
+eval_input1.bootstrap = {
+    4: {
+        None: (None, eval_input1),},
+    0: {
+        None: (None, eval_input2),},}
+eval_input0.arc(Label(256, testlist), eval_input1)
+eval_input0.bootstrap = {
+    1: {
+        'not': (testlist, eval_input1),
+        None: (testlist, eval_input1),
+        'None': (testlist, eval_input1),
+        'True': (testlist, eval_input1),
+        'False': (testlist, eval_input1),
+        'lambda': (testlist, eval_input1),},
+    54: {
+        '+': (testlist, eval_input1),
+        '-': (testlist, eval_input1),
+        '~': (testlist, eval_input1),
+        '(': (testlist, eval_input1),
+        '[': (testlist, eval_input1),
+        '{': (testlist, eval_input1),
+        '...': (testlist, eval_input1),},
+    2: {
+        None: (testlist, eval_input1),},
+    3: {
+        None: (testlist, eval_input1),},}
+
+
+decorator0 = decorator
+decorator1 = State(False)
+decorator2 = State(False)
+decorator3 = State(False)
+decorator4 = State(False)
+decorator5 = State(False)
+decorator6 = State(True)
+decorator6.bootstrap = {}
+decorator5.arc(Label(4, None), decorator6)
+decorator5.bootstrap = {
+    4: {
+        None: (None, decorator6),},}
+decorator4.arc(Label(54, ')'), decorator5)
+decorator4.bootstrap = {
+    54: {
+        ')': (None, decorator5),},}
+decorator3.arc(Label(256, arglist), decorator4)
+decorator3.arc(Label(54, ')'), decorator5)
+decorator3.bootstrap = {
+    1: {
+        'not': (arglist, decorator4),
+        None: (arglist, decorator4),
+        'None': (arglist, decorator4),
+        'True': (arglist, decorator4),
+        'False': (arglist, decorator4),
+        'lambda': (arglist, decorator4),},
+    54: {
+        '+': (arglist, decorator4),
+        '-': (arglist, decorator4),
+        '~': (arglist, decorator4),
+        '(': (arglist, decorator4),
+        '[': (arglist, decorator4),
+        '{': (arglist, decorator4),
+        '...': (arglist, decorator4),
+        '*': (arglist, decorator4),
+        '**': (arglist, decorator4),
+        ')': (None, decorator5),},
+    2: {
+        None: (arglist, decorator4),},
+    3: {
+        None: (arglist, decorator4),},}
+decorator2.arc(Label(54, '('), decorator3)
+decorator2.arc(Label(4, None), decorator6)
+decorator2.bootstrap = {
+    54: {
+        '(': (None, decorator3),},
+    4: {
+        None: (None, decorator6),},}
+decorator1.arc(Label(256, dotted_name), decorator2)
+decorator1.bootstrap = {
+    1: {
+        None: (dotted_name, decorator2),},}
+decorator0.arc(Label(54, '@'), decorator1)
+decorator0.bootstrap = {
+    54: {
+        '@': (None, decorator1),},}
+
+
+decorators0 = decorators
+decorators1 = State(True)
+decorators1.arc(Label(256, decorator), decorators1)
+decorators1.bootstrap = {
+    54: {
+        '@': (decorator, decorators1),},}
+decorators0.arc(Label(256, decorator), decorators1)
+decorators0.bootstrap = {
+    54: {
+        '@': (decorator, decorators1),},}
+
+
+decorated0 = decorated
+decorated1 = State(False)
+decorated2 = State(True)
+decorated2.bootstrap = {}
+decorated1.arc(Label(256, classdef), decorated2)
+decorated1.arc(Label(256, funcdef), decorated2)
+decorated1.bootstrap = {
+    1: {
+        'class': (classdef, decorated2),
+        'def': (funcdef, decorated2),},}
+decorated0.arc(Label(256, decorators), decorated1)
+decorated0.bootstrap = {
+    54: {
+        '@': (decorators, decorated1),},}
+
+
+funcdef0 = funcdef
+funcdef1 = State(False)
+funcdef2 = State(False)
+funcdef3 = State(False)
+funcdef4 = State(False)
+funcdef5 = State(False)
+funcdef6 = State(False)
+funcdef7 = State(True)
+funcdef7.bootstrap = {}
+funcdef6.arc(Label(256, suite), funcdef7)
+funcdef6.bootstrap = {
+    1: {
+        'not': (suite, funcdef7),
+        None: (suite, funcdef7),
+        'None': (suite, funcdef7),
+        'True': (suite, funcdef7),
+        'False': (suite, funcdef7),
+        'lambda': (suite, funcdef7),
+        'del': (suite, funcdef7),
+        'pass': (suite, funcdef7),
+        'break': (suite, funcdef7),
+        'continue': (suite, funcdef7),
+        'return': (suite, funcdef7),
+        'raise': (suite, funcdef7),
+        'yield': (suite, funcdef7),
+        'import': (suite, funcdef7),
+        'from': (suite, funcdef7),
+        'global': (suite, funcdef7),
+        'nonlocal': (suite, funcdef7),
+        'assert': (suite, funcdef7),},
+    54: {
+        '+': (suite, funcdef7),
+        '-': (suite, funcdef7),
+        '~': (suite, funcdef7),
+        '(': (suite, funcdef7),
+        '[': (suite, funcdef7),
+        '{': (suite, funcdef7),
+        '...': (suite, funcdef7),
+        '*': (suite, funcdef7),},
+    2: {
+        None: (suite, funcdef7),},
+    3: {
+        None: (suite, funcdef7),},
+    4: {
+        None: (suite, funcdef7),},}
+funcdef5.arc(Label(54, ':'), funcdef6)
+funcdef5.bootstrap = {
+    54: {
+        ':': (None, funcdef6),},}
+funcdef4.arc(Label(256, test), funcdef5)
+funcdef4.bootstrap = {
+    1: {
+        'not': (test, funcdef5),
+        None: (test, funcdef5),
+        'None': (test, funcdef5),
+        'True': (test, funcdef5),
+        'False': (test, funcdef5),
+        'lambda': (test, funcdef5),},
+    54: {
+        '+': (test, funcdef5),
+        '-': (test, funcdef5),
+        '~': (test, funcdef5),
+        '(': (test, funcdef5),
+        '[': (test, funcdef5),
+        '{': (test, funcdef5),
+        '...': (test, funcdef5),},
+    2: {
+        None: (test, funcdef5),},
+    3: {
+        None: (test, funcdef5),},}
+funcdef3.arc(Label(54, '->'), funcdef4)
+funcdef3.arc(Label(54, ':'), funcdef6)
+funcdef3.bootstrap = {
+    54: {
+        '->': (None, funcdef4),
+        ':': (None, funcdef6),},}
+funcdef2.arc(Label(256, parameters), funcdef3)
+funcdef2.bootstrap = {
+    54: {
+        '(': (parameters, funcdef3),},}
+funcdef1.arc(Label(1, None), funcdef2)
+funcdef1.bootstrap = {
+    1: {
+        None: (None, funcdef2),},}
+funcdef0.arc(Label(1, 'def'), funcdef1)
+funcdef0.bootstrap = {
+    1: {
+        'def': (None, funcdef1),},}
+
+
+parameters0 = parameters
+parameters1 = State(False)
+parameters2 = State(False)
+parameters3 = State(True)
+parameters3.bootstrap = {}
+parameters2.arc(Label(54, ')'), parameters3)
+parameters2.bootstrap = {
+    54: {
+        ')': (None, parameters3),},}
+parameters1.arc(Label(256, typedargslist), parameters2)
+parameters1.arc(Label(54, ')'), parameters3)
+parameters1.bootstrap = {
+    1: {
+        None: (typedargslist, parameters2),},
+    54: {
+        '*': (typedargslist, parameters2),
+        '**': (typedargslist, parameters2),
+        ')': (None, parameters3),},}
+parameters0.arc(Label(54, '('), parameters1)
+parameters0.bootstrap = {
+    54: {
+        '(': (None, parameters1),},}
+
+
+typedargslist0 = typedargslist
+typedargslist1 = State(True)
+typedargslist2 = State(False)
+typedargslist3 = State(True)
+typedargslist4 = State(True)
+typedargslist4.arc(Label(256, tfpdef), typedargslist1)
+typedargslist5 = State(False)
+typedargslist6 = State(True)
+typedargslist7 = State(False)
+typedargslist8 = State(True)
+typedargslist8.arc(Label(54, ','), typedargslist7)
+typedargslist9 = State(False)
+typedargslist9.arc(Label(256, test), typedargslist6)
+typedargslist9.bootstrap = {
+    1: {
+        'not': (test, typedargslist6),
+        None: (test, typedargslist6),
+        'None': (test, typedargslist6),
+        'True': (test, typedargslist6),
+        'False': (test, typedargslist6),
+        'lambda': (test, typedargslist6),},
+    54: {
+        '+': (test, typedargslist6),
+        '-': (test, typedargslist6),
+        '~': (test, typedargslist6),
+        '(': (test, typedargslist6),
+        '[': (test, typedargslist6),
+        '{': (test, typedargslist6),
+        '...': (test, typedargslist6),},
+    2: {
+        None: (test, typedargslist6),},
+    3: {
+        None: (test, typedargslist6),},}
+typedargslist8.arc(Label(54, '='), typedargslist9)
+typedargslist8.bootstrap = {
+    54: {
+        ',': (None, typedargslist7),
+        '=': (None, typedargslist9),},}
+typedargslist7.arc(Label(256, tfpdef), typedargslist8)
+typedargslist10 = State(False)
+typedargslist11 = State(True)
+typedargslist11.bootstrap = {}
+typedargslist10.arc(Label(256, tfpdef), typedargslist11)
+typedargslist10.bootstrap = {
+    1: {
+        None: (tfpdef, typedargslist11),},}
+typedargslist7.arc(Label(54, '**'), typedargslist10)
+typedargslist7.bootstrap = {
+    1: {
+        None: (tfpdef, typedargslist8),},
+    54: {
+        '**': (None, typedargslist10),},}
+typedargslist6.arc(Label(54, ','), typedargslist7)
+typedargslist6.bootstrap = {
+    54: {
+        ',': (None, typedargslist7),},}
+typedargslist5.arc(Label(256, tfpdef), typedargslist6)
+typedargslist5.bootstrap = {
+    1: {
+        None: (tfpdef, typedargslist6),},}
+typedargslist4.arc(Label(54, '*'), typedargslist5)
+typedargslist4.arc(Label(54, '**'), typedargslist10)
+typedargslist4.bootstrap = {
+    1: {
+        None: (tfpdef, typedargslist1),},
+    54: {
+        '*': (None, typedargslist5),
+        '**': (None, typedargslist10),},}
+typedargslist3.arc(Label(54, ','), typedargslist4)
+typedargslist3.bootstrap = {
+    54: {
+        ',': (None, typedargslist4),},}
+typedargslist2.arc(Label(256, test), typedargslist3)
+typedargslist2.bootstrap = {
+    1: {
+        'not': (test, typedargslist3),
+        None: (test, typedargslist3),
+        'None': (test, typedargslist3),
+        'True': (test, typedargslist3),
+        'False': (test, typedargslist3),
+        'lambda': (test, typedargslist3),},
+    54: {
+        '+': (test, typedargslist3),
+        '-': (test, typedargslist3),
+        '~': (test, typedargslist3),
+        '(': (test, typedargslist3),
+        '[': (test, typedargslist3),
+        '{': (test, typedargslist3),
+        '...': (test, typedargslist3),},
+    2: {
+        None: (test, typedargslist3),},
+    3: {
+        None: (test, typedargslist3),},}
+typedargslist1.arc(Label(54, '='), typedargslist2)
+typedargslist1.arc(Label(54, ','), typedargslist4)
+typedargslist1.bootstrap = {
+    54: {
+        '=': (None, typedargslist2),
+        ',': (None, typedargslist4),},}
+typedargslist0.arc(Label(256, tfpdef), typedargslist1)
+typedargslist0.arc(Label(54, '*'), typedargslist5)
+typedargslist0.arc(Label(54, '**'), typedargslist10)
+typedargslist0.bootstrap = {
+    1: {
+        None: (tfpdef, typedargslist1),},
+    54: {
+        '*': (None, typedargslist5),
+        '**': (None, typedargslist10),},}
+
+
+tfpdef0 = tfpdef
+tfpdef1 = State(True)
+tfpdef2 = State(False)
+tfpdef3 = State(True)
+tfpdef3.bootstrap = {}
+tfpdef2.arc(Label(256, test), tfpdef3)
+tfpdef2.bootstrap = {
+    1: {
+        'not': (test, tfpdef3),
+        None: (test, tfpdef3),
+        'None': (test, tfpdef3),
+        'True': (test, tfpdef3),
+        'False': (test, tfpdef3),
+        'lambda': (test, tfpdef3),},
+    54: {
+        '+': (test, tfpdef3),
+        '-': (test, tfpdef3),
+        '~': (test, tfpdef3),
+        '(': (test, tfpdef3),
+        '[': (test, tfpdef3),
+        '{': (test, tfpdef3),
+        '...': (test, tfpdef3),},
+    2: {
+        None: (test, tfpdef3),},
+    3: {
+        None: (test, tfpdef3),},}
+tfpdef1.arc(Label(54, ':'), tfpdef2)
+tfpdef1.bootstrap = {
+    54: {
+        ':': (None, tfpdef2),},}
+tfpdef0.arc(Label(1, None), tfpdef1)
+tfpdef0.bootstrap = {
+    1: {
+        None: (None, tfpdef1),},}
+
+
+varargslist0 = varargslist
+varargslist1 = State(True)
+varargslist2 = State(False)
+varargslist3 = State(True)
+varargslist4 = State(True)
+varargslist4.arc(Label(256, vfpdef), varargslist1)
+varargslist5 = State(False)
+varargslist6 = State(True)
+varargslist7 = State(False)
+varargslist8 = State(True)
+varargslist8.arc(Label(54, ','), varargslist7)
+varargslist9 = State(False)
+varargslist9.arc(Label(256, test), varargslist6)
+varargslist9.bootstrap = {
+    1: {
+        'not': (test, varargslist6),
+        None: (test, varargslist6),
+        'None': (test, varargslist6),
+        'True': (test, varargslist6),
+        'False': (test, varargslist6),
+        'lambda': (test, varargslist6),},
+    54: {
+        '+': (test, varargslist6),
+        '-': (test, varargslist6),
+        '~': (test, varargslist6),
+        '(': (test, varargslist6),
+        '[': (test, varargslist6),
+        '{': (test, varargslist6),
+        '...': (test, varargslist6),},
+    2: {
+        None: (test, varargslist6),},
+    3: {
+        None: (test, varargslist6),},}
+varargslist8.arc(Label(54, '='), varargslist9)
+varargslist8.bootstrap = {
+    54: {
+        ',': (None, varargslist7),
+        '=': (None, varargslist9),},}
+varargslist7.arc(Label(256, vfpdef), varargslist8)
+varargslist10 = State(False)
+varargslist11 = State(True)
+varargslist11.bootstrap = {}
+varargslist10.arc(Label(256, vfpdef), varargslist11)
+varargslist10.bootstrap = {
+    1: {
+        None: (vfpdef, varargslist11),},}
+varargslist7.arc(Label(54, '**'), varargslist10)
+varargslist7.bootstrap = {
+    1: {
+        None: (vfpdef, varargslist8),},
+    54: {
+        '**': (None, varargslist10),},}
+varargslist6.arc(Label(54, ','), varargslist7)
+varargslist6.bootstrap = {
+    54: {
+        ',': (None, varargslist7),},}
+varargslist5.arc(Label(256, vfpdef), varargslist6)
+varargslist5.bootstrap = {
+    1: {
+        None: (vfpdef, varargslist6),},}
+varargslist4.arc(Label(54, '*'), varargslist5)
+varargslist4.arc(Label(54, '**'), varargslist10)
+varargslist4.bootstrap = {
+    1: {
+        None: (vfpdef, varargslist1),},
+    54: {
+        '*': (None, varargslist5),
+        '**': (None, varargslist10),},}
+varargslist3.arc(Label(54, ','), varargslist4)
+varargslist3.bootstrap = {
+    54: {
+        ',': (None, varargslist4),},}
+varargslist2.arc(Label(256, test), varargslist3)
+varargslist2.bootstrap = {
+    1: {
+        'not': (test, varargslist3),
+        None: (test, varargslist3),
+        'None': (test, varargslist3),
+        'True': (test, varargslist3),
+        'False': (test, varargslist3),
+        'lambda': (test, varargslist3),},
+    54: {
+        '+': (test, varargslist3),
+        '-': (test, varargslist3),
+        '~': (test, varargslist3),
+        '(': (test, varargslist3),
+        '[': (test, varargslist3),
+        '{': (test, varargslist3),
+        '...': (test, varargslist3),},
+    2: {
+        None: (test, varargslist3),},
+    3: {
+        None: (test, varargslist3),},}
+varargslist1.arc(Label(54, '='), varargslist2)
+varargslist1.arc(Label(54, ','), varargslist4)
+varargslist1.bootstrap = {
+    54: {
+        '=': (None, varargslist2),
+        ',': (None, varargslist4),},}
+varargslist0.arc(Label(256, vfpdef), varargslist1)
+varargslist0.arc(Label(54, '*'), varargslist5)
+varargslist0.arc(Label(54, '**'), varargslist10)
+varargslist0.bootstrap = {
+    1: {
+        None: (vfpdef, varargslist1),},
+    54: {
+        '*': (None, varargslist5),
+        '**': (None, varargslist10),},}
+
+
+vfpdef0 = vfpdef
+vfpdef1 = State(True)
+vfpdef1.bootstrap = {}
+vfpdef0.arc(Label(1, None), vfpdef1)
+vfpdef0.bootstrap = {
+    1: {
+        None: (None, vfpdef1),},}
+
+
+stmt0 = stmt
+stmt1 = State(True)
+stmt1.bootstrap = {}
+stmt0.arc(Label(256, simple_stmt), stmt1)
+stmt0.arc(Label(256, compound_stmt), stmt1)
+stmt0.bootstrap = {
+    1: {
+        'not': (simple_stmt, stmt1),
+        None: (simple_stmt, stmt1),
+        'None': (simple_stmt, stmt1),
+        'True': (simple_stmt, stmt1),
+        'False': (simple_stmt, stmt1),
+        'lambda': (simple_stmt, stmt1),
+        'del': (simple_stmt, stmt1),
+        'pass': (simple_stmt, stmt1),
+        'break': (simple_stmt, stmt1),
+        'continue': (simple_stmt, stmt1),
+        'return': (simple_stmt, stmt1),
+        'raise': (simple_stmt, stmt1),
+        'yield': (simple_stmt, stmt1),
+        'import': (simple_stmt, stmt1),
+        'from': (simple_stmt, stmt1),
+        'global': (simple_stmt, stmt1),
+        'nonlocal': (simple_stmt, stmt1),
+        'assert': (simple_stmt, stmt1),
+        'if': (compound_stmt, stmt1),
+        'while': (compound_stmt, stmt1),
+        'for': (compound_stmt, stmt1),
+        'try': (compound_stmt, stmt1),
+        'with': (compound_stmt, stmt1),
+        'def': (compound_stmt, stmt1),
+        'class': (compound_stmt, stmt1),},
+    54: {
+        '+': (simple_stmt, stmt1),
+        '-': (simple_stmt, stmt1),
+        '~': (simple_stmt, stmt1),
+        '(': (simple_stmt, stmt1),
+        '[': (simple_stmt, stmt1),
+        '{': (simple_stmt, stmt1),
+        '...': (simple_stmt, stmt1),
+        '*': (simple_stmt, stmt1),
+        '@': (compound_stmt, stmt1),},
+    2: {
+        None: (simple_stmt, stmt1),},
+    3: {
+        None: (simple_stmt, stmt1),},}
+
+
+simple_stmt0 = simple_stmt
+simple_stmt1 = State(False)
+simple_stmt2 = State(False)
+simple_stmt2.arc(Label(256, small_stmt), simple_stmt1)
+simple_stmt3 = State(True)
+simple_stmt3.bootstrap = {}
+simple_stmt2.arc(Label(4, None), simple_stmt3)
+simple_stmt2.bootstrap = {
+    1: {
+        'not': (small_stmt, simple_stmt1),
+        None: (small_stmt, simple_stmt1),
+        'None': (small_stmt, simple_stmt1),
+        'True': (small_stmt, simple_stmt1),
+        'False': (small_stmt, simple_stmt1),
+        'lambda': (small_stmt, simple_stmt1),
+        'del': (small_stmt, simple_stmt1),
+        'pass': (small_stmt, simple_stmt1),
+        'break': (small_stmt, simple_stmt1),
+        'continue': (small_stmt, simple_stmt1),
+        'return': (small_stmt, simple_stmt1),
+        'raise': (small_stmt, simple_stmt1),
+        'yield': (small_stmt, simple_stmt1),
+        'import': (small_stmt, simple_stmt1),
+        'from': (small_stmt, simple_stmt1),
+        'global': (small_stmt, simple_stmt1),
+        'nonlocal': (small_stmt, simple_stmt1),
+        'assert': (small_stmt, simple_stmt1),},
+    54: {
+        '+': (small_stmt, simple_stmt1),
+        '-': (small_stmt, simple_stmt1),
+        '~': (small_stmt, simple_stmt1),
+        '(': (small_stmt, simple_stmt1),
+        '[': (small_stmt, simple_stmt1),
+        '{': (small_stmt, simple_stmt1),
+        '...': (small_stmt, simple_stmt1),
+        '*': (small_stmt, simple_stmt1),},
+    2: {
+        None: (small_stmt, simple_stmt1),},
+    3: {
+        None: (small_stmt, simple_stmt1),},
+    4: {
+        None: (None, simple_stmt3),},}
+simple_stmt1.arc(Label(54, ';'), simple_stmt2)
+simple_stmt1.arc(Label(4, None), simple_stmt3)
+simple_stmt1.bootstrap = {
+    54: {
+        ';': (None, simple_stmt2),},
+    4: {
+        None: (None, simple_stmt3),},}
+simple_stmt0.arc(Label(256, small_stmt), simple_stmt1)
+simple_stmt0.bootstrap = {
+    1: {
+        'not': (small_stmt, simple_stmt1),
+        None: (small_stmt, simple_stmt1),
+        'None': (small_stmt, simple_stmt1),
+        'True': (small_stmt, simple_stmt1),
+        'False': (small_stmt, simple_stmt1),
+        'lambda': (small_stmt, simple_stmt1),
+        'del': (small_stmt, simple_stmt1),
+        'pass': (small_stmt, simple_stmt1),
+        'break': (small_stmt, simple_stmt1),
+        'continue': (small_stmt, simple_stmt1),
+        'return': (small_stmt, simple_stmt1),
+        'raise': (small_stmt, simple_stmt1),
+        'yield': (small_stmt, simple_stmt1),
+        'import': (small_stmt, simple_stmt1),
+        'from': (small_stmt, simple_stmt1),
+        'global': (small_stmt, simple_stmt1),
+        'nonlocal': (small_stmt, simple_stmt1),
+        'assert': (small_stmt, simple_stmt1),},
+    54: {
+        '+': (small_stmt, simple_stmt1),
+        '-': (small_stmt, simple_stmt1),
+        '~': (small_stmt, simple_stmt1),
+        '(': (small_stmt, simple_stmt1),
+        '[': (small_stmt, simple_stmt1),
+        '{': (small_stmt, simple_stmt1),
+        '...': (small_stmt, simple_stmt1),
+        '*': (small_stmt, simple_stmt1),},
+    2: {
+        None: (small_stmt, simple_stmt1),},
+    3: {
+        None: (small_stmt, simple_stmt1),},}
+
+
+small_stmt0 = small_stmt
+small_stmt1 = State(True)
+small_stmt1.bootstrap = {}
+small_stmt0.arc(Label(256, expr_stmt), small_stmt1)
+small_stmt0.arc(Label(256, del_stmt), small_stmt1)
+small_stmt0.arc(Label(256, pass_stmt), small_stmt1)
+small_stmt0.arc(Label(256, flow_stmt), small_stmt1)
+small_stmt0.arc(Label(256, import_stmt), small_stmt1)
+small_stmt0.arc(Label(256, global_stmt), small_stmt1)
+small_stmt0.arc(Label(256, nonlocal_stmt), small_stmt1)
+small_stmt0.arc(Label(256, assert_stmt), small_stmt1)
+small_stmt0.bootstrap = {
+    1: {
+        'not': (expr_stmt, small_stmt1),
+        None: (expr_stmt, small_stmt1),
+        'None': (expr_stmt, small_stmt1),
+        'True': (expr_stmt, small_stmt1),
+        'False': (expr_stmt, small_stmt1),
+        'lambda': (expr_stmt, small_stmt1),
+        'del': (del_stmt, small_stmt1),
+        'pass': (pass_stmt, small_stmt1),
+        'break': (flow_stmt, small_stmt1),
+        'continue': (flow_stmt, small_stmt1),
+        'return': (flow_stmt, small_stmt1),
+        'raise': (flow_stmt, small_stmt1),
+        'yield': (flow_stmt, small_stmt1),
+        'import': (import_stmt, small_stmt1),
+        'from': (import_stmt, small_stmt1),
+        'global': (global_stmt, small_stmt1),
+        'nonlocal': (nonlocal_stmt, small_stmt1),
+        'assert': (assert_stmt, small_stmt1),},
+    54: {
+        '+': (expr_stmt, small_stmt1),
+        '-': (expr_stmt, small_stmt1),
+        '~': (expr_stmt, small_stmt1),
+        '(': (expr_stmt, small_stmt1),
+        '[': (expr_stmt, small_stmt1),
+        '{': (expr_stmt, small_stmt1),
+        '...': (expr_stmt, small_stmt1),
+        '*': (expr_stmt, small_stmt1),},
+    2: {
+        None: (expr_stmt, small_stmt1),},
+    3: {
+        None: (expr_stmt, small_stmt1),},}
+
+
+expr_stmt0 = expr_stmt
+expr_stmt1 = State(True)
+expr_stmt2 = State(False)
+expr_stmt3 = State(True)
+expr_stmt3.bootstrap = {}
+expr_stmt2.arc(Label(256, yield_expr), expr_stmt3)
+expr_stmt2.arc(Label(256, testlist), expr_stmt3)
+expr_stmt2.bootstrap = {
+    1: {
+        'yield': (yield_expr, expr_stmt3),
+        'not': (testlist, expr_stmt3),
+        None: (testlist, expr_stmt3),
+        'None': (testlist, expr_stmt3),
+        'True': (testlist, expr_stmt3),
+        'False': (testlist, expr_stmt3),
+        'lambda': (testlist, expr_stmt3),},
+    54: {
+        '+': (testlist, expr_stmt3),
+        '-': (testlist, expr_stmt3),
+        '~': (testlist, expr_stmt3),
+        '(': (testlist, expr_stmt3),
+        '[': (testlist, expr_stmt3),
+        '{': (testlist, expr_stmt3),
+        '...': (testlist, expr_stmt3),},
+    2: {
+        None: (testlist, expr_stmt3),},
+    3: {
+        None: (testlist, expr_stmt3),},}
+expr_stmt1.arc(Label(256, augassign), expr_stmt2)
+expr_stmt4 = State(False)
+expr_stmt5 = State(True)
+expr_stmt5.arc(Label(54, '='), expr_stmt4)
+expr_stmt5.bootstrap = {
+    54: {
+        '=': (None, expr_stmt4),},}
+expr_stmt4.arc(Label(256, yield_expr), expr_stmt5)
+expr_stmt4.arc(Label(256, testlist_star_expr), expr_stmt5)
+expr_stmt4.bootstrap = {
+    1: {
+        'yield': (yield_expr, expr_stmt5),
+        'not': (testlist_star_expr, expr_stmt5),
+        None: (testlist_star_expr, expr_stmt5),
+        'None': (testlist_star_expr, expr_stmt5),
+        'True': (testlist_star_expr, expr_stmt5),
+        'False': (testlist_star_expr, expr_stmt5),
+        'lambda': (testlist_star_expr, expr_stmt5),},
+    54: {
+        '+': (testlist_star_expr, expr_stmt5),
+        '-': (testlist_star_expr, expr_stmt5),
+        '~': (testlist_star_expr, expr_stmt5),
+        '(': (testlist_star_expr, expr_stmt5),
+        '[': (testlist_star_expr, expr_stmt5),
+        '{': (testlist_star_expr, expr_stmt5),
+        '...': (testlist_star_expr, expr_stmt5),
+        '*': (testlist_star_expr, expr_stmt5),},
+    2: {
+        None: (testlist_star_expr, expr_stmt5),},
+    3: {
+        None: (testlist_star_expr, expr_stmt5),},}
+expr_stmt1.arc(Label(54, '='), expr_stmt4)
+expr_stmt1.bootstrap = {
+    54: {
+        '+=': (augassign, expr_stmt2),
+        '-=': (augassign, expr_stmt2),
+        '*=': (augassign, expr_stmt2),
+        '/=': (augassign, expr_stmt2),
+        '%=': (augassign, expr_stmt2),
+        '&=': (augassign, expr_stmt2),
+        '|=': (augassign, expr_stmt2),
+        '^=': (augassign, expr_stmt2),
+        '<<=': (augassign, expr_stmt2),
+        '>>=': (augassign, expr_stmt2),
+        '**=': (augassign, expr_stmt2),
+        '//=': (augassign, expr_stmt2),
+        '=': (None, expr_stmt4),},}
+expr_stmt0.arc(Label(256, testlist_star_expr), expr_stmt1)
+expr_stmt0.bootstrap = {
+    1: {
+        'not': (testlist_star_expr, expr_stmt1),
+        None: (testlist_star_expr, expr_stmt1),
+        'None': (testlist_star_expr, expr_stmt1),
+        'True': (testlist_star_expr, expr_stmt1),
+        'False': (testlist_star_expr, expr_stmt1),
+        'lambda': (testlist_star_expr, expr_stmt1),},
+    54: {
+        '+': (testlist_star_expr, expr_stmt1),
+        '-': (testlist_star_expr, expr_stmt1),
+        '~': (testlist_star_expr, expr_stmt1),
+        '(': (testlist_star_expr, expr_stmt1),
+        '[': (testlist_star_expr, expr_stmt1),
+        '{': (testlist_star_expr, expr_stmt1),
+        '...': (testlist_star_expr, expr_stmt1),
+        '*': (testlist_star_expr, expr_stmt1),},
+    2: {
+        None: (testlist_star_expr, expr_stmt1),},
+    3: {
+        None: (testlist_star_expr, expr_stmt1),},}
+
+
+testlist_star_expr0 = testlist_star_expr
+testlist_star_expr1 = State(True)
+testlist_star_expr2 = State(True)
+testlist_star_expr2.arc(Label(256, test), testlist_star_expr1)
+testlist_star_expr2.arc(Label(256, star_expr), testlist_star_expr1)
+testlist_star_expr2.bootstrap = {
+    1: {
+        'not': (test, testlist_star_expr1),
+        None: (test, testlist_star_expr1),
+        'None': (test, testlist_star_expr1),
+        'True': (test, testlist_star_expr1),
+        'False': (test, testlist_star_expr1),
+        'lambda': (test, testlist_star_expr1),},
+    54: {
+        '+': (test, testlist_star_expr1),
+        '-': (test, testlist_star_expr1),
+        '~': (test, testlist_star_expr1),
+        '(': (test, testlist_star_expr1),
+        '[': (test, testlist_star_expr1),
+        '{': (test, testlist_star_expr1),
+        '...': (test, testlist_star_expr1),
+        '*': (star_expr, testlist_star_expr1),},
+    2: {
+        None: (test, testlist_star_expr1),},
+    3: {
+        None: (test, testlist_star_expr1),},}
+testlist_star_expr1.arc(Label(54, ','), testlist_star_expr2)
+testlist_star_expr1.bootstrap = {
+    54: {
+        ',': (None, testlist_star_expr2),},}
+testlist_star_expr0.arc(Label(256, test), testlist_star_expr1)
+testlist_star_expr0.arc(Label(256, star_expr), testlist_star_expr1)
+testlist_star_expr0.bootstrap = {
+    1: {
+        'not': (test, testlist_star_expr1),
+        None: (test, testlist_star_expr1),
+        'None': (test, testlist_star_expr1),
+        'True': (test, testlist_star_expr1),
+        'False': (test, testlist_star_expr1),
+        'lambda': (test, testlist_star_expr1),},
+    54: {
+        '+': (test, testlist_star_expr1),
+        '-': (test, testlist_star_expr1),
+        '~': (test, testlist_star_expr1),
+        '(': (test, testlist_star_expr1),
+        '[': (test, testlist_star_expr1),
+        '{': (test, testlist_star_expr1),
+        '...': (test, testlist_star_expr1),
+        '*': (star_expr, testlist_star_expr1),},
+    2: {
+        None: (test, testlist_star_expr1),},
+    3: {
+        None: (test, testlist_star_expr1),},}
+
+
+augassign0 = augassign
+augassign1 = State(True)
+augassign1.bootstrap = {}
+augassign0.arc(Label(54, '+='), augassign1)
+augassign0.arc(Label(54, '-='), augassign1)
+augassign0.arc(Label(54, '*='), augassign1)
+augassign0.arc(Label(54, '/='), augassign1)
+augassign0.arc(Label(54, '%='), augassign1)
+augassign0.arc(Label(54, '&='), augassign1)
+augassign0.arc(Label(54, '|='), augassign1)
+augassign0.arc(Label(54, '^='), augassign1)
+augassign0.arc(Label(54, '<<='), augassign1)
+augassign0.arc(Label(54, '>>='), augassign1)
+augassign0.arc(Label(54, '**='), augassign1)
+augassign0.arc(Label(54, '//='), augassign1)
+augassign0.bootstrap = {
+    54: {
+        '+=': (None, augassign1),
+        '-=': (None, augassign1),
+        '*=': (None, augassign1),
+        '/=': (None, augassign1),
+        '%=': (None, augassign1),
+        '&=': (None, augassign1),
+        '|=': (None, augassign1),
+        '^=': (None, augassign1),
+        '<<=': (None, augassign1),
+        '>>=': (None, augassign1),
+        '**=': (None, augassign1),
+        '//=': (None, augassign1),},}
+
+
+del_stmt0 = del_stmt
+del_stmt1 = State(False)
+del_stmt2 = State(True)
+del_stmt2.bootstrap = {}
+del_stmt1.arc(Label(256, exprlist), del_stmt2)
+del_stmt1.bootstrap = {
+    54: {
+        '+': (exprlist, del_stmt2),
+        '-': (exprlist, del_stmt2),
+        '~': (exprlist, del_stmt2),
+        '(': (exprlist, del_stmt2),
+        '[': (exprlist, del_stmt2),
+        '{': (exprlist, del_stmt2),
+        '...': (exprlist, del_stmt2),
+        '*': (exprlist, del_stmt2),},
+    1: {
+        None: (exprlist, del_stmt2),
+        'None': (exprlist, del_stmt2),
+        'True': (exprlist, del_stmt2),
+        'False': (exprlist, del_stmt2),},
+    2: {
+        None: (exprlist, del_stmt2),},
+    3: {
+        None: (exprlist, del_stmt2),},}
+del_stmt0.arc(Label(1, 'del'), del_stmt1)
+del_stmt0.bootstrap = {
+    1: {
+        'del': (None, del_stmt1),},}
+
+
+pass_stmt0 = pass_stmt
+pass_stmt1 = State(True)
+pass_stmt1.bootstrap = {}
+pass_stmt0.arc(Label(1, 'pass'), pass_stmt1)
+pass_stmt0.bootstrap = {
+    1: {
+        'pass': (None, pass_stmt1),},}
+
+
+flow_stmt0 = flow_stmt
+flow_stmt1 = State(True)
+flow_stmt1.bootstrap = {}
+flow_stmt0.arc(Label(256, break_stmt), flow_stmt1)
+flow_stmt0.arc(Label(256, continue_stmt), flow_stmt1)
+flow_stmt0.arc(Label(256, return_stmt), flow_stmt1)
+flow_stmt0.arc(Label(256, raise_stmt), flow_stmt1)
+flow_stmt0.arc(Label(256, yield_stmt), flow_stmt1)
+flow_stmt0.bootstrap = {
+    1: {
+        'break': (break_stmt, flow_stmt1),
+        'continue': (continue_stmt, flow_stmt1),
+        'return': (return_stmt, flow_stmt1),
+        'raise': (raise_stmt, flow_stmt1),
+        'yield': (yield_stmt, flow_stmt1),},}
+
+
+break_stmt0 = break_stmt
+break_stmt1 = State(True)
+break_stmt1.bootstrap = {}
+break_stmt0.arc(Label(1, 'break'), break_stmt1)
+break_stmt0.bootstrap = {
+    1: {
+        'break': (None, break_stmt1),},}
+
+
+continue_stmt0 = continue_stmt
+continue_stmt1 = State(True)
+continue_stmt1.bootstrap = {}
+continue_stmt0.arc(Label(1, 'continue'), continue_stmt1)
+continue_stmt0.bootstrap = {
+    1: {
+        'continue': (None, continue_stmt1),},}
+
+
+return_stmt0 = return_stmt
+return_stmt1 = State(True)
+return_stmt2 = State(True)
+return_stmt2.bootstrap = {}
+return_stmt1.arc(Label(256, testlist), return_stmt2)
+return_stmt1.bootstrap = {
+    1: {
+        'not': (testlist, return_stmt2),
+        None: (testlist, return_stmt2),
+        'None': (testlist, return_stmt2),
+        'True': (testlist, return_stmt2),
+        'False': (testlist, return_stmt2),
+        'lambda': (testlist, return_stmt2),},
+    54: {
+        '+': (testlist, return_stmt2),
+        '-': (testlist, return_stmt2),
+        '~': (testlist, return_stmt2),
+        '(': (testlist, return_stmt2),
+        '[': (testlist, return_stmt2),
+        '{': (testlist, return_stmt2),
+        '...': (testlist, return_stmt2),},
+    2: {
+        None: (testlist, return_stmt2),},
+    3: {
+        None: (testlist, return_stmt2),},}
+return_stmt0.arc(Label(1, 'return'), return_stmt1)
+return_stmt0.bootstrap = {
+    1: {
+        'return': (None, return_stmt1),},}
+
+
+yield_stmt0 = yield_stmt
+yield_stmt1 = State(True)
+yield_stmt1.bootstrap = {}
+yield_stmt0.arc(Label(256, yield_expr), yield_stmt1)
+yield_stmt0.bootstrap = {
+    1: {
+        'yield': (yield_expr, yield_stmt1),},}
+
+
+raise_stmt0 = raise_stmt
+raise_stmt1 = State(True)
+raise_stmt2 = State(True)
+raise_stmt3 = State(False)
+raise_stmt4 = State(True)
+raise_stmt4.bootstrap = {}
+raise_stmt3.arc(Label(256, test), raise_stmt4)
+raise_stmt3.bootstrap = {
+    1: {
+        'not': (test, raise_stmt4),
+        None: (test, raise_stmt4),
+        'None': (test, raise_stmt4),
+        'True': (test, raise_stmt4),
+        'False': (test, raise_stmt4),
+        'lambda': (test, raise_stmt4),},
+    54: {
+        '+': (test, raise_stmt4),
+        '-': (test, raise_stmt4),
+        '~': (test, raise_stmt4),
+        '(': (test, raise_stmt4),
+        '[': (test, raise_stmt4),
+        '{': (test, raise_stmt4),
+        '...': (test, raise_stmt4),},
+    2: {
+        None: (test, raise_stmt4),},
+    3: {
+        None: (test, raise_stmt4),},}
+raise_stmt2.arc(Label(1, 'from'), raise_stmt3)
+raise_stmt2.bootstrap = {
+    1: {
+        'from': (None, raise_stmt3),},}
+raise_stmt1.arc(Label(256, test), raise_stmt2)
+raise_stmt1.bootstrap = {
+    1: {
+        'not': (test, raise_stmt2),
+        None: (test, raise_stmt2),
+        'None': (test, raise_stmt2),
+        'True': (test, raise_stmt2),
+        'False': (test, raise_stmt2),
+        'lambda': (test, raise_stmt2),},
+    54: {
+        '+': (test, raise_stmt2),
+        '-': (test, raise_stmt2),
+        '~': (test, raise_stmt2),
+        '(': (test, raise_stmt2),
+        '[': (test, raise_stmt2),
+        '{': (test, raise_stmt2),
+        '...': (test, raise_stmt2),},
+    2: {
+        None: (test, raise_stmt2),},
+    3: {
+        None: (test, raise_stmt2),},}
+raise_stmt0.arc(Label(1, 'raise'), raise_stmt1)
+raise_stmt0.bootstrap = {
+    1: {
+        'raise': (None, raise_stmt1),},}
+
+
+import_stmt0 = import_stmt
+import_stmt1 = State(True)
+import_stmt1.bootstrap = {}
+import_stmt0.arc(Label(256, import_name), import_stmt1)
+import_stmt0.arc(Label(256, import_from), import_stmt1)
+import_stmt0.bootstrap = {
+    1: {
+        'import': (import_name, import_stmt1),
+        'from': (import_from, import_stmt1),},}
+
+
+import_name0 = import_name
+import_name1 = State(False)
+import_name2 = State(True)
+import_name2.bootstrap = {}
+import_name1.arc(Label(256, dotted_as_names), import_name2)
+import_name1.bootstrap = {
+    1: {
+        None: (dotted_as_names, import_name2),},}
+import_name0.arc(Label(1, 'import'), import_name1)
+import_name0.bootstrap = {
+    1: {
+        'import': (None, import_name1),},}
+
+
+import_from0 = import_from
+import_from1 = State(False)
+import_from2 = State(False)
+import_from2.arc(Label(54, '.'), import_from2)
+import_from2.arc(Label(54, '...'), import_from2)
+import_from3 = State(False)
+import_from4 = State(False)
+import_from5 = State(True)
+import_from5.bootstrap = {}
+import_from4.arc(Label(54, '*'), import_from5)
+import_from6 = State(False)
+import_from7 = State(False)
+import_from7.arc(Label(54, ')'), import_from5)
+import_from7.bootstrap = {
+    54: {
+        ')': (None, import_from5),},}
+import_from6.arc(Label(256, import_as_names), import_from7)
+import_from6.bootstrap = {
+    1: {
+        None: (import_as_names, import_from7),},}
+import_from4.arc(Label(54, '('), import_from6)
+import_from4.arc(Label(256, import_as_names), import_from5)
+import_from4.bootstrap = {
+    54: {
+        '*': (None, import_from5),
+        '(': (None, import_from6),},
+    1: {
+        None: (import_as_names, import_from5),},}
+import_from3.arc(Label(1, 'import'), import_from4)
+import_from3.bootstrap = {
+    1: {
+        'import': (None, import_from4),},}
+import_from2.arc(Label(256, dotted_name), import_from3)
+import_from2.arc(Label(1, 'import'), import_from4)
+import_from2.bootstrap = {
+    54: {
+        '.': (None, import_from2),
+        '...': (None, import_from2),},
+    1: {
+        None: (dotted_name, import_from3),
+        'import': (None, import_from4),},}
+import_from1.arc(Label(54, '.'), import_from2)
+import_from1.arc(Label(54, '...'), import_from2)
+import_from1.arc(Label(256, dotted_name), import_from3)
+import_from1.bootstrap = {
+    54: {
+        '.': (None, import_from2),
+        '...': (None, import_from2),},
+    1: {
+        None: (dotted_name, import_from3),},}
+import_from0.arc(Label(1, 'from'), import_from1)
+import_from0.bootstrap = {
+    1: {
+        'from': (None, import_from1),},}
+
+
+import_as_name0 = import_as_name
+import_as_name1 = State(True)
+import_as_name2 = State(False)
+import_as_name3 = State(True)
+import_as_name3.bootstrap = {}
+import_as_name2.arc(Label(1, None), import_as_name3)
+import_as_name2.bootstrap = {
+    1: {
+        None: (None, import_as_name3),},}
+import_as_name1.arc(Label(1, 'as'), import_as_name2)
+import_as_name1.bootstrap = {
+    1: {
+        'as': (None, import_as_name2),},}
+import_as_name0.arc(Label(1, None), import_as_name1)
+import_as_name0.bootstrap = {
+    1: {
+        None: (None, import_as_name1),},}
+
+
+dotted_as_name0 = dotted_as_name
+dotted_as_name1 = State(True)
+dotted_as_name2 = State(False)
+dotted_as_name3 = State(True)
+dotted_as_name3.bootstrap = {}
+dotted_as_name2.arc(Label(1, None), dotted_as_name3)
+dotted_as_name2.bootstrap = {
+    1: {
+        None: (None, dotted_as_name3),},}
+dotted_as_name1.arc(Label(1, 'as'), dotted_as_name2)
+dotted_as_name1.bootstrap = {
+    1: {
+        'as': (None, dotted_as_name2),},}
+dotted_as_name0.arc(Label(256, dotted_name), dotted_as_name1)
+dotted_as_name0.bootstrap = {
+    1: {
+        None: (dotted_name, dotted_as_name1),},}
+
+
+import_as_names0 = import_as_names
+import_as_names1 = State(True)
+import_as_names2 = State(True)
+import_as_names2.arc(Label(256, import_as_name), import_as_names1)
+import_as_names2.bootstrap = {
+    1: {
+        None: (import_as_name, import_as_names1),},}
+import_as_names1.arc(Label(54, ','), import_as_names2)
+import_as_names1.bootstrap = {
+    54: {
+        ',': (None, import_as_names2),},}
+import_as_names0.arc(Label(256, import_as_name), import_as_names1)
+import_as_names0.bootstrap = {
+    1: {
+        None: (import_as_name, import_as_names1),},}
+
+
+dotted_as_names0 = dotted_as_names
+dotted_as_names1 = State(True)
+dotted_as_names1.arc(Label(54, ','), dotted_as_names0)
+dotted_as_names1.bootstrap = {
+    54: {
+        ',': (None, dotted_as_names0),},}
+dotted_as_names0.arc(Label(256, dotted_as_name), dotted_as_names1)
+dotted_as_names0.bootstrap = {
+    1: {
+        None: (dotted_as_name, dotted_as_names1),},}
+
+
+dotted_name0 = dotted_name
+dotted_name1 = State(True)
+dotted_name1.arc(Label(54, '.'), dotted_name0)
+dotted_name1.bootstrap = {
+    54: {
+        '.': (None, dotted_name0),},}
+dotted_name0.arc(Label(1, None), dotted_name1)
+dotted_name0.bootstrap = {
+    1: {
+        None: (None, dotted_name1),},}
+
+
+global_stmt0 = global_stmt
+global_stmt1 = State(False)
+global_stmt2 = State(True)
+global_stmt2.arc(Label(54, ','), global_stmt1)
+global_stmt2.bootstrap = {
+    54: {
+        ',': (None, global_stmt1),},}
+global_stmt1.arc(Label(1, None), global_stmt2)
+global_stmt1.bootstrap = {
+    1: {
+        None: (None, global_stmt2),},}
+global_stmt0.arc(Label(1, 'global'), global_stmt1)
+global_stmt0.bootstrap = {
+    1: {
+        'global': (None, global_stmt1),},}
+
+
+nonlocal_stmt0 = nonlocal_stmt
+nonlocal_stmt1 = State(False)
+nonlocal_stmt2 = State(True)
+nonlocal_stmt2.arc(Label(54, ','), nonlocal_stmt1)
+nonlocal_stmt2.bootstrap = {
+    54: {
+        ',': (None, nonlocal_stmt1),},}
+nonlocal_stmt1.arc(Label(1, None), nonlocal_stmt2)
+nonlocal_stmt1.bootstrap = {
+    1: {
+        None: (None, nonlocal_stmt2),},}
+nonlocal_stmt0.arc(Label(1, 'nonlocal'), nonlocal_stmt1)
+nonlocal_stmt0.bootstrap = {
+    1: {
+        'nonlocal': (None, nonlocal_stmt1),},}
+
+
+assert_stmt0 = assert_stmt
+assert_stmt1 = State(False)
+assert_stmt2 = State(True)
+assert_stmt3 = State(False)
+assert_stmt4 = State(True)
+assert_stmt4.bootstrap = {}
+assert_stmt3.arc(Label(256, test), assert_stmt4)
+assert_stmt3.bootstrap = {
+    1: {
+        'not': (test, assert_stmt4),
+        None: (test, assert_stmt4),
+        'None': (test, assert_stmt4),
+        'True': (test, assert_stmt4),
+        'False': (test, assert_stmt4),
+        'lambda': (test, assert_stmt4),},
+    54: {
+        '+': (test, assert_stmt4),
+        '-': (test, assert_stmt4),
+        '~': (test, assert_stmt4),
+        '(': (test, assert_stmt4),
+        '[': (test, assert_stmt4),
+        '{': (test, assert_stmt4),
+        '...': (test, assert_stmt4),},
+    2: {
+        None: (test, assert_stmt4),},
+    3: {
+        None: (test, assert_stmt4),},}
+assert_stmt2.arc(Label(54, ','), assert_stmt3)
+assert_stmt2.bootstrap = {
+    54: {
+        ',': (None, assert_stmt3),},}
+assert_stmt1.arc(Label(256, test), assert_stmt2)
+assert_stmt1.bootstrap = {
+    1: {
+        'not': (test, assert_stmt2),
+        None: (test, assert_stmt2),
+        'None': (test, assert_stmt2),
+        'True': (test, assert_stmt2),
+        'False': (test, assert_stmt2),
+        'lambda': (test, assert_stmt2),},
+    54: {
+        '+': (test, assert_stmt2),
+        '-': (test, assert_stmt2),
+        '~': (test, assert_stmt2),
+        '(': (test, assert_stmt2),
+        '[': (test, assert_stmt2),
+        '{': (test, assert_stmt2),
+        '...': (test, assert_stmt2),},
+    2: {
+        None: (test, assert_stmt2),},
+    3: {
+        None: (test, assert_stmt2),},}
+assert_stmt0.arc(Label(1, 'assert'), assert_stmt1)
+assert_stmt0.bootstrap = {
+    1: {
+        'assert': (None, assert_stmt1),},}
+
+
+compound_stmt0 = compound_stmt
+compound_stmt1 = State(True)
+compound_stmt1.bootstrap = {}
+compound_stmt0.arc(Label(256, if_stmt), compound_stmt1)
+compound_stmt0.arc(Label(256, while_stmt), compound_stmt1)
+compound_stmt0.arc(Label(256, for_stmt), compound_stmt1)
+compound_stmt0.arc(Label(256, try_stmt), compound_stmt1)
+compound_stmt0.arc(Label(256, with_stmt), compound_stmt1)
+compound_stmt0.arc(Label(256, funcdef), compound_stmt1)
+compound_stmt0.arc(Label(256, classdef), compound_stmt1)
+compound_stmt0.arc(Label(256, decorated), compound_stmt1)
+compound_stmt0.bootstrap = {
+    1: {
+        'if': (if_stmt, compound_stmt1),
+        'while': (while_stmt, compound_stmt1),
+        'for': (for_stmt, compound_stmt1),
+        'try': (try_stmt, compound_stmt1),
+        'with': (with_stmt, compound_stmt1),
+        'def': (funcdef, compound_stmt1),
+        'class': (classdef, compound_stmt1),},
+    54: {
+        '@': (decorated, compound_stmt1),},}
+
+
+if_stmt0 = if_stmt
+if_stmt1 = State(False)
+if_stmt2 = State(False)
+if_stmt3 = State(False)
+if_stmt4 = State(True)
+if_stmt4.arc(Label(1, 'elif'), if_stmt1)
+if_stmt5 = State(False)
+if_stmt6 = State(False)
+if_stmt7 = State(True)
+if_stmt7.bootstrap = {}
+if_stmt6.arc(Label(256, suite), if_stmt7)
+if_stmt6.bootstrap = {
+    1: {
+        'not': (suite, if_stmt7),
+        None: (suite, if_stmt7),
+        'None': (suite, if_stmt7),
+        'True': (suite, if_stmt7),
+        'False': (suite, if_stmt7),
+        'lambda': (suite, if_stmt7),
+        'del': (suite, if_stmt7),
+        'pass': (suite, if_stmt7),
+        'break': (suite, if_stmt7),
+        'continue': (suite, if_stmt7),
+        'return': (suite, if_stmt7),
+        'raise': (suite, if_stmt7),
+        'yield': (suite, if_stmt7),
+        'import': (suite, if_stmt7),
+        'from': (suite, if_stmt7),
+        'global': (suite, if_stmt7),
+        'nonlocal': (suite, if_stmt7),
+        'assert': (suite, if_stmt7),},
+    54: {
+        '+': (suite, if_stmt7),
+        '-': (suite, if_stmt7),
+        '~': (suite, if_stmt7),
+        '(': (suite, if_stmt7),
+        '[': (suite, if_stmt7),
+        '{': (suite, if_stmt7),
+        '...': (suite, if_stmt7),
+        '*': (suite, if_stmt7),},
+    2: {
+        None: (suite, if_stmt7),},
+    3: {
+        None: (suite, if_stmt7),},
+    4: {
+        None: (suite, if_stmt7),},}
+if_stmt5.arc(Label(54, ':'), if_stmt6)
+if_stmt5.bootstrap = {
+    54: {
+        ':': (None, if_stmt6),},}
+if_stmt4.arc(Label(1, 'else'), if_stmt5)
+if_stmt4.bootstrap = {
+    1: {
+        'elif': (None, if_stmt1),
+        'else': (None, if_stmt5),},}
+if_stmt3.arc(Label(256, suite), if_stmt4)
+if_stmt3.bootstrap = {
+    1: {
+        'not': (suite, if_stmt4),
+        None: (suite, if_stmt4),
+        'None': (suite, if_stmt4),
+        'True': (suite, if_stmt4),
+        'False': (suite, if_stmt4),
+        'lambda': (suite, if_stmt4),
+        'del': (suite, if_stmt4),
+        'pass': (suite, if_stmt4),
+        'break': (suite, if_stmt4),
+        'continue': (suite, if_stmt4),
+        'return': (suite, if_stmt4),
+        'raise': (suite, if_stmt4),
+        'yield': (suite, if_stmt4),
+        'import': (suite, if_stmt4),
+        'from': (suite, if_stmt4),
+        'global': (suite, if_stmt4),
+        'nonlocal': (suite, if_stmt4),
+        'assert': (suite, if_stmt4),},
+    54: {
+        '+': (suite, if_stmt4),
+        '-': (suite, if_stmt4),
+        '~': (suite, if_stmt4),
+        '(': (suite, if_stmt4),
+        '[': (suite, if_stmt4),
+        '{': (suite, if_stmt4),
+        '...': (suite, if_stmt4),
+        '*': (suite, if_stmt4),},
+    2: {
+        None: (suite, if_stmt4),},
+    3: {
+        None: (suite, if_stmt4),},
+    4: {
+        None: (suite, if_stmt4),},}
+if_stmt2.arc(Label(54, ':'), if_stmt3)
+if_stmt2.bootstrap = {
+    54: {
+        ':': (None, if_stmt3),},}
+if_stmt1.arc(Label(256, test), if_stmt2)
+if_stmt1.bootstrap = {
+    1: {
+        'not': (test, if_stmt2),
+        None: (test, if_stmt2),
+        'None': (test, if_stmt2),
+        'True': (test, if_stmt2),
+        'False': (test, if_stmt2),
+        'lambda': (test, if_stmt2),},
+    54: {
+        '+': (test, if_stmt2),
+        '-': (test, if_stmt2),
+        '~': (test, if_stmt2),
+        '(': (test, if_stmt2),
+        '[': (test, if_stmt2),
+        '{': (test, if_stmt2),
+        '...': (test, if_stmt2),},
+    2: {
+        None: (test, if_stmt2),},
+    3: {
+        None: (test, if_stmt2),},}
+if_stmt0.arc(Label(1, 'if'), if_stmt1)
+if_stmt0.bootstrap = {
+    1: {
+        'if': (None, if_stmt1),},}
+
+
+while_stmt0 = while_stmt
+while_stmt1 = State(False)
+while_stmt2 = State(False)
+while_stmt3 = State(False)
+while_stmt4 = State(True)
+while_stmt5 = State(False)
+while_stmt6 = State(False)
+while_stmt7 = State(True)
+while_stmt7.bootstrap = {}
+while_stmt6.arc(Label(256, suite), while_stmt7)
+while_stmt6.bootstrap = {
+    1: {
+        'not': (suite, while_stmt7),
+        None: (suite, while_stmt7),
+        'None': (suite, while_stmt7),
+        'True': (suite, while_stmt7),
+        'False': (suite, while_stmt7),
+        'lambda': (suite, while_stmt7),
+        'del': (suite, while_stmt7),
+        'pass': (suite, while_stmt7),
+        'break': (suite, while_stmt7),
+        'continue': (suite, while_stmt7),
+        'return': (suite, while_stmt7),
+        'raise': (suite, while_stmt7),
+        'yield': (suite, while_stmt7),
+        'import': (suite, while_stmt7),
+        'from': (suite, while_stmt7),
+        'global': (suite, while_stmt7),
+        'nonlocal': (suite, while_stmt7),
+        'assert': (suite, while_stmt7),},
+    54: {
+        '+': (suite, while_stmt7),
+        '-': (suite, while_stmt7),
+        '~': (suite, while_stmt7),
+        '(': (suite, while_stmt7),
+        '[': (suite, while_stmt7),
+        '{': (suite, while_stmt7),
+        '...': (suite, while_stmt7),
+        '*': (suite, while_stmt7),},
+    2: {
+        None: (suite, while_stmt7),},
+    3: {
+        None: (suite, while_stmt7),},
+    4: {
+        None: (suite, while_stmt7),},}
+while_stmt5.arc(Label(54, ':'), while_stmt6)
+while_stmt5.bootstrap = {
+    54: {
+        ':': (None, while_stmt6),},}
+while_stmt4.arc(Label(1, 'else'), while_stmt5)
+while_stmt4.bootstrap = {
+    1: {
+        'else': (None, while_stmt5),},}
+while_stmt3.arc(Label(256, suite), while_stmt4)
+while_stmt3.bootstrap = {
+    1: {
+        'not': (suite, while_stmt4),
+        None: (suite, while_stmt4),
+        'None': (suite, while_stmt4),
+        'True': (suite, while_stmt4),
+        'False': (suite, while_stmt4),
+        'lambda': (suite, while_stmt4),
+        'del': (suite, while_stmt4),
+        'pass': (suite, while_stmt4),
+        'break': (suite, while_stmt4),
+        'continue': (suite, while_stmt4),
+        'return': (suite, while_stmt4),
+        'raise': (suite, while_stmt4),
+        'yield': (suite, while_stmt4),
+        'import': (suite, while_stmt4),
+        'from': (suite, while_stmt4),
+        'global': (suite, while_stmt4),
+        'nonlocal': (suite, while_stmt4),
+        'assert': (suite, while_stmt4),},
+    54: {
+        '+': (suite, while_stmt4),
+        '-': (suite, while_stmt4),
+        '~': (suite, while_stmt4),
+        '(': (suite, while_stmt4),
+        '[': (suite, while_stmt4),
+        '{': (suite, while_stmt4),
+        '...': (suite, while_stmt4),
+        '*': (suite, while_stmt4),},
+    2: {
+        None: (suite, while_stmt4),},
+    3: {
+        None: (suite, while_stmt4),},
+    4: {
+        None: (suite, while_stmt4),},}
+while_stmt2.arc(Label(54, ':'), while_stmt3)
+while_stmt2.bootstrap = {
+    54: {
+        ':': (None, while_stmt3),},}
+while_stmt1.arc(Label(256, test), while_stmt2)
+while_stmt1.bootstrap = {
+    1: {
+        'not': (test, while_stmt2),
+        None: (test, while_stmt2),
+        'None': (test, while_stmt2),
+        'True': (test, while_stmt2),
+        'False': (test, while_stmt2),
+        'lambda': (test, while_stmt2),},
+    54: {
+        '+': (test, while_stmt2),
+        '-': (test, while_stmt2),
+        '~': (test, while_stmt2),
+        '(': (test, while_stmt2),
+        '[': (test, while_stmt2),
+        '{': (test, while_stmt2),
+        '...': (test, while_stmt2),},
+    2: {
+        None: (test, while_stmt2),},
+    3: {
+        None: (test, while_stmt2),},}
+while_stmt0.arc(Label(1, 'while'), while_stmt1)
+while_stmt0.bootstrap = {
+    1: {
+        'while': (None, while_stmt1),},}
+
+
+for_stmt0 = for_stmt
+for_stmt1 = State(False)
+for_stmt2 = State(False)
+for_stmt3 = State(False)
+for_stmt4 = State(False)
+for_stmt5 = State(False)
+for_stmt6 = State(True)
+for_stmt7 = State(False)
+for_stmt8 = State(False)
+for_stmt9 = State(True)
+for_stmt9.bootstrap = {}
+for_stmt8.arc(Label(256, suite), for_stmt9)
+for_stmt8.bootstrap = {
+    1: {
+        'not': (suite, for_stmt9),
+        None: (suite, for_stmt9),
+        'None': (suite, for_stmt9),
+        'True': (suite, for_stmt9),
+        'False': (suite, for_stmt9),
+        'lambda': (suite, for_stmt9),
+        'del': (suite, for_stmt9),
+        'pass': (suite, for_stmt9),
+        'break': (suite, for_stmt9),
+        'continue': (suite, for_stmt9),
+        'return': (suite, for_stmt9),
+        'raise': (suite, for_stmt9),
+        'yield': (suite, for_stmt9),
+        'import': (suite, for_stmt9),
+        'from': (suite, for_stmt9),
+        'global': (suite, for_stmt9),
+        'nonlocal': (suite, for_stmt9),
+        'assert': (suite, for_stmt9),},
+    54: {
+        '+': (suite, for_stmt9),
+        '-': (suite, for_stmt9),
+        '~': (suite, for_stmt9),
+        '(': (suite, for_stmt9),
+        '[': (suite, for_stmt9),
+        '{': (suite, for_stmt9),
+        '...': (suite, for_stmt9),
+        '*': (suite, for_stmt9),},
+    2: {
+        None: (suite, for_stmt9),},
+    3: {
+        None: (suite, for_stmt9),},
+    4: {
+        None: (suite, for_stmt9),},}
+for_stmt7.arc(Label(54, ':'), for_stmt8)
+for_stmt7.bootstrap = {
+    54: {
+        ':': (None, for_stmt8),},}
+for_stmt6.arc(Label(1, 'else'), for_stmt7)
+for_stmt6.bootstrap = {
+    1: {
+        'else': (None, for_stmt7),},}
+for_stmt5.arc(Label(256, suite), for_stmt6)
+for_stmt5.bootstrap = {
+    1: {
+        'not': (suite, for_stmt6),
+        None: (suite, for_stmt6),
+        'None': (suite, for_stmt6),
+        'True': (suite, for_stmt6),
+        'False': (suite, for_stmt6),
+        'lambda': (suite, for_stmt6),
+        'del': (suite, for_stmt6),
+        'pass': (suite, for_stmt6),
+        'break': (suite, for_stmt6),
+        'continue': (suite, for_stmt6),
+        'return': (suite, for_stmt6),
+        'raise': (suite, for_stmt6),
+        'yield': (suite, for_stmt6),
+        'import': (suite, for_stmt6),
+        'from': (suite, for_stmt6),
+        'global': (suite, for_stmt6),
+        'nonlocal': (suite, for_stmt6),
+        'assert': (suite, for_stmt6),},
+    54: {
+        '+': (suite, for_stmt6),
+        '-': (suite, for_stmt6),
+        '~': (suite, for_stmt6),
+        '(': (suite, for_stmt6),
+        '[': (suite, for_stmt6),
+        '{': (suite, for_stmt6),
+        '...': (suite, for_stmt6),
+        '*': (suite, for_stmt6),},
+    2: {
+        None: (suite, for_stmt6),},
+    3: {
+        None: (suite, for_stmt6),},
+    4: {
+        None: (suite, for_stmt6),},}
+for_stmt4.arc(Label(54, ':'), for_stmt5)
+for_stmt4.bootstrap = {
+    54: {
+        ':': (None, for_stmt5),},}
+for_stmt3.arc(Label(256, testlist), for_stmt4)
+for_stmt3.bootstrap = {
+    1: {
+        'not': (testlist, for_stmt4),
+        None: (testlist, for_stmt4),
+        'None': (testlist, for_stmt4),
+        'True': (testlist, for_stmt4),
+        'False': (testlist, for_stmt4),
+        'lambda': (testlist, for_stmt4),},
+    54: {
+        '+': (testlist, for_stmt4),
+        '-': (testlist, for_stmt4),
+        '~': (testlist, for_stmt4),
+        '(': (testlist, for_stmt4),
+        '[': (testlist, for_stmt4),
+        '{': (testlist, for_stmt4),
+        '...': (testlist, for_stmt4),},
+    2: {
+        None: (testlist, for_stmt4),},
+    3: {
+        None: (testlist, for_stmt4),},}
+for_stmt2.arc(Label(1, 'in'), for_stmt3)
+for_stmt2.bootstrap = {
+    1: {
+        'in': (None, for_stmt3),},}
+for_stmt1.arc(Label(256, exprlist), for_stmt2)
+for_stmt1.bootstrap = {
+    54: {
+        '+': (exprlist, for_stmt2),
+        '-': (exprlist, for_stmt2),
+        '~': (exprlist, for_stmt2),
+        '(': (exprlist, for_stmt2),
+        '[': (exprlist, for_stmt2),
+        '{': (exprlist, for_stmt2),
+        '...': (exprlist, for_stmt2),
+        '*': (exprlist, for_stmt2),},
+    1: {
+        None: (exprlist, for_stmt2),
+        'None': (exprlist, for_stmt2),
+        'True': (exprlist, for_stmt2),
+        'False': (exprlist, for_stmt2),},
+    2: {
+        None: (exprlist, for_stmt2),},
+    3: {
+        None: (exprlist, for_stmt2),},}
+for_stmt0.arc(Label(1, 'for'), for_stmt1)
+for_stmt0.bootstrap = {
+    1: {
+        'for': (None, for_stmt1),},}
+
+
+try_stmt0 = try_stmt
+try_stmt1 = State(False)
+try_stmt2 = State(False)
+try_stmt3 = State(False)
+try_stmt4 = State(False)
+try_stmt5 = State(False)
+try_stmt6 = State(True)
+try_stmt6.arc(Label(256, except_clause), try_stmt4)
+try_stmt7 = State(False)
+try_stmt8 = State(False)
+try_stmt9 = State(True)
+try_stmt10 = State(False)
+try_stmt11 = State(False)
+try_stmt12 = State(True)
+try_stmt12.bootstrap = {}
+try_stmt11.arc(Label(256, suite), try_stmt12)
+try_stmt11.bootstrap = {
+    1: {
+        'not': (suite, try_stmt12),
+        None: (suite, try_stmt12),
+        'None': (suite, try_stmt12),
+        'True': (suite, try_stmt12),
+        'False': (suite, try_stmt12),
+        'lambda': (suite, try_stmt12),
+        'del': (suite, try_stmt12),
+        'pass': (suite, try_stmt12),
+        'break': (suite, try_stmt12),
+        'continue': (suite, try_stmt12),
+        'return': (suite, try_stmt12),
+        'raise': (suite, try_stmt12),
+        'yield': (suite, try_stmt12),
+        'import': (suite, try_stmt12),
+        'from': (suite, try_stmt12),
+        'global': (suite, try_stmt12),
+        'nonlocal': (suite, try_stmt12),
+        'assert': (suite, try_stmt12),},
+    54: {
+        '+': (suite, try_stmt12),
+        '-': (suite, try_stmt12),
+        '~': (suite, try_stmt12),
+        '(': (suite, try_stmt12),
+        '[': (suite, try_stmt12),
+        '{': (suite, try_stmt12),
+        '...': (suite, try_stmt12),
+        '*': (suite, try_stmt12),},
+    2: {
+        None: (suite, try_stmt12),},
+    3: {
+        None: (suite, try_stmt12),},
+    4: {
+        None: (suite, try_stmt12),},}
+try_stmt10.arc(Label(54, ':'), try_stmt11)
+try_stmt10.bootstrap = {
+    54: {
+        ':': (None, try_stmt11),},}
+try_stmt9.arc(Label(1, 'finally'), try_stmt10)
+try_stmt9.bootstrap = {
+    1: {
+        'finally': (None, try_stmt10),},}
+try_stmt8.arc(Label(256, suite), try_stmt9)
+try_stmt8.bootstrap = {
+    1: {
+        'not': (suite, try_stmt9),
+        None: (suite, try_stmt9),
+        'None': (suite, try_stmt9),
+        'True': (suite, try_stmt9),
+        'False': (suite, try_stmt9),
+        'lambda': (suite, try_stmt9),
+        'del': (suite, try_stmt9),
+        'pass': (suite, try_stmt9),
+        'break': (suite, try_stmt9),
+        'continue': (suite, try_stmt9),
+        'return': (suite, try_stmt9),
+        'raise': (suite, try_stmt9),
+        'yield': (suite, try_stmt9),
+        'import': (suite, try_stmt9),
+        'from': (suite, try_stmt9),
+        'global': (suite, try_stmt9),
+        'nonlocal': (suite, try_stmt9),
+        'assert': (suite, try_stmt9),},
+    54: {
+        '+': (suite, try_stmt9),
+        '-': (suite, try_stmt9),
+        '~': (suite, try_stmt9),
+        '(': (suite, try_stmt9),
+        '[': (suite, try_stmt9),
+        '{': (suite, try_stmt9),
+        '...': (suite, try_stmt9),
+        '*': (suite, try_stmt9),},
+    2: {
+        None: (suite, try_stmt9),},
+    3: {
+        None: (suite, try_stmt9),},
+    4: {
+        None: (suite, try_stmt9),},}
+try_stmt7.arc(Label(54, ':'), try_stmt8)
+try_stmt7.bootstrap = {
+    54: {
+        ':': (None, try_stmt8),},}
+try_stmt6.arc(Label(1, 'else'), try_stmt7)
+try_stmt6.arc(Label(1, 'finally'), try_stmt10)
+try_stmt6.bootstrap = {
+    1: {
+        'except': (except_clause, try_stmt4),
+        'else': (None, try_stmt7),
+        'finally': (None, try_stmt10),},}
+try_stmt5.arc(Label(256, suite), try_stmt6)
+try_stmt5.bootstrap = {
+    1: {
+        'not': (suite, try_stmt6),
+        None: (suite, try_stmt6),
+        'None': (suite, try_stmt6),
+        'True': (suite, try_stmt6),
+        'False': (suite, try_stmt6),
+        'lambda': (suite, try_stmt6),
+        'del': (suite, try_stmt6),
+        'pass': (suite, try_stmt6),
+        'break': (suite, try_stmt6),
+        'continue': (suite, try_stmt6),
+        'return': (suite, try_stmt6),
+        'raise': (suite, try_stmt6),
+        'yield': (suite, try_stmt6),
+        'import': (suite, try_stmt6),
+        'from': (suite, try_stmt6),
+        'global': (suite, try_stmt6),
+        'nonlocal': (suite, try_stmt6),
+        'assert': (suite, try_stmt6),},
+    54: {
+        '+': (suite, try_stmt6),
+        '-': (suite, try_stmt6),
+        '~': (suite, try_stmt6),
+        '(': (suite, try_stmt6),
+        '[': (suite, try_stmt6),
+        '{': (suite, try_stmt6),
+        '...': (suite, try_stmt6),
+        '*': (suite, try_stmt6),},
+    2: {
+        None: (suite, try_stmt6),},
+    3: {
+        None: (suite, try_stmt6),},
+    4: {
+        None: (suite, try_stmt6),},}
+try_stmt4.arc(Label(54, ':'), try_stmt5)
+try_stmt4.bootstrap = {
+    54: {
+        ':': (None, try_stmt5),},}
+try_stmt3.arc(Label(256, except_clause), try_stmt4)
+try_stmt3.arc(Label(1, 'finally'), try_stmt10)
+try_stmt3.bootstrap = {
+    1: {
+        'except': (except_clause, try_stmt4),
+        'finally': (None, try_stmt10),},}
+try_stmt2.arc(Label(256, suite), try_stmt3)
+try_stmt2.bootstrap = {
+    1: {
+        'not': (suite, try_stmt3),
+        None: (suite, try_stmt3),
+        'None': (suite, try_stmt3),
+        'True': (suite, try_stmt3),
+        'False': (suite, try_stmt3),
+        'lambda': (suite, try_stmt3),
+        'del': (suite, try_stmt3),
+        'pass': (suite, try_stmt3),
+        'break': (suite, try_stmt3),
+        'continue': (suite, try_stmt3),
+        'return': (suite, try_stmt3),
+        'raise': (suite, try_stmt3),
+        'yield': (suite, try_stmt3),
+        'import': (suite, try_stmt3),
+        'from': (suite, try_stmt3),
+        'global': (suite, try_stmt3),
+        'nonlocal': (suite, try_stmt3),
+        'assert': (suite, try_stmt3),},
+    54: {
+        '+': (suite, try_stmt3),
+        '-': (suite, try_stmt3),
+        '~': (suite, try_stmt3),
+        '(': (suite, try_stmt3),
+        '[': (suite, try_stmt3),
+        '{': (suite, try_stmt3),
+        '...': (suite, try_stmt3),
+        '*': (suite, try_stmt3),},
+    2: {
+        None: (suite, try_stmt3),},
+    3: {
+        None: (suite, try_stmt3),},
+    4: {
+        None: (suite, try_stmt3),},}
+try_stmt1.arc(Label(54, ':'), try_stmt2)
+try_stmt1.bootstrap = {
+    54: {
+        ':': (None, try_stmt2),},}
+try_stmt0.arc(Label(1, 'try'), try_stmt1)
+try_stmt0.bootstrap = {
+    1: {
+        'try': (None, try_stmt1),},}
+
+
+with_stmt0 = with_stmt
+with_stmt1 = State(False)
+with_stmt2 = State(False)
+with_stmt2.arc(Label(54, ','), with_stmt1)
+with_stmt3 = State(False)
+with_stmt4 = State(True)
+with_stmt4.bootstrap = {}
+with_stmt3.arc(Label(256, suite), with_stmt4)
+with_stmt3.bootstrap = {
+    1: {
+        'not': (suite, with_stmt4),
+        None: (suite, with_stmt4),
+        'None': (suite, with_stmt4),
+        'True': (suite, with_stmt4),
+        'False': (suite, with_stmt4),
+        'lambda': (suite, with_stmt4),
+        'del': (suite, with_stmt4),
+        'pass': (suite, with_stmt4),
+        'break': (suite, with_stmt4),
+        'continue': (suite, with_stmt4),
+        'return': (suite, with_stmt4),
+        'raise': (suite, with_stmt4),
+        'yield': (suite, with_stmt4),
+        'import': (suite, with_stmt4),
+        'from': (suite, with_stmt4),
+        'global': (suite, with_stmt4),
+        'nonlocal': (suite, with_stmt4),
+        'assert': (suite, with_stmt4),},
+    54: {
+        '+': (suite, with_stmt4),
+        '-': (suite, with_stmt4),
+        '~': (suite, with_stmt4),
+        '(': (suite, with_stmt4),
+        '[': (suite, with_stmt4),
+        '{': (suite, with_stmt4),
+        '...': (suite, with_stmt4),
+        '*': (suite, with_stmt4),},
+    2: {
+        None: (suite, with_stmt4),},
+    3: {
+        None: (suite, with_stmt4),},
+    4: {
+        None: (suite, with_stmt4),},}
+with_stmt2.arc(Label(54, ':'), with_stmt3)
+with_stmt2.bootstrap = {
+    54: {
+        ',': (None, with_stmt1),
+        ':': (None, with_stmt3),},}
+with_stmt1.arc(Label(256, with_item), with_stmt2)
+with_stmt1.bootstrap = {
+    1: {
+        'not': (with_item, with_stmt2),
+        None: (with_item, with_stmt2),
+        'None': (with_item, with_stmt2),
+        'True': (with_item, with_stmt2),
+        'False': (with_item, with_stmt2),
+        'lambda': (with_item, with_stmt2),},
+    54: {
+        '+': (with_item, with_stmt2),
+        '-': (with_item, with_stmt2),
+        '~': (with_item, with_stmt2),
+        '(': (with_item, with_stmt2),
+        '[': (with_item, with_stmt2),
+        '{': (with_item, with_stmt2),
+        '...': (with_item, with_stmt2),},
+    2: {
+        None: (with_item, with_stmt2),},
+    3: {
+        None: (with_item, with_stmt2),},}
+with_stmt0.arc(Label(1, 'with'), with_stmt1)
+with_stmt0.bootstrap = {
+    1: {
+        'with': (None, with_stmt1),},}
+
+
+with_item0 = with_item
+with_item1 = State(True)
+with_item2 = State(False)
+with_item3 = State(True)
+with_item3.bootstrap = {}
+with_item2.arc(Label(256, expr), with_item3)
+with_item2.bootstrap = {
+    54: {
+        '+': (expr, with_item3),
+        '-': (expr, with_item3),
+        '~': (expr, with_item3),
+        '(': (expr, with_item3),
+        '[': (expr, with_item3),
+        '{': (expr, with_item3),
+        '...': (expr, with_item3),},
+    1: {
+        None: (expr, with_item3),
+        'None': (expr, with_item3),
+        'True': (expr, with_item3),
+        'False': (expr, with_item3),},
+    2: {
+        None: (expr, with_item3),},
+    3: {
+        None: (expr, with_item3),},}
+with_item1.arc(Label(1, 'as'), with_item2)
+with_item1.bootstrap = {
+    1: {
+        'as': (None, with_item2),},}
+with_item0.arc(Label(256, test), with_item1)
+with_item0.bootstrap = {
+    1: {
+        'not': (test, with_item1),
+        None: (test, with_item1),
+        'None': (test, with_item1),
+        'True': (test, with_item1),
+        'False': (test, with_item1),
+        'lambda': (test, with_item1),},
+    54: {
+        '+': (test, with_item1),
+        '-': (test, with_item1),
+        '~': (test, with_item1),
+        '(': (test, with_item1),
+        '[': (test, with_item1),
+        '{': (test, with_item1),
+        '...': (test, with_item1),},
+    2: {
+        None: (test, with_item1),},
+    3: {
+        None: (test, with_item1),},}
+
+
+except_clause0 = except_clause
+except_clause1 = State(True)
+except_clause2 = State(True)
+except_clause3 = State(False)
+except_clause4 = State(True)
+except_clause4.bootstrap = {}
+except_clause3.arc(Label(1, None), except_clause4)
+except_clause3.bootstrap = {
+    1: {
+        None: (None, except_clause4),},}
+except_clause2.arc(Label(1, 'as'), except_clause3)
+except_clause2.bootstrap = {
+    1: {
+        'as': (None, except_clause3),},}
+except_clause1.arc(Label(256, test), except_clause2)
+except_clause1.bootstrap = {
+    1: {
+        'not': (test, except_clause2),
+        None: (test, except_clause2),
+        'None': (test, except_clause2),
+        'True': (test, except_clause2),
+        'False': (test, except_clause2),
+        'lambda': (test, except_clause2),},
+    54: {
+        '+': (test, except_clause2),
+        '-': (test, except_clause2),
+        '~': (test, except_clause2),
+        '(': (test, except_clause2),
+        '[': (test, except_clause2),
+        '{': (test, except_clause2),
+        '...': (test, except_clause2),},
+    2: {
+        None: (test, except_clause2),},
+    3: {
+        None: (test, except_clause2),},}
+except_clause0.arc(Label(1, 'except'), except_clause1)
+except_clause0.bootstrap = {
+    1: {
+        'except': (None, except_clause1),},}
+
+
+suite0 = suite
+suite1 = State(True)
+suite1.bootstrap = {}
+suite0.arc(Label(256, simple_stmt), suite1)
+suite2 = State(False)
+suite3 = State(False)
+suite4 = State(False)
+suite4.arc(Label(256, stmt), suite4)
+suite4.arc(Label(6, None), suite1)
+suite4.bootstrap = {
+    1: {
+        'not': (stmt, suite4),
+        None: (stmt, suite4),
+        'None': (stmt, suite4),
+        'True': (stmt, suite4),
+        'False': (stmt, suite4),
+        'lambda': (stmt, suite4),
+        'del': (stmt, suite4),
+        'pass': (stmt, suite4),
+        'break': (stmt, suite4),
+        'continue': (stmt, suite4),
+        'return': (stmt, suite4),
+        'raise': (stmt, suite4),
+        'yield': (stmt, suite4),
+        'import': (stmt, suite4),
+        'from': (stmt, suite4),
+        'global': (stmt, suite4),
+        'nonlocal': (stmt, suite4),
+        'assert': (stmt, suite4),
+        'if': (stmt, suite4),
+        'while': (stmt, suite4),
+        'for': (stmt, suite4),
+        'try': (stmt, suite4),
+        'with': (stmt, suite4),
+        'def': (stmt, suite4),
+        'class': (stmt, suite4),},
+    54: {
+        '+': (stmt, suite4),
+        '-': (stmt, suite4),
+        '~': (stmt, suite4),
+        '(': (stmt, suite4),
+        '[': (stmt, suite4),
+        '{': (stmt, suite4),
+        '...': (stmt, suite4),
+        '*': (stmt, suite4),
+        '@': (stmt, suite4),},
+    2: {
+        None: (stmt, suite4),},
+    3: {
+        None: (stmt, suite4),},
+    6: {
+        None: (None, suite1),},}
+suite3.arc(Label(256, stmt), suite4)
+suite3.bootstrap = {
+    1: {
+        'not': (stmt, suite4),
+        None: (stmt, suite4),
+        'None': (stmt, suite4),
+        'True': (stmt, suite4),
+        'False': (stmt, suite4),
+        'lambda': (stmt, suite4),
+        'del': (stmt, suite4),
+        'pass': (stmt, suite4),
+        'break': (stmt, suite4),
+        'continue': (stmt, suite4),
+        'return': (stmt, suite4),
+        'raise': (stmt, suite4),
+        'yield': (stmt, suite4),
+        'import': (stmt, suite4),
+        'from': (stmt, suite4),
+        'global': (stmt, suite4),
+        'nonlocal': (stmt, suite4),
+        'assert': (stmt, suite4),
+        'if': (stmt, suite4),
+        'while': (stmt, suite4),
+        'for': (stmt, suite4),
+        'try': (stmt, suite4),
+        'with': (stmt, suite4),
+        'def': (stmt, suite4),
+        'class': (stmt, suite4),},
+    54: {
+        '+': (stmt, suite4),
+        '-': (stmt, suite4),
+        '~': (stmt, suite4),
+        '(': (stmt, suite4),
+        '[': (stmt, suite4),
+        '{': (stmt, suite4),
+        '...': (stmt, suite4),
+        '*': (stmt, suite4),
+        '@': (stmt, suite4),},
+    2: {
+        None: (stmt, suite4),},
+    3: {
+        None: (stmt, suite4),},}
+suite2.arc(Label(5, None), suite3)
+suite2.bootstrap = {
+    5: {
+        None: (None, suite3),},}
+suite0.arc(Label(4, None), suite2)
+suite0.bootstrap = {
+    1: {
+        'not': (simple_stmt, suite1),
+        None: (simple_stmt, suite1),
+        'None': (simple_stmt, suite1),
+        'True': (simple_stmt, suite1),
+        'False': (simple_stmt, suite1),
+        'lambda': (simple_stmt, suite1),
+        'del': (simple_stmt, suite1),
+        'pass': (simple_stmt, suite1),
+        'break': (simple_stmt, suite1),
+        'continue': (simple_stmt, suite1),
+        'return': (simple_stmt, suite1),
+        'raise': (simple_stmt, suite1),
+        'yield': (simple_stmt, suite1),
+        'import': (simple_stmt, suite1),
+        'from': (simple_stmt, suite1),
+        'global': (simple_stmt, suite1),
+        'nonlocal': (simple_stmt, suite1),
+        'assert': (simple_stmt, suite1),},
+    54: {
+        '+': (simple_stmt, suite1),
+        '-': (simple_stmt, suite1),
+        '~': (simple_stmt, suite1),
+        '(': (simple_stmt, suite1),
+        '[': (simple_stmt, suite1),
+        '{': (simple_stmt, suite1),
+        '...': (simple_stmt, suite1),
+        '*': (simple_stmt, suite1),},
+    2: {
+        None: (simple_stmt, suite1),},
+    3: {
+        None: (simple_stmt, suite1),},
+    4: {
+        None: (None, suite2),},}
+
+
+test0 = test
+test1 = State(True)
+test2 = State(False)
+test3 = State(False)
+test4 = State(False)
+test5 = State(True)
+test5.bootstrap = {}
+test4.arc(Label(256, test), test5)
+test4.bootstrap = {
+    1: {
+        'not': (test, test5),
+        None: (test, test5),
+        'None': (test, test5),
+        'True': (test, test5),
+        'False': (test, test5),
+        'lambda': (test, test5),},
+    54: {
+        '+': (test, test5),
+        '-': (test, test5),
+        '~': (test, test5),
+        '(': (test, test5),
+        '[': (test, test5),
+        '{': (test, test5),
+        '...': (test, test5),},
+    2: {
+        None: (test, test5),},
+    3: {
+        None: (test, test5),},}
+test3.arc(Label(1, 'else'), test4)
+test3.bootstrap = {
+    1: {
+        'else': (None, test4),},}
+test2.arc(Label(256, or_test), test3)
+test2.bootstrap = {
+    1: {
+        'not': (or_test, test3),
+        None: (or_test, test3),
+        'None': (or_test, test3),
+        'True': (or_test, test3),
+        'False': (or_test, test3),},
+    54: {
+        '+': (or_test, test3),
+        '-': (or_test, test3),
+        '~': (or_test, test3),
+        '(': (or_test, test3),
+        '[': (or_test, test3),
+        '{': (or_test, test3),
+        '...': (or_test, test3),},
+    2: {
+        None: (or_test, test3),},
+    3: {
+        None: (or_test, test3),},}
+test1.arc(Label(1, 'if'), test2)
+test1.bootstrap = {
+    1: {
+        'if': (None, test2),},}
+test0.arc(Label(256, or_test), test1)
+test0.arc(Label(256, lambdef), test5)
+test0.bootstrap = {
+    1: {
+        'not': (or_test, test1),
+        None: (or_test, test1),
+        'None': (or_test, test1),
+        'True': (or_test, test1),
+        'False': (or_test, test1),
+        'lambda': (lambdef, test5),},
+    54: {
+        '+': (or_test, test1),
+        '-': (or_test, test1),
+        '~': (or_test, test1),
+        '(': (or_test, test1),
+        '[': (or_test, test1),
+        '{': (or_test, test1),
+        '...': (or_test, test1),},
+    2: {
+        None: (or_test, test1),},
+    3: {
+        None: (or_test, test1),},}
+
+
+test_nocond0 = test_nocond
+test_nocond1 = State(True)
+test_nocond1.bootstrap = {}
+test_nocond0.arc(Label(256, or_test), test_nocond1)
+test_nocond0.arc(Label(256, lambdef_nocond), test_nocond1)
+test_nocond0.bootstrap = {
+    1: {
+        'not': (or_test, test_nocond1),
+        None: (or_test, test_nocond1),
+        'None': (or_test, test_nocond1),
+        'True': (or_test, test_nocond1),
+        'False': (or_test, test_nocond1),
+        'lambda': (lambdef_nocond, test_nocond1),},
+    54: {
+        '+': (or_test, test_nocond1),
+        '-': (or_test, test_nocond1),
+        '~': (or_test, test_nocond1),
+        '(': (or_test, test_nocond1),
+        '[': (or_test, test_nocond1),
+        '{': (or_test, test_nocond1),
+        '...': (or_test, test_nocond1),},
+    2: {
+        None: (or_test, test_nocond1),},
+    3: {
+        None: (or_test, test_nocond1),},}
+
+
+lambdef0 = lambdef
+lambdef1 = State(False)
+lambdef2 = State(False)
+lambdef3 = State(False)
+lambdef4 = State(True)
+lambdef4.bootstrap = {}
+lambdef3.arc(Label(256, test), lambdef4)
+lambdef3.bootstrap = {
+    1: {
+        'not': (test, lambdef4),
+        None: (test, lambdef4),
+        'None': (test, lambdef4),
+        'True': (test, lambdef4),
+        'False': (test, lambdef4),
+        'lambda': (test, lambdef4),},
+    54: {
+        '+': (test, lambdef4),
+        '-': (test, lambdef4),
+        '~': (test, lambdef4),
+        '(': (test, lambdef4),
+        '[': (test, lambdef4),
+        '{': (test, lambdef4),
+        '...': (test, lambdef4),},
+    2: {
+        None: (test, lambdef4),},
+    3: {
+        None: (test, lambdef4),},}
+lambdef2.arc(Label(54, ':'), lambdef3)
+lambdef2.bootstrap = {
+    54: {
+        ':': (None, lambdef3),},}
+lambdef1.arc(Label(256, varargslist), lambdef2)
+lambdef1.arc(Label(54, ':'), lambdef3)
+lambdef1.bootstrap = {
+    1: {
+        None: (varargslist, lambdef2),},
+    54: {
+        '*': (varargslist, lambdef2),
+        '**': (varargslist, lambdef2),
+        ':': (None, lambdef3),},}
+lambdef0.arc(Label(1, 'lambda'), lambdef1)
+lambdef0.bootstrap = {
+    1: {
+        'lambda': (None, lambdef1),},}
+
+
+lambdef_nocond0 = lambdef_nocond
+lambdef_nocond1 = State(False)
+lambdef_nocond2 = State(False)
+lambdef_nocond3 = State(False)
+lambdef_nocond4 = State(True)
+lambdef_nocond4.bootstrap = {}
+lambdef_nocond3.arc(Label(256, test_nocond), lambdef_nocond4)
+lambdef_nocond3.bootstrap = {
+    1: {
+        'not': (test_nocond, lambdef_nocond4),
+        None: (test_nocond, lambdef_nocond4),
+        'None': (test_nocond, lambdef_nocond4),
+        'True': (test_nocond, lambdef_nocond4),
+        'False': (test_nocond, lambdef_nocond4),
+        'lambda': (test_nocond, lambdef_nocond4),},
+    54: {
+        '+': (test_nocond, lambdef_nocond4),
+        '-': (test_nocond, lambdef_nocond4),
+        '~': (test_nocond, lambdef_nocond4),
+        '(': (test_nocond, lambdef_nocond4),
+        '[': (test_nocond, lambdef_nocond4),
+        '{': (test_nocond, lambdef_nocond4),
+        '...': (test_nocond, lambdef_nocond4),},
+    2: {
+        None: (test_nocond, lambdef_nocond4),},
+    3: {
+        None: (test_nocond, lambdef_nocond4),},}
+lambdef_nocond2.arc(Label(54, ':'), lambdef_nocond3)
+lambdef_nocond2.bootstrap = {
+    54: {
+        ':': (None, lambdef_nocond3),},}
+lambdef_nocond1.arc(Label(256, varargslist), lambdef_nocond2)
+lambdef_nocond1.arc(Label(54, ':'), lambdef_nocond3)
+lambdef_nocond1.bootstrap = {
+    1: {
+        None: (varargslist, lambdef_nocond2),},
+    54: {
+        '*': (varargslist, lambdef_nocond2),
+        '**': (varargslist, lambdef_nocond2),
+        ':': (None, lambdef_nocond3),},}
+lambdef_nocond0.arc(Label(1, 'lambda'), lambdef_nocond1)
+lambdef_nocond0.bootstrap = {
+    1: {
+        'lambda': (None, lambdef_nocond1),},}
+
+
+or_test0 = or_test
+or_test1 = State(True)
+or_test1.arc(Label(1, 'or'), or_test0)
+or_test1.bootstrap = {
+    1: {
+        'or': (None, or_test0),},}
+or_test0.arc(Label(256, and_test), or_test1)
+or_test0.bootstrap = {
+    1: {
+        'not': (and_test, or_test1),
+        None: (and_test, or_test1),
+        'None': (and_test, or_test1),
+        'True': (and_test, or_test1),
+        'False': (and_test, or_test1),},
+    54: {
+        '+': (and_test, or_test1),
+        '-': (and_test, or_test1),
+        '~': (and_test, or_test1),
+        '(': (and_test, or_test1),
+        '[': (and_test, or_test1),
+        '{': (and_test, or_test1),
+        '...': (and_test, or_test1),},
+    2: {
+        None: (and_test, or_test1),},
+    3: {
+        None: (and_test, or_test1),},}
+
+
+and_test0 = and_test
+and_test1 = State(True)
+and_test1.arc(Label(1, 'and'), and_test0)
+and_test1.bootstrap = {
+    1: {
+        'and': (None, and_test0),},}
+and_test0.arc(Label(256, not_test), and_test1)
+and_test0.bootstrap = {
+    1: {
+        'not': (not_test, and_test1),
+        None: (not_test, and_test1),
+        'None': (not_test, and_test1),
+        'True': (not_test, and_test1),
+        'False': (not_test, and_test1),},
+    54: {
+        '+': (not_test, and_test1),
+        '-': (not_test, and_test1),
+        '~': (not_test, and_test1),
+        '(': (not_test, and_test1),
+        '[': (not_test, and_test1),
+        '{': (not_test, and_test1),
+        '...': (not_test, and_test1),},
+    2: {
+        None: (not_test, and_test1),},
+    3: {
+        None: (not_test, and_test1),},}
+
+
+not_test0 = not_test
+not_test1 = State(False)
+not_test2 = State(True)
+not_test2.bootstrap = {}
+not_test1.arc(Label(256, not_test), not_test2)
+not_test1.bootstrap = {
+    1: {
+        'not': (not_test, not_test2),
+        None: (not_test, not_test2),
+        'None': (not_test, not_test2),
+        'True': (not_test, not_test2),
+        'False': (not_test, not_test2),},
+    54: {
+        '+': (not_test, not_test2),
+        '-': (not_test, not_test2),
+        '~': (not_test, not_test2),
+        '(': (not_test, not_test2),
+        '[': (not_test, not_test2),
+        '{': (not_test, not_test2),
+        '...': (not_test, not_test2),},
+    2: {
+        None: (not_test, not_test2),},
+    3: {
+        None: (not_test, not_test2),},}
+not_test0.arc(Label(1, 'not'), not_test1)
+not_test0.arc(Label(256, comparison), not_test2)
+not_test0.bootstrap = {
+    1: {
+        'not': (None, not_test1),
+        None: (comparison, not_test2),
+        'None': (comparison, not_test2),
+        'True': (comparison, not_test2),
+        'False': (comparison, not_test2),},
+    54: {
+        '+': (comparison, not_test2),
+        '-': (comparison, not_test2),
+        '~': (comparison, not_test2),
+        '(': (comparison, not_test2),
+        '[': (comparison, not_test2),
+        '{': (comparison, not_test2),
+        '...': (comparison, not_test2),},
+    2: {
+        None: (comparison, not_test2),},
+    3: {
+        None: (comparison, not_test2),},}
+
+
+comparison0 = comparison
+comparison1 = State(True)
+comparison1.arc(Label(256, comp_op), comparison0)
+comparison1.bootstrap = {
+    54: {
+        '<': (comp_op, comparison0),
+        '>': (comp_op, comparison0),
+        '==': (comp_op, comparison0),
+        '>=': (comp_op, comparison0),
+        '<=': (comp_op, comparison0),
+        '<>': (comp_op, comparison0),
+        '!=': (comp_op, comparison0),},
+    1: {
+        'in': (comp_op, comparison0),
+        'not': (comp_op, comparison0),
+        'is': (comp_op, comparison0),},}
+comparison0.arc(Label(256, expr), comparison1)
+comparison0.bootstrap = {
+    54: {
+        '+': (expr, comparison1),
+        '-': (expr, comparison1),
+        '~': (expr, comparison1),
+        '(': (expr, comparison1),
+        '[': (expr, comparison1),
+        '{': (expr, comparison1),
+        '...': (expr, comparison1),},
+    1: {
+        None: (expr, comparison1),
+        'None': (expr, comparison1),
+        'True': (expr, comparison1),
+        'False': (expr, comparison1),},
+    2: {
+        None: (expr, comparison1),},
+    3: {
+        None: (expr, comparison1),},}
+
+
+comp_op0 = comp_op
+comp_op1 = State(True)
+comp_op1.bootstrap = {}
+comp_op0.arc(Label(54, '<'), comp_op1)
+comp_op0.arc(Label(54, '>'), comp_op1)
+comp_op0.arc(Label(54, '=='), comp_op1)
+comp_op0.arc(Label(54, '>='), comp_op1)
+comp_op0.arc(Label(54, '<='), comp_op1)
+comp_op0.arc(Label(54, '<>'), comp_op1)
+comp_op0.arc(Label(54, '!='), comp_op1)
+comp_op0.arc(Label(1, 'in'), comp_op1)
+comp_op2 = State(False)
+comp_op2.arc(Label(1, 'in'), comp_op1)
+comp_op2.bootstrap = {
+    1: {
+        'in': (None, comp_op1),},}
+comp_op0.arc(Label(1, 'not'), comp_op2)
+comp_op3 = State(True)
+comp_op3.arc(Label(1, 'not'), comp_op1)
+comp_op3.bootstrap = {
+    1: {
+        'not': (None, comp_op1),},}
+comp_op0.arc(Label(1, 'is'), comp_op3)
+comp_op0.bootstrap = {
+    54: {
+        '<': (None, comp_op1),
+        '>': (None, comp_op1),
+        '==': (None, comp_op1),
+        '>=': (None, comp_op1),
+        '<=': (None, comp_op1),
+        '<>': (None, comp_op1),
+        '!=': (None, comp_op1),},
+    1: {
+        'in': (None, comp_op1),
+        'not': (None, comp_op2),
+        'is': (None, comp_op3),},}
+
+
+star_expr0 = star_expr
+star_expr1 = State(False)
+star_expr2 = State(True)
+star_expr2.bootstrap = {}
+star_expr1.arc(Label(256, expr), star_expr2)
+star_expr1.bootstrap = {
+    54: {
+        '+': (expr, star_expr2),
+        '-': (expr, star_expr2),
+        '~': (expr, star_expr2),
+        '(': (expr, star_expr2),
+        '[': (expr, star_expr2),
+        '{': (expr, star_expr2),
+        '...': (expr, star_expr2),},
+    1: {
+        None: (expr, star_expr2),
+        'None': (expr, star_expr2),
+        'True': (expr, star_expr2),
+        'False': (expr, star_expr2),},
+    2: {
+        None: (expr, star_expr2),},
+    3: {
+        None: (expr, star_expr2),},}
+star_expr0.arc(Label(54, '*'), star_expr1)
+star_expr0.bootstrap = {
+    54: {
+        '*': (None, star_expr1),},}
+
+
+expr0 = expr
+expr1 = State(True)
+expr1.arc(Label(54, '|'), expr0)
+expr1.bootstrap = {
+    54: {
+        '|': (None, expr0),},}
+expr0.arc(Label(256, xor_expr), expr1)
+expr0.bootstrap = {
+    54: {
+        '+': (xor_expr, expr1),
+        '-': (xor_expr, expr1),
+        '~': (xor_expr, expr1),
+        '(': (xor_expr, expr1),
+        '[': (xor_expr, expr1),
+        '{': (xor_expr, expr1),
+        '...': (xor_expr, expr1),},
+    1: {
+        None: (xor_expr, expr1),
+        'None': (xor_expr, expr1),
+        'True': (xor_expr, expr1),
+        'False': (xor_expr, expr1),},
+    2: {
+        None: (xor_expr, expr1),},
+    3: {
+        None: (xor_expr, expr1),},}
+
+
+xor_expr0 = xor_expr
+xor_expr1 = State(True)
+xor_expr1.arc(Label(54, '^'), xor_expr0)
+xor_expr1.bootstrap = {
+    54: {
+        '^': (None, xor_expr0),},}
+xor_expr0.arc(Label(256, and_expr), xor_expr1)
+xor_expr0.bootstrap = {
+    54: {
+        '+': (and_expr, xor_expr1),
+        '-': (and_expr, xor_expr1),
+        '~': (and_expr, xor_expr1),
+        '(': (and_expr, xor_expr1),
+        '[': (and_expr, xor_expr1),
+        '{': (and_expr, xor_expr1),
+        '...': (and_expr, xor_expr1),},
+    1: {
+        None: (and_expr, xor_expr1),
+        'None': (and_expr, xor_expr1),
+        'True': (and_expr, xor_expr1),
+        'False': (and_expr, xor_expr1),},
+    2: {
+        None: (and_expr, xor_expr1),},
+    3: {
+        None: (and_expr, xor_expr1),},}
+
+
+and_expr0 = and_expr
+and_expr1 = State(True)
+and_expr1.arc(Label(54, '&'), and_expr0)
+and_expr1.bootstrap = {
+    54: {
+        '&': (None, and_expr0),},}
+and_expr0.arc(Label(256, shift_expr), and_expr1)
+and_expr0.bootstrap = {
+    54: {
+        '+': (shift_expr, and_expr1),
+        '-': (shift_expr, and_expr1),
+        '~': (shift_expr, and_expr1),
+        '(': (shift_expr, and_expr1),
+        '[': (shift_expr, and_expr1),
+        '{': (shift_expr, and_expr1),
+        '...': (shift_expr, and_expr1),},
+    1: {
+        None: (shift_expr, and_expr1),
+        'None': (shift_expr, and_expr1),
+        'True': (shift_expr, and_expr1),
+        'False': (shift_expr, and_expr1),},
+    2: {
+        None: (shift_expr, and_expr1),},
+    3: {
+        None: (shift_expr, and_expr1),},}
+
+
+shift_expr0 = shift_expr
+shift_expr1 = State(True)
+shift_expr1.arc(Label(54, '<<'), shift_expr0)
+shift_expr1.arc(Label(54, '>>'), shift_expr0)
+shift_expr1.bootstrap = {
+    54: {
+        '<<': (None, shift_expr0),
+        '>>': (None, shift_expr0),},}
+shift_expr0.arc(Label(256, arith_expr), shift_expr1)
+shift_expr0.bootstrap = {
+    54: {
+        '+': (arith_expr, shift_expr1),
+        '-': (arith_expr, shift_expr1),
+        '~': (arith_expr, shift_expr1),
+        '(': (arith_expr, shift_expr1),
+        '[': (arith_expr, shift_expr1),
+        '{': (arith_expr, shift_expr1),
+        '...': (arith_expr, shift_expr1),},
+    1: {
+        None: (arith_expr, shift_expr1),
+        'None': (arith_expr, shift_expr1),
+        'True': (arith_expr, shift_expr1),
+        'False': (arith_expr, shift_expr1),},
+    2: {
+        None: (arith_expr, shift_expr1),},
+    3: {
+        None: (arith_expr, shift_expr1),},}
+
+
+arith_expr0 = arith_expr
+arith_expr1 = State(True)
+arith_expr1.arc(Label(54, '+'), arith_expr0)
+arith_expr1.arc(Label(54, '-'), arith_expr0)
+arith_expr1.bootstrap = {
+    54: {
+        '+': (None, arith_expr0),
+        '-': (None, arith_expr0),},}
+arith_expr0.arc(Label(256, term), arith_expr1)
+arith_expr0.bootstrap = {
+    54: {
+        '+': (term, arith_expr1),
+        '-': (term, arith_expr1),
+        '~': (term, arith_expr1),
+        '(': (term, arith_expr1),
+        '[': (term, arith_expr1),
+        '{': (term, arith_expr1),
+        '...': (term, arith_expr1),},
+    1: {
+        None: (term, arith_expr1),
+        'None': (term, arith_expr1),
+        'True': (term, arith_expr1),
+        'False': (term, arith_expr1),},
+    2: {
+        None: (term, arith_expr1),},
+    3: {
+        None: (term, arith_expr1),},}
+
+
+term0 = term
+term1 = State(True)
+term1.arc(Label(54, '*'), term0)
+term1.arc(Label(1, '/'), term0)
+term1.arc(Label(54, '%'), term0)
+term1.arc(Label(54, '//'), term0)
+term1.bootstrap = {
+    54: {
+        '*': (None, term0),
+        '%': (None, term0),
+        '//': (None, term0),},
+    1: {
+        '/': (None, term0),},}
+term0.arc(Label(256, factor), term1)
+term0.bootstrap = {
+    54: {
+        '+': (factor, term1),
+        '-': (factor, term1),
+        '~': (factor, term1),
+        '(': (factor, term1),
+        '[': (factor, term1),
+        '{': (factor, term1),
+        '...': (factor, term1),},
+    1: {
+        None: (factor, term1),
+        'None': (factor, term1),
+        'True': (factor, term1),
+        'False': (factor, term1),},
+    2: {
+        None: (factor, term1),},
+    3: {
+        None: (factor, term1),},}
+
+
+factor0 = factor
+factor1 = State(False)
+factor2 = State(True)
+factor2.bootstrap = {}
+factor1.arc(Label(256, factor), factor2)
+factor1.bootstrap = {
+    54: {
+        '+': (factor, factor2),
+        '-': (factor, factor2),
+        '~': (factor, factor2),
+        '(': (factor, factor2),
+        '[': (factor, factor2),
+        '{': (factor, factor2),
+        '...': (factor, factor2),},
+    1: {
+        None: (factor, factor2),
+        'None': (factor, factor2),
+        'True': (factor, factor2),
+        'False': (factor, factor2),},
+    2: {
+        None: (factor, factor2),},
+    3: {
+        None: (factor, factor2),},}
+factor0.arc(Label(54, '+'), factor1)
+factor0.arc(Label(54, '-'), factor1)
+factor0.arc(Label(54, '~'), factor1)
+factor0.arc(Label(256, power), factor2)
+factor0.bootstrap = {
+    54: {
+        '+': (None, factor1),
+        '-': (None, factor1),
+        '~': (None, factor1),
+        '(': (power, factor2),
+        '[': (power, factor2),
+        '{': (power, factor2),
+        '...': (power, factor2),},
+    1: {
+        None: (power, factor2),
+        'None': (power, factor2),
+        'True': (power, factor2),
+        'False': (power, factor2),},
+    2: {
+        None: (power, factor2),},
+    3: {
+        None: (power, factor2),},}
+
+
+power0 = power
+power1 = State(True)
+power1.arc(Label(256, trailer), power1)
+power2 = State(False)
+power3 = State(True)
+power3.bootstrap = {}
+power2.arc(Label(256, factor), power3)
+power2.bootstrap = {
+    54: {
+        '+': (factor, power3),
+        '-': (factor, power3),
+        '~': (factor, power3),
+        '(': (factor, power3),
+        '[': (factor, power3),
+        '{': (factor, power3),
+        '...': (factor, power3),},
+    1: {
+        None: (factor, power3),
+        'None': (factor, power3),
+        'True': (factor, power3),
+        'False': (factor, power3),},
+    2: {
+        None: (factor, power3),},
+    3: {
+        None: (factor, power3),},}
+power1.arc(Label(54, '**'), power2)
+power1.bootstrap = {
+    54: {
+        '(': (trailer, power1),
+        '[': (trailer, power1),
+        '.': (trailer, power1),
+        '**': (None, power2),},}
+power0.arc(Label(256, atom), power1)
+power0.bootstrap = {
+    54: {
+        '(': (atom, power1),
+        '[': (atom, power1),
+        '{': (atom, power1),
+        '...': (atom, power1),},
+    1: {
+        None: (atom, power1),
+        'None': (atom, power1),
+        'True': (atom, power1),
+        'False': (atom, power1),},
+    2: {
+        None: (atom, power1),},
+    3: {
+        None: (atom, power1),},}
+
+
+atom0 = atom
+atom1 = State(False)
+atom2 = State(False)
+atom3 = State(True)
+atom3.bootstrap = {}
+atom2.arc(Label(54, ')'), atom3)
+atom2.bootstrap = {
+    54: {
+        ')': (None, atom3),},}
+atom1.arc(Label(256, yield_expr), atom2)
+atom1.arc(Label(256, testlist_comp), atom2)
+atom1.arc(Label(54, ')'), atom3)
+atom1.bootstrap = {
+    1: {
+        'yield': (yield_expr, atom2),
+        'not': (testlist_comp, atom2),
+        None: (testlist_comp, atom2),
+        'None': (testlist_comp, atom2),
+        'True': (testlist_comp, atom2),
+        'False': (testlist_comp, atom2),
+        'lambda': (testlist_comp, atom2),},
+    54: {
+        '+': (testlist_comp, atom2),
+        '-': (testlist_comp, atom2),
+        '~': (testlist_comp, atom2),
+        '(': (testlist_comp, atom2),
+        '[': (testlist_comp, atom2),
+        '{': (testlist_comp, atom2),
+        '...': (testlist_comp, atom2),
+        '*': (testlist_comp, atom2),
+        ')': (None, atom3),},
+    2: {
+        None: (testlist_comp, atom2),},
+    3: {
+        None: (testlist_comp, atom2),},}
+atom0.arc(Label(54, '('), atom1)
+atom4 = State(False)
+atom5 = State(False)
+atom5.arc(Label(54, ']'), atom3)
+atom5.bootstrap = {
+    54: {
+        ']': (None, atom3),},}
+atom4.arc(Label(256, testlist_comp), atom5)
+atom4.arc(Label(54, ']'), atom3)
+atom4.bootstrap = {
+    1: {
+        'not': (testlist_comp, atom5),
+        None: (testlist_comp, atom5),
+        'None': (testlist_comp, atom5),
+        'True': (testlist_comp, atom5),
+        'False': (testlist_comp, atom5),
+        'lambda': (testlist_comp, atom5),},
+    54: {
+        '+': (testlist_comp, atom5),
+        '-': (testlist_comp, atom5),
+        '~': (testlist_comp, atom5),
+        '(': (testlist_comp, atom5),
+        '[': (testlist_comp, atom5),
+        '{': (testlist_comp, atom5),
+        '...': (testlist_comp, atom5),
+        '*': (testlist_comp, atom5),
+        ']': (None, atom3),},
+    2: {
+        None: (testlist_comp, atom5),},
+    3: {
+        None: (testlist_comp, atom5),},}
+atom0.arc(Label(54, '['), atom4)
+atom6 = State(False)
+atom7 = State(False)
+atom7.arc(Label(54, '}'), atom3)
+atom7.bootstrap = {
+    54: {
+        '}': (None, atom3),},}
+atom6.arc(Label(256, dictorsetmaker), atom7)
+atom6.arc(Label(54, '}'), atom3)
+atom6.bootstrap = {
+    1: {
+        'not': (dictorsetmaker, atom7),
+        None: (dictorsetmaker, atom7),
+        'None': (dictorsetmaker, atom7),
+        'True': (dictorsetmaker, atom7),
+        'False': (dictorsetmaker, atom7),
+        'lambda': (dictorsetmaker, atom7),},
+    54: {
+        '+': (dictorsetmaker, atom7),
+        '-': (dictorsetmaker, atom7),
+        '~': (dictorsetmaker, atom7),
+        '(': (dictorsetmaker, atom7),
+        '[': (dictorsetmaker, atom7),
+        '{': (dictorsetmaker, atom7),
+        '...': (dictorsetmaker, atom7),
+        '}': (None, atom3),},
+    2: {
+        None: (dictorsetmaker, atom7),},
+    3: {
+        None: (dictorsetmaker, atom7),},}
+atom0.arc(Label(54, '{'), atom6)
+atom0.arc(Label(1, None), atom3)
+atom0.arc(Label(2, None), atom3)
+atom8 = State(True)
+atom8.arc(Label(3, None), atom8)
+atom8.bootstrap = {
+    3: {
+        None: (None, atom8),},}
+atom0.arc(Label(3, None), atom8)
+atom0.arc(Label(54, '...'), atom3)
+atom0.arc(Label(1, 'None'), atom3)
+atom0.arc(Label(1, 'True'), atom3)
+atom0.arc(Label(1, 'False'), atom3)
+atom0.bootstrap = {
+    54: {
+        '(': (None, atom1),
+        '[': (None, atom4),
+        '{': (None, atom6),
+        '...': (None, atom3),},
+    1: {
+        None: (None, atom3),
+        'None': (None, atom3),
+        'True': (None, atom3),
+        'False': (None, atom3),},
+    2: {
+        None: (None, atom3),},
+    3: {
+        None: (None, atom8),},}
+
+
+testlist_comp0 = testlist_comp
+testlist_comp1 = State(True)
+testlist_comp2 = State(True)
+testlist_comp2.bootstrap = {}
+testlist_comp1.arc(Label(256, comp_for), testlist_comp2)
+testlist_comp3 = State(True)
+testlist_comp4 = State(True)
+testlist_comp4.arc(Label(54, ','), testlist_comp3)
+testlist_comp4.bootstrap = {
+    54: {
+        ',': (None, testlist_comp3),},}
+testlist_comp3.arc(Label(256, test), testlist_comp4)
+testlist_comp3.arc(Label(256, star_expr), testlist_comp4)
+testlist_comp3.bootstrap = {
+    1: {
+        'not': (test, testlist_comp4),
+        None: (test, testlist_comp4),
+        'None': (test, testlist_comp4),
+        'True': (test, testlist_comp4),
+        'False': (test, testlist_comp4),
+        'lambda': (test, testlist_comp4),},
+    54: {
+        '+': (test, testlist_comp4),
+        '-': (test, testlist_comp4),
+        '~': (test, testlist_comp4),
+        '(': (test, testlist_comp4),
+        '[': (test, testlist_comp4),
+        '{': (test, testlist_comp4),
+        '...': (test, testlist_comp4),
+        '*': (star_expr, testlist_comp4),},
+    2: {
+        None: (test, testlist_comp4),},
+    3: {
+        None: (test, testlist_comp4),},}
+testlist_comp1.arc(Label(54, ','), testlist_comp3)
+testlist_comp1.bootstrap = {
+    1: {
+        'for': (comp_for, testlist_comp2),},
+    54: {
+        ',': (None, testlist_comp3),},}
+testlist_comp0.arc(Label(256, test), testlist_comp1)
+testlist_comp0.arc(Label(256, star_expr), testlist_comp1)
+testlist_comp0.bootstrap = {
+    1: {
+        'not': (test, testlist_comp1),
+        None: (test, testlist_comp1),
+        'None': (test, testlist_comp1),
+        'True': (test, testlist_comp1),
+        'False': (test, testlist_comp1),
+        'lambda': (test, testlist_comp1),},
+    54: {
+        '+': (test, testlist_comp1),
+        '-': (test, testlist_comp1),
+        '~': (test, testlist_comp1),
+        '(': (test, testlist_comp1),
+        '[': (test, testlist_comp1),
+        '{': (test, testlist_comp1),
+        '...': (test, testlist_comp1),
+        '*': (star_expr, testlist_comp1),},
+    2: {
+        None: (test, testlist_comp1),},
+    3: {
+        None: (test, testlist_comp1),},}
+
+
+trailer0 = trailer
+trailer1 = State(False)
+trailer2 = State(False)
+trailer3 = State(True)
+trailer3.bootstrap = {}
+trailer2.arc(Label(54, ')'), trailer3)
+trailer2.bootstrap = {
+    54: {
+        ')': (None, trailer3),},}
+trailer1.arc(Label(256, arglist), trailer2)
+trailer1.arc(Label(54, ')'), trailer3)
+trailer1.bootstrap = {
+    1: {
+        'not': (arglist, trailer2),
+        None: (arglist, trailer2),
+        'None': (arglist, trailer2),
+        'True': (arglist, trailer2),
+        'False': (arglist, trailer2),
+        'lambda': (arglist, trailer2),},
+    54: {
+        '+': (arglist, trailer2),
+        '-': (arglist, trailer2),
+        '~': (arglist, trailer2),
+        '(': (arglist, trailer2),
+        '[': (arglist, trailer2),
+        '{': (arglist, trailer2),
+        '...': (arglist, trailer2),
+        '*': (arglist, trailer2),
+        '**': (arglist, trailer2),
+        ')': (None, trailer3),},
+    2: {
+        None: (arglist, trailer2),},
+    3: {
+        None: (arglist, trailer2),},}
+trailer0.arc(Label(54, '('), trailer1)
+trailer4 = State(False)
+trailer5 = State(False)
+trailer5.arc(Label(54, ']'), trailer3)
+trailer5.bootstrap = {
+    54: {
+        ']': (None, trailer3),},}
+trailer4.arc(Label(256, subscriptlist), trailer5)
+trailer4.bootstrap = {
+    1: {
+        'not': (subscriptlist, trailer5),
+        None: (subscriptlist, trailer5),
+        'None': (subscriptlist, trailer5),
+        'True': (subscriptlist, trailer5),
+        'False': (subscriptlist, trailer5),
+        'lambda': (subscriptlist, trailer5),},
+    54: {
+        '+': (subscriptlist, trailer5),
+        '-': (subscriptlist, trailer5),
+        '~': (subscriptlist, trailer5),
+        '(': (subscriptlist, trailer5),
+        '[': (subscriptlist, trailer5),
+        '{': (subscriptlist, trailer5),
+        '...': (subscriptlist, trailer5),
+        ':': (subscriptlist, trailer5),},
+    2: {
+        None: (subscriptlist, trailer5),},
+    3: {
+        None: (subscriptlist, trailer5),},}
+trailer0.arc(Label(54, '['), trailer4)
+trailer6 = State(False)
+trailer6.arc(Label(1, None), trailer3)
+trailer6.bootstrap = {
+    1: {
+        None: (None, trailer3),},}
+trailer0.arc(Label(54, '.'), trailer6)
+trailer0.bootstrap = {
+    54: {
+        '(': (None, trailer1),
+        '[': (None, trailer4),
+        '.': (None, trailer6),},}
+
+
+subscriptlist0 = subscriptlist
+subscriptlist1 = State(True)
+subscriptlist2 = State(True)
+subscriptlist2.arc(Label(256, subscript), subscriptlist1)
+subscriptlist2.bootstrap = {
+    1: {
+        'not': (subscript, subscriptlist1),
+        None: (subscript, subscriptlist1),
+        'None': (subscript, subscriptlist1),
+        'True': (subscript, subscriptlist1),
+        'False': (subscript, subscriptlist1),
+        'lambda': (subscript, subscriptlist1),},
+    54: {
+        '+': (subscript, subscriptlist1),
+        '-': (subscript, subscriptlist1),
+        '~': (subscript, subscriptlist1),
+        '(': (subscript, subscriptlist1),
+        '[': (subscript, subscriptlist1),
+        '{': (subscript, subscriptlist1),
+        '...': (subscript, subscriptlist1),
+        ':': (subscript, subscriptlist1),},
+    2: {
+        None: (subscript, subscriptlist1),},
+    3: {
+        None: (subscript, subscriptlist1),},}
+subscriptlist1.arc(Label(54, ','), subscriptlist2)
+subscriptlist1.bootstrap = {
+    54: {
+        ',': (None, subscriptlist2),},}
+subscriptlist0.arc(Label(256, subscript), subscriptlist1)
+subscriptlist0.bootstrap = {
+    1: {
+        'not': (subscript, subscriptlist1),
+        None: (subscript, subscriptlist1),
+        'None': (subscript, subscriptlist1),
+        'True': (subscript, subscriptlist1),
+        'False': (subscript, subscriptlist1),
+        'lambda': (subscript, subscriptlist1),},
+    54: {
+        '+': (subscript, subscriptlist1),
+        '-': (subscript, subscriptlist1),
+        '~': (subscript, subscriptlist1),
+        '(': (subscript, subscriptlist1),
+        '[': (subscript, subscriptlist1),
+        '{': (subscript, subscriptlist1),
+        '...': (subscript, subscriptlist1),
+        ':': (subscript, subscriptlist1),},
+    2: {
+        None: (subscript, subscriptlist1),},
+    3: {
+        None: (subscript, subscriptlist1),},}
+
+
+subscript0 = subscript
+subscript1 = State(True)
+subscript2 = State(True)
+subscript3 = State(True)
+subscript4 = State(True)
+subscript4.bootstrap = {}
+subscript3.arc(Label(256, sliceop), subscript4)
+subscript3.bootstrap = {
+    54: {
+        ':': (sliceop, subscript4),},}
+subscript2.arc(Label(256, test), subscript3)
+subscript2.arc(Label(256, sliceop), subscript4)
+subscript2.bootstrap = {
+    1: {
+        'not': (test, subscript3),
+        None: (test, subscript3),
+        'None': (test, subscript3),
+        'True': (test, subscript3),
+        'False': (test, subscript3),
+        'lambda': (test, subscript3),},
+    54: {
+        '+': (test, subscript3),
+        '-': (test, subscript3),
+        '~': (test, subscript3),
+        '(': (test, subscript3),
+        '[': (test, subscript3),
+        '{': (test, subscript3),
+        '...': (test, subscript3),
+        ':': (sliceop, subscript4),},
+    2: {
+        None: (test, subscript3),},
+    3: {
+        None: (test, subscript3),},}
+subscript1.arc(Label(54, ':'), subscript2)
+subscript1.bootstrap = {
+    54: {
+        ':': (None, subscript2),},}
+subscript0.arc(Label(256, test), subscript1)
+subscript0.arc(Label(54, ':'), subscript2)
+subscript0.bootstrap = {
+    1: {
+        'not': (test, subscript1),
+        None: (test, subscript1),
+        'None': (test, subscript1),
+        'True': (test, subscript1),
+        'False': (test, subscript1),
+        'lambda': (test, subscript1),},
+    54: {
+        '+': (test, subscript1),
+        '-': (test, subscript1),
+        '~': (test, subscript1),
+        '(': (test, subscript1),
+        '[': (test, subscript1),
+        '{': (test, subscript1),
+        '...': (test, subscript1),
+        ':': (None, subscript2),},
+    2: {
+        None: (test, subscript1),},
+    3: {
+        None: (test, subscript1),},}
+
+
+sliceop0 = sliceop
+sliceop1 = State(True)
+sliceop2 = State(True)
+sliceop2.bootstrap = {}
+sliceop1.arc(Label(256, test), sliceop2)
+sliceop1.bootstrap = {
+    1: {
+        'not': (test, sliceop2),
+        None: (test, sliceop2),
+        'None': (test, sliceop2),
+        'True': (test, sliceop2),
+        'False': (test, sliceop2),
+        'lambda': (test, sliceop2),},
+    54: {
+        '+': (test, sliceop2),
+        '-': (test, sliceop2),
+        '~': (test, sliceop2),
+        '(': (test, sliceop2),
+        '[': (test, sliceop2),
+        '{': (test, sliceop2),
+        '...': (test, sliceop2),},
+    2: {
+        None: (test, sliceop2),},
+    3: {
+        None: (test, sliceop2),},}
+sliceop0.arc(Label(54, ':'), sliceop1)
+sliceop0.bootstrap = {
+    54: {
+        ':': (None, sliceop1),},}
+
+
+exprlist0 = exprlist
+exprlist1 = State(True)
+exprlist2 = State(True)
+exprlist2.arc(Label(256, expr), exprlist1)
+exprlist2.arc(Label(256, star_expr), exprlist1)
+exprlist2.bootstrap = {
+    54: {
+        '+': (expr, exprlist1),
+        '-': (expr, exprlist1),
+        '~': (expr, exprlist1),
+        '(': (expr, exprlist1),
+        '[': (expr, exprlist1),
+        '{': (expr, exprlist1),
+        '...': (expr, exprlist1),
+        '*': (star_expr, exprlist1),},
+    1: {
+        None: (expr, exprlist1),
+        'None': (expr, exprlist1),
+        'True': (expr, exprlist1),
+        'False': (expr, exprlist1),},
+    2: {
+        None: (expr, exprlist1),},
+    3: {
+        None: (expr, exprlist1),},}
+exprlist1.arc(Label(54, ','), exprlist2)
+exprlist1.bootstrap = {
+    54: {
+        ',': (None, exprlist2),},}
+exprlist0.arc(Label(256, expr), exprlist1)
+exprlist0.arc(Label(256, star_expr), exprlist1)
+exprlist0.bootstrap = {
+    54: {
+        '+': (expr, exprlist1),
+        '-': (expr, exprlist1),
+        '~': (expr, exprlist1),
+        '(': (expr, exprlist1),
+        '[': (expr, exprlist1),
+        '{': (expr, exprlist1),
+        '...': (expr, exprlist1),
+        '*': (star_expr, exprlist1),},
+    1: {
+        None: (expr, exprlist1),
+        'None': (expr, exprlist1),
+        'True': (expr, exprlist1),
+        'False': (expr, exprlist1),},
+    2: {
+        None: (expr, exprlist1),},
+    3: {
+        None: (expr, exprlist1),},}
+
+
+testlist0 = testlist
+testlist1 = State(True)
+testlist2 = State(True)
+testlist2.arc(Label(256, test), testlist1)
+testlist2.bootstrap = {
+    1: {
+        'not': (test, testlist1),
+        None: (test, testlist1),
+        'None': (test, testlist1),
+        'True': (test, testlist1),
+        'False': (test, testlist1),
+        'lambda': (test, testlist1),},
+    54: {
+        '+': (test, testlist1),
+        '-': (test, testlist1),
+        '~': (test, testlist1),
+        '(': (test, testlist1),
+        '[': (test, testlist1),
+        '{': (test, testlist1),
+        '...': (test, testlist1),},
+    2: {
+        None: (test, testlist1),},
+    3: {
+        None: (test, testlist1),},}
+testlist1.arc(Label(54, ','), testlist2)
+testlist1.bootstrap = {
+    54: {
+        ',': (None, testlist2),},}
+testlist0.arc(Label(256, test), testlist1)
+testlist0.bootstrap = {
+    1: {
+        'not': (test, testlist1),
+        None: (test, testlist1),
+        'None': (test, testlist1),
+        'True': (test, testlist1),
+        'False': (test, testlist1),
+        'lambda': (test, testlist1),},
+    54: {
+        '+': (test, testlist1),
+        '-': (test, testlist1),
+        '~': (test, testlist1),
+        '(': (test, testlist1),
+        '[': (test, testlist1),
+        '{': (test, testlist1),
+        '...': (test, testlist1),},
+    2: {
+        None: (test, testlist1),},
+    3: {
+        None: (test, testlist1),},}
+
+
+dictorsetmaker0 = dictorsetmaker
+dictorsetmaker1 = State(True)
+dictorsetmaker2 = State(False)
+dictorsetmaker3 = State(True)
+dictorsetmaker4 = State(True)
+dictorsetmaker4.bootstrap = {}
+dictorsetmaker3.arc(Label(256, comp_for), dictorsetmaker4)
+dictorsetmaker5 = State(True)
+dictorsetmaker6 = State(False)
+dictorsetmaker7 = State(False)
+dictorsetmaker8 = State(True)
+dictorsetmaker8.arc(Label(54, ','), dictorsetmaker5)
+dictorsetmaker8.bootstrap = {
+    54: {
+        ',': (None, dictorsetmaker5),},}
+dictorsetmaker7.arc(Label(256, test), dictorsetmaker8)
+dictorsetmaker7.bootstrap = {
+    1: {
+        'not': (test, dictorsetmaker8),
+        None: (test, dictorsetmaker8),
+        'None': (test, dictorsetmaker8),
+        'True': (test, dictorsetmaker8),
+        'False': (test, dictorsetmaker8),
+        'lambda': (test, dictorsetmaker8),},
+    54: {
+        '+': (test, dictorsetmaker8),
+        '-': (test, dictorsetmaker8),
+        '~': (test, dictorsetmaker8),
+        '(': (test, dictorsetmaker8),
+        '[': (test, dictorsetmaker8),
+        '{': (test, dictorsetmaker8),
+        '...': (test, dictorsetmaker8),},
+    2: {
+        None: (test, dictorsetmaker8),},
+    3: {
+        None: (test, dictorsetmaker8),},}
+dictorsetmaker6.arc(Label(54, ':'), dictorsetmaker7)
+dictorsetmaker6.bootstrap = {
+    54: {
+        ':': (None, dictorsetmaker7),},}
+dictorsetmaker5.arc(Label(256, test), dictorsetmaker6)
+dictorsetmaker5.bootstrap = {
+    1: {
+        'not': (test, dictorsetmaker6),
+        None: (test, dictorsetmaker6),
+        'None': (test, dictorsetmaker6),
+        'True': (test, dictorsetmaker6),
+        'False': (test, dictorsetmaker6),
+        'lambda': (test, dictorsetmaker6),},
+    54: {
+        '+': (test, dictorsetmaker6),
+        '-': (test, dictorsetmaker6),
+        '~': (test, dictorsetmaker6),
+        '(': (test, dictorsetmaker6),
+        '[': (test, dictorsetmaker6),
+        '{': (test, dictorsetmaker6),
+        '...': (test, dictorsetmaker6),},
+    2: {
+        None: (test, dictorsetmaker6),},
+    3: {
+        None: (test, dictorsetmaker6),},}
+dictorsetmaker3.arc(Label(54, ','), dictorsetmaker5)
+dictorsetmaker3.bootstrap = {
+    1: {
+        'for': (comp_for, dictorsetmaker4),},
+    54: {
+        ',': (None, dictorsetmaker5),},}
+dictorsetmaker2.arc(Label(256, test), dictorsetmaker3)
+dictorsetmaker2.bootstrap = {
+    1: {
+        'not': (test, dictorsetmaker3),
+        None: (test, dictorsetmaker3),
+        'None': (test, dictorsetmaker3),
+        'True': (test, dictorsetmaker3),
+        'False': (test, dictorsetmaker3),
+        'lambda': (test, dictorsetmaker3),},
+    54: {
+        '+': (test, dictorsetmaker3),
+        '-': (test, dictorsetmaker3),
+        '~': (test, dictorsetmaker3),
+        '(': (test, dictorsetmaker3),
+        '[': (test, dictorsetmaker3),
+        '{': (test, dictorsetmaker3),
+        '...': (test, dictorsetmaker3),},
+    2: {
+        None: (test, dictorsetmaker3),},
+    3: {
+        None: (test, dictorsetmaker3),},}
+dictorsetmaker1.arc(Label(54, ':'), dictorsetmaker2)
+dictorsetmaker1.arc(Label(256, comp_for), dictorsetmaker4)
+dictorsetmaker9 = State(True)
+dictorsetmaker10 = State(True)
+dictorsetmaker10.arc(Label(54, ','), dictorsetmaker9)
+dictorsetmaker10.bootstrap = {
+    54: {
+        ',': (None, dictorsetmaker9),},}
+dictorsetmaker9.arc(Label(256, test), dictorsetmaker10)
+dictorsetmaker9.bootstrap = {
+    1: {
+        'not': (test, dictorsetmaker10),
+        None: (test, dictorsetmaker10),
+        'None': (test, dictorsetmaker10),
+        'True': (test, dictorsetmaker10),
+        'False': (test, dictorsetmaker10),
+        'lambda': (test, dictorsetmaker10),},
+    54: {
+        '+': (test, dictorsetmaker10),
+        '-': (test, dictorsetmaker10),
+        '~': (test, dictorsetmaker10),
+        '(': (test, dictorsetmaker10),
+        '[': (test, dictorsetmaker10),
+        '{': (test, dictorsetmaker10),
+        '...': (test, dictorsetmaker10),},
+    2: {
+        None: (test, dictorsetmaker10),},
+    3: {
+        None: (test, dictorsetmaker10),},}
+dictorsetmaker1.arc(Label(54, ','), dictorsetmaker9)
+dictorsetmaker1.bootstrap = {
+    54: {
+        ':': (None, dictorsetmaker2),
+        ',': (None, dictorsetmaker9),},
+    1: {
+        'for': (comp_for, dictorsetmaker4),},}
+dictorsetmaker0.arc(Label(256, test), dictorsetmaker1)
+dictorsetmaker0.bootstrap = {
+    1: {
+        'not': (test, dictorsetmaker1),
+        None: (test, dictorsetmaker1),
+        'None': (test, dictorsetmaker1),
+        'True': (test, dictorsetmaker1),
+        'False': (test, dictorsetmaker1),
+        'lambda': (test, dictorsetmaker1),},
+    54: {
+        '+': (test, dictorsetmaker1),
+        '-': (test, dictorsetmaker1),
+        '~': (test, dictorsetmaker1),
+        '(': (test, dictorsetmaker1),
+        '[': (test, dictorsetmaker1),
+        '{': (test, dictorsetmaker1),
+        '...': (test, dictorsetmaker1),},
+    2: {
+        None: (test, dictorsetmaker1),},
+    3: {
+        None: (test, dictorsetmaker1),},}
+
+
+classdef0 = classdef
+classdef1 = State(False)
+classdef2 = State(False)
+classdef3 = State(False)
+classdef4 = State(False)
+classdef5 = State(False)
+classdef6 = State(False)
+classdef7 = State(True)
+classdef7.bootstrap = {}
+classdef6.arc(Label(256, suite), classdef7)
+classdef6.bootstrap = {
+    1: {
+        'not': (suite, classdef7),
+        None: (suite, classdef7),
+        'None': (suite, classdef7),
+        'True': (suite, classdef7),
+        'False': (suite, classdef7),
+        'lambda': (suite, classdef7),
+        'del': (suite, classdef7),
+        'pass': (suite, classdef7),
+        'break': (suite, classdef7),
+        'continue': (suite, classdef7),
+        'return': (suite, classdef7),
+        'raise': (suite, classdef7),
+        'yield': (suite, classdef7),
+        'import': (suite, classdef7),
+        'from': (suite, classdef7),
+        'global': (suite, classdef7),
+        'nonlocal': (suite, classdef7),
+        'assert': (suite, classdef7),},
+    54: {
+        '+': (suite, classdef7),
+        '-': (suite, classdef7),
+        '~': (suite, classdef7),
+        '(': (suite, classdef7),
+        '[': (suite, classdef7),
+        '{': (suite, classdef7),
+        '...': (suite, classdef7),
+        '*': (suite, classdef7),},
+    2: {
+        None: (suite, classdef7),},
+    3: {
+        None: (suite, classdef7),},
+    4: {
+        None: (suite, classdef7),},}
+classdef5.arc(Label(54, ':'), classdef6)
+classdef5.bootstrap = {
+    54: {
+        ':': (None, classdef6),},}
+classdef4.arc(Label(54, ')'), classdef5)
+classdef4.bootstrap = {
+    54: {
+        ')': (None, classdef5),},}
+classdef3.arc(Label(256, arglist), classdef4)
+classdef3.arc(Label(54, ')'), classdef5)
+classdef3.bootstrap = {
+    1: {
+        'not': (arglist, classdef4),
+        None: (arglist, classdef4),
+        'None': (arglist, classdef4),
+        'True': (arglist, classdef4),
+        'False': (arglist, classdef4),
+        'lambda': (arglist, classdef4),},
+    54: {
+        '+': (arglist, classdef4),
+        '-': (arglist, classdef4),
+        '~': (arglist, classdef4),
+        '(': (arglist, classdef4),
+        '[': (arglist, classdef4),
+        '{': (arglist, classdef4),
+        '...': (arglist, classdef4),
+        '*': (arglist, classdef4),
+        '**': (arglist, classdef4),
+        ')': (None, classdef5),},
+    2: {
+        None: (arglist, classdef4),},
+    3: {
+        None: (arglist, classdef4),},}
+classdef2.arc(Label(54, '('), classdef3)
+classdef2.arc(Label(54, ':'), classdef6)
+classdef2.bootstrap = {
+    54: {
+        '(': (None, classdef3),
+        ':': (None, classdef6),},}
+classdef1.arc(Label(1, None), classdef2)
+classdef1.bootstrap = {
+    1: {
+        None: (None, classdef2),},}
+classdef0.arc(Label(1, 'class'), classdef1)
+classdef0.bootstrap = {
+    1: {
+        'class': (None, classdef1),},}
+
+
+arglist0 = arglist
+arglist1 = State(True)
+arglist2 = State(True)
+arglist2.arc(Label(256, argument), arglist1)
+arglist3 = State(False)
+arglist4 = State(True)
+arglist5 = State(False)
+arglist5.arc(Label(256, argument), arglist4)
+arglist6 = State(False)
+arglist7 = State(True)
+arglist7.bootstrap = {}
+arglist6.arc(Label(256, test), arglist7)
+arglist6.bootstrap = {
+    1: {
+        'not': (test, arglist7),
+        None: (test, arglist7),
+        'None': (test, arglist7),
+        'True': (test, arglist7),
+        'False': (test, arglist7),
+        'lambda': (test, arglist7),},
+    54: {
+        '+': (test, arglist7),
+        '-': (test, arglist7),
+        '~': (test, arglist7),
+        '(': (test, arglist7),
+        '[': (test, arglist7),
+        '{': (test, arglist7),
+        '...': (test, arglist7),},
+    2: {
+        None: (test, arglist7),},
+    3: {
+        None: (test, arglist7),},}
+arglist5.arc(Label(54, '**'), arglist6)
+arglist5.bootstrap = {
+    1: {
+        'not': (argument, arglist4),
+        None: (argument, arglist4),
+        'None': (argument, arglist4),
+        'True': (argument, arglist4),
+        'False': (argument, arglist4),
+        'lambda': (argument, arglist4),},
+    54: {
+        '+': (argument, arglist4),
+        '-': (argument, arglist4),
+        '~': (argument, arglist4),
+        '(': (argument, arglist4),
+        '[': (argument, arglist4),
+        '{': (argument, arglist4),
+        '...': (argument, arglist4),
+        '**': (None, arglist6),},
+    2: {
+        None: (argument, arglist4),},
+    3: {
+        None: (argument, arglist4),},}
+arglist4.arc(Label(54, ','), arglist5)
+arglist4.bootstrap = {
+    54: {
+        ',': (None, arglist5),},}
+arglist3.arc(Label(256, test), arglist4)
+arglist3.bootstrap = {
+    1: {
+        'not': (test, arglist4),
+        None: (test, arglist4),
+        'None': (test, arglist4),
+        'True': (test, arglist4),
+        'False': (test, arglist4),
+        'lambda': (test, arglist4),},
+    54: {
+        '+': (test, arglist4),
+        '-': (test, arglist4),
+        '~': (test, arglist4),
+        '(': (test, arglist4),
+        '[': (test, arglist4),
+        '{': (test, arglist4),
+        '...': (test, arglist4),},
+    2: {
+        None: (test, arglist4),},
+    3: {
+        None: (test, arglist4),},}
+arglist2.arc(Label(54, '*'), arglist3)
+arglist2.arc(Label(54, '**'), arglist6)
+arglist2.bootstrap = {
+    1: {
+        'not': (argument, arglist1),
+        None: (argument, arglist1),
+        'None': (argument, arglist1),
+        'True': (argument, arglist1),
+        'False': (argument, arglist1),
+        'lambda': (argument, arglist1),},
+    54: {
+        '+': (argument, arglist1),
+        '-': (argument, arglist1),
+        '~': (argument, arglist1),
+        '(': (argument, arglist1),
+        '[': (argument, arglist1),
+        '{': (argument, arglist1),
+        '...': (argument, arglist1),
+        '*': (None, arglist3),
+        '**': (None, arglist6),},
+    2: {
+        None: (argument, arglist1),},
+    3: {
+        None: (argument, arglist1),},}
+arglist1.arc(Label(54, ','), arglist2)
+arglist1.bootstrap = {
+    54: {
+        ',': (None, arglist2),},}
+arglist0.arc(Label(256, argument), arglist1)
+arglist0.arc(Label(54, '*'), arglist3)
+arglist0.arc(Label(54, '**'), arglist6)
+arglist0.bootstrap = {
+    1: {
+        'not': (argument, arglist1),
+        None: (argument, arglist1),
+        'None': (argument, arglist1),
+        'True': (argument, arglist1),
+        'False': (argument, arglist1),
+        'lambda': (argument, arglist1),},
+    54: {
+        '+': (argument, arglist1),
+        '-': (argument, arglist1),
+        '~': (argument, arglist1),
+        '(': (argument, arglist1),
+        '[': (argument, arglist1),
+        '{': (argument, arglist1),
+        '...': (argument, arglist1),
+        '*': (None, arglist3),
+        '**': (None, arglist6),},
+    2: {
+        None: (argument, arglist1),},
+    3: {
+        None: (argument, arglist1),},}
+
+
+argument0 = argument
+argument1 = State(True)
+argument2 = State(True)
+argument2.bootstrap = {}
+argument1.arc(Label(256, comp_for), argument2)
+argument3 = State(False)
+argument3.arc(Label(256, test), argument2)
+argument3.bootstrap = {
+    1: {
+        'not': (test, argument2),
+        None: (test, argument2),
+        'None': (test, argument2),
+        'True': (test, argument2),
+        'False': (test, argument2),
+        'lambda': (test, argument2),},
+    54: {
+        '+': (test, argument2),
+        '-': (test, argument2),
+        '~': (test, argument2),
+        '(': (test, argument2),
+        '[': (test, argument2),
+        '{': (test, argument2),
+        '...': (test, argument2),},
+    2: {
+        None: (test, argument2),},
+    3: {
+        None: (test, argument2),},}
+argument1.arc(Label(54, '='), argument3)
+argument1.bootstrap = {
+    1: {
+        'for': (comp_for, argument2),},
+    54: {
+        '=': (None, argument3),},}
+argument0.arc(Label(256, test), argument1)
+argument0.bootstrap = {
+    1: {
+        'not': (test, argument1),
+        None: (test, argument1),
+        'None': (test, argument1),
+        'True': (test, argument1),
+        'False': (test, argument1),
+        'lambda': (test, argument1),},
+    54: {
+        '+': (test, argument1),
+        '-': (test, argument1),
+        '~': (test, argument1),
+        '(': (test, argument1),
+        '[': (test, argument1),
+        '{': (test, argument1),
+        '...': (test, argument1),},
+    2: {
+        None: (test, argument1),},
+    3: {
+        None: (test, argument1),},}
+
+
+comp_iter0 = comp_iter
+comp_iter1 = State(True)
+comp_iter1.bootstrap = {}
+comp_iter0.arc(Label(256, comp_for), comp_iter1)
+comp_iter0.arc(Label(256, comp_if), comp_iter1)
+comp_iter0.bootstrap = {
+    1: {
+        'for': (comp_for, comp_iter1),
+        'if': (comp_if, comp_iter1),},}
+
+
+comp_for0 = comp_for
+comp_for1 = State(False)
+comp_for2 = State(False)
+comp_for3 = State(False)
+comp_for4 = State(True)
+comp_for5 = State(True)
+comp_for5.bootstrap = {}
+comp_for4.arc(Label(256, comp_iter), comp_for5)
+comp_for4.bootstrap = {
+    1: {
+        'for': (comp_iter, comp_for5),
+        'if': (comp_iter, comp_for5),},}
+comp_for3.arc(Label(256, or_test), comp_for4)
+comp_for3.bootstrap = {
+    1: {
+        'not': (or_test, comp_for4),
+        None: (or_test, comp_for4),
+        'None': (or_test, comp_for4),
+        'True': (or_test, comp_for4),
+        'False': (or_test, comp_for4),},
+    54: {
+        '+': (or_test, comp_for4),
+        '-': (or_test, comp_for4),
+        '~': (or_test, comp_for4),
+        '(': (or_test, comp_for4),
+        '[': (or_test, comp_for4),
+        '{': (or_test, comp_for4),
+        '...': (or_test, comp_for4),},
+    2: {
+        None: (or_test, comp_for4),},
+    3: {
+        None: (or_test, comp_for4),},}
+comp_for2.arc(Label(1, 'in'), comp_for3)
+comp_for2.bootstrap = {
+    1: {
+        'in': (None, comp_for3),},}
+comp_for1.arc(Label(256, exprlist), comp_for2)
+comp_for1.bootstrap = {
+    54: {
+        '+': (exprlist, comp_for2),
+        '-': (exprlist, comp_for2),
+        '~': (exprlist, comp_for2),
+        '(': (exprlist, comp_for2),
+        '[': (exprlist, comp_for2),
+        '{': (exprlist, comp_for2),
+        '...': (exprlist, comp_for2),
+        '*': (exprlist, comp_for2),},
+    1: {
+        None: (exprlist, comp_for2),
+        'None': (exprlist, comp_for2),
+        'True': (exprlist, comp_for2),
+        'False': (exprlist, comp_for2),},
+    2: {
+        None: (exprlist, comp_for2),},
+    3: {
+        None: (exprlist, comp_for2),},}
+comp_for0.arc(Label(1, 'for'), comp_for1)
+comp_for0.bootstrap = {
+    1: {
+        'for': (None, comp_for1),},}
+
+
+comp_if0 = comp_if
+comp_if1 = State(False)
+comp_if2 = State(True)
+comp_if3 = State(True)
+comp_if3.bootstrap = {}
+comp_if2.arc(Label(256, comp_iter), comp_if3)
+comp_if2.bootstrap = {
+    1: {
+        'for': (comp_iter, comp_if3),
+        'if': (comp_iter, comp_if3),},}
+comp_if1.arc(Label(256, test_nocond), comp_if2)
+comp_if1.bootstrap = {
+    1: {
+        'not': (test_nocond, comp_if2),
+        None: (test_nocond, comp_if2),
+        'None': (test_nocond, comp_if2),
+        'True': (test_nocond, comp_if2),
+        'False': (test_nocond, comp_if2),
+        'lambda': (test_nocond, comp_if2),},
+    54: {
+        '+': (test_nocond, comp_if2),
+        '-': (test_nocond, comp_if2),
+        '~': (test_nocond, comp_if2),
+        '(': (test_nocond, comp_if2),
+        '[': (test_nocond, comp_if2),
+        '{': (test_nocond, comp_if2),
+        '...': (test_nocond, comp_if2),},
+    2: {
+        None: (test_nocond, comp_if2),},
+    3: {
+        None: (test_nocond, comp_if2),},}
+comp_if0.arc(Label(1, 'if'), comp_if1)
+comp_if0.bootstrap = {
+    1: {
+        'if': (None, comp_if1),},}
+
+
+encoding_decl0 = encoding_decl
+encoding_decl1 = State(True)
+encoding_decl1.bootstrap = {}
+encoding_decl0.arc(Label(1, None), encoding_decl1)
+encoding_decl0.bootstrap = {
+    1: {
+        None: (None, encoding_decl1),},}
+
+
+yield_expr0 = yield_expr
+yield_expr1 = State(True)
+yield_expr2 = State(True)
+yield_expr2.bootstrap = {}
+yield_expr1.arc(Label(256, yield_arg), yield_expr2)
+yield_expr1.bootstrap = {
+    1: {
+        'from': (yield_arg, yield_expr2),
+        'not': (yield_arg, yield_expr2),
+        None: (yield_arg, yield_expr2),
+        'None': (yield_arg, yield_expr2),
+        'True': (yield_arg, yield_expr2),
+        'False': (yield_arg, yield_expr2),
+        'lambda': (yield_arg, yield_expr2),},
+    54: {
+        '+': (yield_arg, yield_expr2),
+        '-': (yield_arg, yield_expr2),
+        '~': (yield_arg, yield_expr2),
+        '(': (yield_arg, yield_expr2),
+        '[': (yield_arg, yield_expr2),
+        '{': (yield_arg, yield_expr2),
+        '...': (yield_arg, yield_expr2),},
+    2: {
+        None: (yield_arg, yield_expr2),},
+    3: {
+        None: (yield_arg, yield_expr2),},}
+yield_expr0.arc(Label(1, 'yield'), yield_expr1)
+yield_expr0.bootstrap = {
+    1: {
+        'yield': (None, yield_expr1),},}
+
+
+yield_arg0 = yield_arg
+yield_arg1 = State(False)
+yield_arg2 = State(True)
+yield_arg2.bootstrap = {}
+yield_arg1.arc(Label(256, test), yield_arg2)
+yield_arg1.bootstrap = {
+    1: {
+        'not': (test, yield_arg2),
+        None: (test, yield_arg2),
+        'None': (test, yield_arg2),
+        'True': (test, yield_arg2),
+        'False': (test, yield_arg2),
+        'lambda': (test, yield_arg2),},
+    54: {
+        '+': (test, yield_arg2),
+        '-': (test, yield_arg2),
+        '~': (test, yield_arg2),
+        '(': (test, yield_arg2),
+        '[': (test, yield_arg2),
+        '{': (test, yield_arg2),
+        '...': (test, yield_arg2),},
+    2: {
+        None: (test, yield_arg2),},
+    3: {
+        None: (test, yield_arg2),},}
+yield_arg0.arc(Label(1, 'from'), yield_arg1)
+yield_arg0.arc(Label(256, testlist), yield_arg2)
+yield_arg0.bootstrap = {
+    1: {
+        'from': (None, yield_arg1),
+        'not': (testlist, yield_arg2),
+        None: (testlist, yield_arg2),
+        'None': (testlist, yield_arg2),
+        'True': (testlist, yield_arg2),
+        'False': (testlist, yield_arg2),
+        'lambda': (testlist, yield_arg2),},
+    54: {
+        '+': (testlist, yield_arg2),
+        '-': (testlist, yield_arg2),
+        '~': (testlist, yield_arg2),
+        '(': (testlist, yield_arg2),
+        '[': (testlist, yield_arg2),
+        '{': (testlist, yield_arg2),
+        '...': (testlist, yield_arg2),},
+    2: {
+        None: (testlist, yield_arg2),},
+    3: {
+        None: (testlist, yield_arg2),},}
@@ -0,0 +1,94 @@
+# generated by cpy.parser.grammar.tables.Tables
+import os
+from cpy.parser.grammar.tables import Tables
+from cpy.parser.grammar.symbols import Symbols
+
+
+class _Symbols(Symbols):
+    single_input = 257
+    file_input = 258
+    eval_input = 259
+    decorator = 260
+    decorators = 261
+    decorated = 262
+    funcdef = 263
+    parameters = 264
+    typedargslist = 265
+    tfpdef = 266
+    varargslist = 267
+    vfpdef = 268
+    stmt = 269
+    simple_stmt = 270
+    small_stmt = 271
+    expr_stmt = 272
+    testlist_star_expr = 273
+    augassign = 274
+    del_stmt = 275
+    pass_stmt = 276
+    flow_stmt = 277
+    break_stmt = 278
+    continue_stmt = 279
+    return_stmt = 280
+    yield_stmt = 281
+    raise_stmt = 282
+    import_stmt = 283
+    import_name = 284
+    import_from = 285
+    import_as_name = 286
+    dotted_as_name = 287
+    import_as_names = 288
+    dotted_as_names = 289
+    dotted_name = 290
+    global_stmt = 291
+    nonlocal_stmt = 292
+    assert_stmt = 293
+    compound_stmt = 294
+    if_stmt = 295
+    while_stmt = 296
+    for_stmt = 297
+    try_stmt = 298
+    with_stmt = 299
+    with_item = 300
+    except_clause = 301
+    suite = 302
+    test = 303
+    test_nocond = 304
+    lambdef = 305
+    lambdef_nocond = 306
+    or_test = 307
+    and_test = 308
+    not_test = 309
+    comparison = 310
+    comp_op = 311
+    star_expr = 312
+    expr = 313
+    xor_expr = 314
+    and_expr = 315
+    shift_expr = 316
+    arith_expr = 317
+    term = 318
+    factor = 319
+    power = 320
+    atom = 321
+    testlist_comp = 322
+    trailer = 323
+    subscriptlist = 324
+    subscript = 325
+    sliceop = 326
+    exprlist = 327
+    testlist = 328
+    dictorsetmaker = 329
+    classdef = 330
+    arglist = 331
+    argument = 332
+    comp_iter = 333
+    comp_for = 334
+    comp_if = 335
+    yield_expr = 337
+    yield_arg = 338
+symbols = _Symbols()
+
+
+_path = os.path.join(os.path.dirname(__file__), 'pytables.tables')
+with open(_path, 'rb') as f:
+    tables = Tables.load(f)
@@ -1 +1,18 @@
 from .test_import import *
+from .test_grammar import *
+from .test_tables import *
+from .test_scanner import *
+from .test_prescan import *
+from .test_sourcefile import *
+from .test_tokenstream import *
+from .test_tokenarray import *
+from .test_codegen import *
+from .test_profile import *
+from .test_parser import *
+from .test_budget import *
+from .test_events import *
+from .test_outline import *
+from .test_prefork import *
+from .test_parse_tree import *
+from .test_arraytree import *
+from .test_incremental import *
@@ -30,6 +30,38 @@ class ASTTestCase(unittest.TestCase):
         self.assertEqual(ast, pyresult)
 
 
+def dump(node):
+    return (node.type, node.val, node.start, node.end,
+        [dump(n) for n in node.subs])
+
+
+def dump_tokens(node):
+    # the ends of rules are None in a ParseTree
+    return (node.type, node.val, node.start,
+        node.end if not node.subs else None,
+        [dump_tokens(n) for n in node.subs])
+
+
+def leaves(node):
+    if not node.subs:
+        return [node.val]
+    return [val for n in node.subs for val in leaves(n)]
+
+
+def ast_dump(obj):
+    if isinstance(obj, list):
+        return [ast_dump(o) for o in obj]
+    if isinstance(obj, type):
+        return obj.__name__
+    if not hasattr(obj, '__slots__'):
+        return obj
+    attrs = []
+    for cls in type(obj).__mro__:
+        for attr in cls.__dict__.get('__slots__', ()):
+            attrs.append((attr, ast_dump(getattr(obj, attr, None))))
+    return type(obj).__name__, attrs
+
+
 import logging
 l = logging.getLogger()
 l.setLevel(logging.DEBUG)
@@ -0,0 +1,116 @@
+import unittest
+import os
+from cpy.parser import pystates
+from cpy.parser.pygrammar import grammar
+from cpy.parser.ast_builder import ASTBuilder
+from cpy.parser.grammar.events import EventQueue
+from cpy.parser.grammar.arraytree import (ArrayTree, Arena,
+    StaleNodeError, ArenaBusyError)
+from .tc import dump_tokens, ast_dump
+from . import test_parse_tree
+
+
+class ArrayTreeTest(unittest.TestCase):
+    srcs = [test_parse_tree.LosslessTest.src,
+        test_parse_tree.LosslessTest.src + '\n',
+        'def f():\n    """a\n    b"""\n    return \'\u03c0\'\n',
+        'x = 1\r\n']
+
+    def test_same_tree(self):
+        for src in self.srcs:
+            tree = grammar.parse(src, arrays=True).parse_tree
+            self.assertEqual(dump_tokens(tree.root),
+                dump_tokens(grammar.parse(src).parse_tree.root))
+            self.assertEqual(tree.root.start, None)
+            self.assertEqual(tree.root[0].parent.index, 0)
+
+    def test_ast(self):
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'ast_builder.py')
+        tree = grammar.parse(path=path, arrays=True)
+        self.assertEqual(ast_dump(ASTBuilder(tree).ast),
+            ast_dump(ASTBuilder(grammar.parse(path=path)).ast))
+
+    def test_arrays(self):
+        tree = grammar.parse('x = (x, 1)\n', arrays=True).parse_tree
+        self.assertEqual(tree.strings,
+            [None, 'x', '=', '(', ',', '1', ')', '\n', ''])
+        names = [i for i in range(len(tree)) if tree.values[i] == 1]
+        self.assertEqual([tree.starts[i] for i in names], [0, 5])
+        self.assertEqual(tree.ends[0], 11)
+
+    def test_snapshot(self):
+        tree = grammar.parse(self.srcs[0], arrays=True).parse_tree
+        copy = ArrayTree.from_snapshot(grammar.symbols, tree.snapshot())
+        self.assertEqual(dump_tokens(copy.root), dump_tokens(tree.root))
+        self.assertEqual(copy.root[0].end, tree.root[0].end)
+
+    def test_modes(self):
+        for kwargs in ({'recover': True}, {'outline': True},
+                {'events': EventQueue()}, {'lossless': True}):
+            self.assertRaises(ValueError, grammar.parse, 'x\n',
+                arrays=True, **kwargs)
+
+
+class ArenaTest(unittest.TestCase):
+    srcs = [ArrayTreeTest.srcs[0], 'x = 1\n', test_parse_tree.CollapseTest.src]
+
+    def test_reuse(self):
+        arena = Arena(grammar)
+        types = None
+        sizes = []
+        for src in self.srcs:
+            with arena:
+                tree = arena.parse(src).parse_tree
+                self.assertEqual(dump_tokens(tree.root),
+                    dump_tokens(grammar.parse(src).parse_tree.root))
+                self.assertEqual(ast_dump(ASTBuilder(arena.owner).ast),
+                    ast_dump(ASTBuilder(grammar.parse(src)).ast))
+                self.assertEqual(ArrayTree.from_snapshot(grammar.symbols,
+                    tree.snapshot()).snapshot(), tree.snapshot())
+                sizes.append(len(tree))
+            if types is None:
+                types = tree.types
+            self.assertIs(tree, arena.tree)
+            self.assertIs(tree.types, types)
+        # the arrays grew to the largest tree, not to the sum of them
+        self.assertEqual(len(types), max(sizes))
+
+    def test_released_ast(self):
+        src = 'def f():\n    global a, b\n    def g():\n        nonlocal c\n'
+        arena = Arena(grammar)
+        with arena:
+            builder = ASTBuilder(arena.parse(src))
+        self.assertEqual(builder.stmt_asts, {})
+        f = builder.ast.body[0]
+        self.assertEqual(f.body[0].names, ['a', 'b'])
+        self.assertEqual(f.body[1].body[0].names, ['c'])
+        self.assertEqual(ast_dump(builder.ast),
+            ast_dump(ASTBuilder(grammar.parse(src)).ast))
+
+    def test_ownership(self):
+        arena = Arena(grammar)
+        src = arena.parse(self.srcs[0])
+        root = src.parse_tree.root
+        stmt = root[0]
+        self.assertRaises(ArenaBusyError, arena.parse, 'x\n')
+        arena.release()
+        self.assertIsNone(src.parse_tree)
+        self.assertRaises(StaleNodeError, lambda: root[1])
+        self.assertRaises(StaleNodeError, lambda: stmt.start)
+        with arena:
+            arena.parse(self.srcs[1])
+            self.assertRaises(StaleNodeError, lambda: stmt.subs)
+            # the arrays now hold the new parse: no old value is read
+            self.assertRaises(StaleNodeError, lambda: stmt.type)
+            self.assertRaises(StaleNodeError, lambda: stmt.val)
+            self.assertRaises(StaleNodeError, lambda: stmt == 0)
+            self.assertIn('released', repr(stmt))
+        try:
+            with arena:
+                arena.parse('x = = 1\n')
+        except SyntaxError:
+            pass
+        self.assertIsNone(arena.owner)
+        with arena:
+            self.assertEqual(len(arena.parse('x\n').parse_tree.root), 2)
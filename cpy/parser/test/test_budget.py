@@ -0,0 +1,53 @@
+import unittest
+from cpy.parser.pygrammar import grammar
+from cpy.parser.ast_builder import ASTBuilder
+from cpy.parser.grammar.budget import (Budget, TokenLimitExceeded,
+    DepthLimitExceeded, NodeLimitExceeded, DeadlineExceeded)
+
+
+class BudgetTest(unittest.TestCase):
+    def test_tokens(self):
+        src = 'x = [%s]\n' % ', '.join(['1'] * 100)
+        grammar.parse(src, budget=Budget(max_tokens=300))
+        self.assertRaises(TokenLimitExceeded, grammar.parse, src,
+            budget=Budget(max_tokens=100))
+
+    def test_depth(self):
+        src = 'x = %s1%s\n' % ('(' * 50, ')' * 50)
+        self.assertRaises(DepthLimitExceeded, grammar.parse, src,
+            budget=Budget(max_depth=200))
+        self.assertRaises(DepthLimitExceeded, grammar.parse,
+            'x = %s\n' % ('[' * 100000), budget=Budget(max_depth=1000))
+        budget = Budget(max_depth=100000)
+        parsed = grammar.parse(src, budget=budget)
+        self.assertRaises(DepthLimitExceeded, ASTBuilder, parsed,
+            budget=Budget(max_depth=200))
+        ASTBuilder(parsed, budget=budget)
+
+    def test_recursion(self):
+        # about 15 tree levels per bracket: too deep for the recursion of
+        # ASTBuilder, with or without a max_depth
+        src = 'x = %s1%s\n' % ('(' * 200, ')' * 200)
+        for budget in (Budget(), Budget(max_depth=5000)):
+            parsed = grammar.parse(src, budget=budget)
+            self.assertRaises(DepthLimitExceeded, ASTBuilder, parsed,
+                budget=budget)
+        parsed = grammar.parse(src, recover=True, budget=Budget())
+        self.assertRaises(DepthLimitExceeded, ASTBuilder, parsed,
+            recover=True, budget=Budget())
+
+    def test_nodes(self):
+        src = 'x = [%s]\n' % ', '.join(['1'] * 100)
+        self.assertRaises(NodeLimitExceeded, grammar.parse, src,
+            budget=Budget(max_nodes=1000))
+        parsed = grammar.parse(src)
+        self.assertRaises(NodeLimitExceeded, ASTBuilder, parsed,
+            budget=Budget(max_nodes=1000))
+
+    def test_deadline(self):
+        src = 'x = 1\n' * 1000
+        self.assertRaises(DeadlineExceeded, grammar.parse, src,
+            budget=Budget(timeout=-1))
+        parsed = grammar.parse(src)
+        self.assertRaises(DeadlineExceeded, ASTBuilder, parsed,
+            budget=Budget(timeout=-1))
@@ -0,0 +1,59 @@
+import unittest
+import os
+import shutil
+import tempfile
+from cpy.parser.pygrammar import grammar
+from .tc import dump
+
+
+class CompiledParserTest(unittest.TestCase):
+    src = (
+        'import a.b as c\n'
+        '@d(1, *e)\n'
+        'class A(B):\n'
+        '    def f(self, x=[i for i in y if i]):\n'
+        '        return {k: v ** -2 for k, v in x}, not x[1:2]\n')
+
+    def test_same_tree(self):
+        parser = grammar.compile()
+        self.assertEqual(dump(parser.parse(self.src).parse_tree.root),
+            dump(grammar.parse(self.src).parse_tree.root))
+        self.assertEqual(
+            dump(parser.parse('a\n', init='single_input').parse_tree.root),
+            dump(grammar.parse('a\n', init='single_input').parse_tree.root))
+
+    def test_syntax_error(self):
+        parser = grammar.compile()
+        self.assertRaises(SyntaxError, parser.parse, 'a = = b\n')
+        self.assertRaises(SyntaxError, parser.parse, 'a\nb\n', None,
+            'single_input')
+
+    def test_deep_nesting(self):
+        def flat(node):
+            stack, nodes = [node], []
+            while stack:
+                node = stack.pop()
+                nodes.append((node.type, node.val, node.start))
+                stack.extend(reversed(node.subs))
+            return nodes
+        parser = grammar.compile()
+        src = 'x = %s1%s\n' % ('(' * 200, ')' * 200)
+        self.assertEqual(flat(parser.parse(src).parse_tree.root),
+            flat(grammar.parse(src).parse_tree.root))
+        self.assertRaises(SyntaxError, parser.parse,
+            'x = %s1 1%s\n' % ('(' * 200, ')' * 200))
+
+    def test_cache_dir(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            from cpy.parser.grammar import codegen
+            codegen._modules.clear()
+            grammar.compile(cache_dir)
+            self.assertEqual(os.listdir(cache_dir),
+                ['parser_%s.py' % grammar.tables.digest()])
+            codegen._modules.clear()
+            parser = grammar.compile(cache_dir)
+            self.assertEqual(dump(parser.parse(self.src).parse_tree.root),
+                dump(grammar.parse(self.src).parse_tree.root))
+        finally:
+            shutil.rmtree(cache_dir)
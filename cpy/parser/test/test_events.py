@@ -0,0 +1,52 @@
+import unittest
+import token
+from cpy.parser.pygrammar import grammar
+from cpy.parser.grammar.events import (EventHandler, EventQueue, ENTER,
+    TOKEN)
+from .tc import dump
+from . import test_codegen
+
+
+class EventsTest(unittest.TestCase):
+    def tree(self, events):
+        # rebuild dump() of the parse tree from the events
+        stack = [(None, None, None, None, [])]
+        for event in events:
+            if event[0] == ENTER:
+                node = (event[1], None, event[2], None, [])
+                stack[-1][4].append(node)
+                stack.append(node)
+            elif event[0] == TOKEN:
+                stack[-1][4].append(event[1:] + ([],))
+            else:
+                self.assertEqual(stack.pop()[0], event[1])
+        self.assertEqual(len(stack), 1)
+        return stack[0][4][0]
+
+    def test_same_tree(self):
+        src = test_codegen.CompiledParserTest.src
+        queue = EventQueue()
+        parsed = grammar.parse(src, events=queue)
+        self.assertIsNone(parsed.parse_tree)
+        self.assertEqual(self.tree(queue.events),
+            dump(grammar.parse(src).parse_tree.root))
+        self.assertEqual(list(grammar.iterparse(src)), queue.events)
+
+    def test_handler(self):
+        class Names(EventHandler):
+            def __init__(self):
+                self.names = []
+
+            def token(self, type, val, start, end):
+                if type == token.NAME:
+                    self.names.append(val)
+
+        names = Names()
+        grammar.parse('def f(a):\n    return a.b\n', events=names)
+        self.assertEqual(names.names, ['def', 'f', 'a', 'return', 'a', 'b'])
+
+    def test_syntax_error(self):
+        self.assertRaises(SyntaxError, list,
+            grammar.iterparse('a = 1\nb = = 2\n'))
+        self.assertRaises(ValueError, grammar.parser, recover=True,
+            events=EventQueue())
@@ -0,0 +1,64 @@
+import unittest
+import os
+import shutil
+import tempfile
+from cpy.parser import pystates
+from cpy.parser.grammar import Grammar
+from cpy.parser.grammar import grammar as grammar_module
+from cpy.parser.pygrammar import grammar
+from .tc import dump, leaves
+from . import test_codegen
+
+
+class FromSourceTest(unittest.TestCase):
+    def setUp(self):
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'pygram_gen', 'Grammar3.3')
+        with open(path) as f:
+            self.text = f.read()
+        self.cache_dir = tempfile.mkdtemp()
+        grammar_module._grammars.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        grammar_module._grammars.clear()
+
+    def test_memo(self):
+        g = Grammar.from_grammar_source(self.text, ['eval_input'])
+        self.assertIs(Grammar.from_grammar_source(self.text, ['eval_input']),
+            g)
+        self.assertIsNot(Grammar.from_grammar_source(self.text,
+            ['file_input']), g)
+        self.assertEqual(g.default_state, 'eval_input')
+        tree = g.parse('a + b\n').parse_tree
+        self.assertEqual(tree.root, g.symbols.eval_input)
+        self.assertEqual(tree.root[0], g.symbols['testlist'])
+
+    def test_memo_size(self):
+        size = grammar_module.MAX_GRAMMARS
+        grammar_module.MAX_GRAMMARS = 1
+        try:
+            g = Grammar.from_grammar_source(self.text, ['eval_input'])
+            Grammar.from_grammar_source(self.text, ['file_input'])
+            self.assertEqual(len(grammar_module._grammars), 1)
+            self.assertIsNot(Grammar.from_grammar_source(self.text,
+                ['eval_input']), g)
+        finally:
+            grammar_module.MAX_GRAMMARS = size
+
+    def test_cache_dir(self):
+        starts = ['file_input', 'eval_input']
+        g = Grammar.from_grammar_source(self.text, starts,
+            cache_dir=self.cache_dir)
+        files = os.listdir(self.cache_dir)
+        self.assertEqual(len(files), 1)
+        grammar_module._grammars.clear()
+        g2 = Grammar.from_grammar_source(self.text, starts,
+            cache_dir=self.cache_dir)
+        self.assertIsNot(g2, g)
+        self.assertEqual(g2.tables.digest(), g.tables.digest())
+        src = test_codegen.CompiledParserTest.src
+        self.assertEqual(dump(g2.parse(src).parse_tree.root),
+            dump(g.parse(src).parse_tree.root))
+        self.assertEqual(leaves(g2.parse(src).parse_tree.root),
+            leaves(grammar.parse(src).parse_tree.root))
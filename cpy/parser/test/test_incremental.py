@@ -0,0 +1,73 @@
+import unittest
+from cpy.parser.ast_builder import ASTBuilder
+from cpy.parser.pygrammar import grammar
+from cpy.parser.grammar import incremental
+from .tc import dump, ast_dump
+
+
+class ReparseTest(unittest.TestCase):
+    src = (
+        'import a\n'
+        '\n'
+        'def f(x):\n'
+        '    if x:\n'
+        '        return g(x)\n'
+        '\n'
+        'from b import c\n'
+        'y = f(1)\n')
+
+    def check(self, start, end, text):
+        new_src = self.src[:start] + text + self.src[end:]
+        old = grammar.parse(self.src)
+        old_builder = ASTBuilder(old)
+        reused = old.parse_tree.root.subs[-3:]
+        new = grammar.reparse(old, [(start, end, text)])
+        full = grammar.parse(new_src)
+        self.assertEqual(new.source, full.source)
+        self.assertEqual(dump(new.parse_tree.root),
+            dump(full.parse_tree.root))
+        old_ast = ast_dump(old_builder.ast)
+        builder = ASTBuilder(new, reuse=old_builder)
+        self.assertEqual(ast_dump(builder.ast), ast_dump(ASTBuilder(full).ast))
+        # the ast of the old source is left as it was
+        self.assertEqual(ast_dump(old_builder.ast), old_ast)
+        return new, reused
+
+    def test_same_lines(self):
+        start = self.src.index('g(x)')
+        new, reused = self.check(start, start + 1, 'h')
+        self.assertTrue(new.parse_tree.root.subs[-2] is reused[-2])
+
+    def test_new_lines(self):
+        start = self.src.index('\ndef') + 1
+        new, reused = self.check(start, start, 'import d\n\n')
+        moved = new.parse_tree.root.subs[-2]
+        self.assertTrue(moved.node is reused[-2])
+        self.assertEqual(moved.start, (10, 0))
+        self.assertEqual(reused[-2].start, (8, 0))
+        # moved again, the view still reads the nodes of the first tree
+        again = grammar.reparse(new, [(0, 0, '\n')])
+        self.assertTrue(again.parse_tree.root.subs[-2].node is reused[-2])
+        self.assertEqual(again.parse_tree.root.subs[-2].start, (11, 0))
+
+    def test_grow_region(self):
+        start = self.src.index('from')
+        self.check(start, start + len('from b import c'), 'x = \\')
+        self.check(start, start, '    ')
+
+    def test_delete(self):
+        self.check(0, self.src.index('def'), '')
+        self.check(self.src.index('from'), len(self.src), '')
+
+    def test_no_edits(self):
+        old = grammar.parse(self.src)
+        self.assertIs(grammar.reparse(old, []), old)
+        self.assertRaises(ValueError, incremental.apply_edits, self.src, [])
+
+    def test_moved_ast(self):
+        stmt = ASTBuilder(grammar.parse(self.src)).ast.body[1]
+        moved = stmt.moved(2).moved(1)
+        self.assertEqual(type(moved).__name__, 'FunctionDef')
+        self.assertEqual(moved.body[0].body[0].lineno, 8)
+        self.assertEqual(stmt.body[0].body[0].lineno, 5)
+        self.assertEqual(ast_dump(moved.args), ast_dump(stmt.args))
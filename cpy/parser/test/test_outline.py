@@ -0,0 +1,60 @@
+import unittest
+from cpy.parser.pygrammar import grammar
+from cpy.parser.ast_builder import ASTBuilder, OutlineBody
+from cpy.parser.grammar.outline import SKIPPED, parse_body, body_span
+from .tc import dump, leaves, ast_dump
+
+
+class OutlineTest(unittest.TestCase):
+    src = (
+        'import os\n'
+        '@d\n'
+        'def f(a, b=1):\n'
+        '    """doc"""\n'
+        '    if a:\n'
+        '        return b\n'
+        '    return a\n'
+        'class A(B):\n'
+        '    def g(self):\n'
+        '        pass\n'
+        '\n'
+        '    x = 1\n'
+        'def h(): return 2\n'
+        'def k():\n'
+        '    """only a docstring"""\n')
+
+    def skipped(self, node):
+        if node == SKIPPED:
+            return [node]
+        return [n for sub in node for n in self.skipped(sub)]
+
+    def test_skipped(self):
+        src = grammar.parse(self.src, outline=True)
+        bodies = self.skipped(src.parse_tree.root)
+        self.assertEqual([(n.start, n.end, n.val) for n in bodies],
+            [((5, 4), (7, 13), (8, 0)), ((9, 4), (12, 10), (13, 0))])
+        self.assertEqual(src.source[slice(*body_span(src, bodies[1]))],
+            '    def g(self):\n        pass\n\n    x = 1\n')
+        self.assertIn('"""doc"""', leaves(src.parse_tree.root))
+
+        full = grammar.parse(self.src).parse_tree.root
+        suite = full[1][0][0][1][-1]
+        body = parse_body(grammar, src, bodies[0])
+        self.assertEqual([dump(n) for n in body],
+            [dump(n) for n in suite[3:-1]])
+
+        src = grammar.parse(self.src, outline=['funcdef'])
+        self.assertEqual(len(self.skipped(src.parse_tree.root)), 2)
+
+    def test_ast(self):
+        builder = ASTBuilder(grammar.parse(self.src, outline=True))
+        f, a = builder.ast.body[1:3]
+        self.assertEqual(type(f.body[0]).__name__, 'Expr')
+        self.assertIsInstance(f.body[1], OutlineBody)
+        self.assertEqual(f.body[1].lineno, 5)
+        self.assertEqual(len(a.body), 1)
+        self.assertIsInstance(a.body[0], OutlineBody)
+        full = ASTBuilder(grammar.parse(self.src)).ast.body
+        self.assertEqual(ast_dump(builder.expand(a.body[0])),
+            ast_dump(full[2].body))
+        self.assertEqual(ast_dump(builder.ast.body[3:]), ast_dump(full[3:]))
@@ -0,0 +1,140 @@
+import unittest
+import os
+from cpy.parser import pystates
+from cpy.parser.pygrammar import grammar
+from cpy.parser.ast_builder import ASTBuilder
+from cpy.parser.grammar.events import EventQueue
+from cpy.parser.grammar.parse_tree import EMPTY, CHAIN
+from .tc import dump, dump_tokens, leaves, ast_dump
+
+
+class LosslessTest(unittest.TestCase):
+    src = ('# a comment\n'
+        'import os  # trailing\n'
+        '\n\n'
+        'def f(a,\n'
+        '      b):  \t\n'
+        '    x = a + \\\n'
+        '        b\n'
+        '    # indented\n'
+        '    return x\n'
+        '\n'
+        'y = f(1, 2)')
+
+    def test_source(self):
+        for src in (self.src, self.src + '\n', 'x\r\n', ''):
+            tree = grammar.parse(src or ' ', lossless=True).parse_tree
+            self.assertEqual(tree.source(), src or ' ')
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'ast_builder.py')
+        with open(path) as f:
+            text = f.read()
+        tree = grammar.parse(path=path, lossless=True).parse_tree
+        self.assertEqual(tree.source(), text)
+        tree = grammar.parse(text.encode(), lossless=True).parse_tree
+        self.assertEqual(tree.source(), text)
+
+    def test_prefix(self):
+        root = grammar.parse(self.src, lossless=True).parse_tree.root
+        prefixes = []
+
+        def walk(node):
+            if not node.subs and node.prefix.strip():
+                prefixes.append((node.val, node.prefix))
+            for n in node.subs:
+                walk(n)
+        walk(root)
+        self.assertEqual(prefixes, [('import', '# a comment\n'),
+            ('\n', '  # trailing'), ('b', ' \\\n        '),
+            ('return', '    # indented\n    ')])
+
+    def test_same_tree(self):
+        src = self.src + '\n'
+        lossless = grammar.parse(src, lossless=True)
+        self.assertEqual(dump(lossless.parse_tree.root),
+            dump(grammar.parse(src).parse_tree.root))
+        ASTBuilder(lossless).ast
+
+    def test_recover(self):
+        src = 'a = = 1\nb = 2  # two\n'
+        tree = grammar.parse(src, lossless=True, recover=True).parse_tree
+        self.assertEqual(tree.source(), src)
+
+    def test_modes(self):
+        self.assertRaises(ValueError, grammar.parse, self.src,
+            lossless=True, outline=True)
+        self.assertRaises(ValueError, grammar.parse, self.src,
+            lossless=True, events=EventQueue())
+
+
+class CollapseTest(unittest.TestCase):
+    src = ('x = -a ** 2 + b[1:2, ::3] * f(*c, d=e)\n'
+        'y = not x if a < b <= c else lambda z: z or (yield)\n'
+        'for i, *j in [k for k in x if k > 0]: del i, j[0]\n')
+
+    def test_nodes(self):
+        chain = set(grammar.symbols[name] for name in CHAIN)
+
+        def nodes(node, collapsed=False):
+            if collapsed and node.type in chain:
+                self.assertGreater(len(node), 1)
+            return 1 + sum(nodes(n, collapsed) for n in node.subs)
+        full = grammar.parse(self.src).parse_tree.root
+        root = grammar.parse(self.src, collapse=True).parse_tree.root
+        self.assertLess(nodes(root, True) * 2, nodes(full))
+        self.assertEqual(leaves(root), leaves(full))
+
+    def test_names(self):
+        node = grammar.parse('x = a\n', collapse=['power']).parse_tree.root
+        types = []
+        while node.subs:
+            types.append(node.type)
+            node = node[0]
+        self.assertEqual(node.val, 'x')
+        self.assertEqual(types[-2:], [grammar.symbols['factor'],
+            grammar.symbols['atom']])
+
+    def test_ast(self):
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'ast_builder.py')
+        with open(path) as f:
+            text = f.read()
+        for src in (self.src, text):
+            self.assertEqual(
+                ast_dump(ASTBuilder(grammar.parse(src, collapse=True)).ast),
+                ast_dump(ASTBuilder(grammar.parse(src)).ast))
+
+    def test_lossless(self):
+        src = LosslessTest.src
+        tree = grammar.parse(src, lossless=True, collapse=True).parse_tree
+        self.assertEqual(tree.source(), src)
+
+    def test_modes(self):
+        self.assertRaises(ValueError, grammar.parse, self.src,
+            arrays=True, collapse=True)
+        self.assertRaises(ValueError, grammar.parse, self.src,
+            events=EventQueue(), collapse=True)
+
+
+class NodeTest(unittest.TestCase):
+    def test_leaves(self):
+        src = 'def f(a, b):\n    return a + b + f(a, b)\n'
+        tree = grammar.parse(src).parse_tree
+        tokens = []
+
+        def walk(node):
+            if node.val is None:
+                self.assertIsInstance(node.subs, list)
+            else:
+                self.assertIs(node.subs, EMPTY)
+                tokens.append(node)
+            for n in node.subs:
+                walk(n)
+        walk(tree.root)
+        names = [n for n in tokens if n.val == 'a']
+        self.assertEqual(len(names), 3)
+        self.assertIs(names[0].val, names[2].val)
+        self.assertEqual([n.start for n in names], [(1, 6), (2, 11),
+            (2, 21)])
+        self.assertEqual(dump_tokens(tree.root),
+            dump_tokens(grammar.parse(src, arrays=True).parse_tree.root))
@@ -0,0 +1,188 @@
+import unittest
+import token
+from tokenize import TokenError
+from cpy.parser.pygrammar import grammar
+from cpy.parser.grammar.scanner import scan
+from cpy.parser.grammar.linetokenizer import LineTokenizer
+from cpy.parser.ast_builder import ASTBuilder
+from .tc import dump, leaves
+from . import test_codegen
+
+
+class PushParserTest(unittest.TestCase):
+    def test_chunks(self):
+        src = (test_codegen.CompiledParserTest.src +
+            'x = """a\nb""" + (1,\n    2)\n')
+        for size in (1, 3, 7, 64):
+            parser = grammar.parser()
+            for i in range(0, len(src), size):
+                parser.feed(src[i:i + size])
+            self.assertEqual(dump(parser.close().root),
+                dump(grammar.parse(src).parse_tree.root))
+
+    def test_bytes(self):
+        src = 's = "\u00e9\u00e8"\n'.encode('utf8')
+        parser = grammar.parser()
+        for i in range(len(src)):
+            parser.feed(src[i:i + 1])
+        self.assertIn('"\u00e9\u00e8"', leaves(parser.close().root))
+
+    def test_complete(self):
+        for lines, complete in [
+                (['a = 1\n'], [True]),
+                (['x = (1,\n', '2)\n'], [False, True]),
+                (['if x:\n', '    y\n', '\n'], [False, False, True]),
+                (['if x: y\n', 'else:\n', '    z\n', '\n'],
+                    [False, False, False, True])]:
+            parser = grammar.parser(init='single_input')
+            result = []
+            for line in lines:
+                parser.feed(line)
+                result.append(parser.complete)
+            self.assertEqual(result, complete)
+            parser.close()
+
+    def test_syntax_error(self):
+        parser = grammar.parser()
+        parser.feed('a = 1\n')
+        self.assertRaises(SyntaxError, parser.feed, 'b = = 2\n')
+        parser = grammar.parser()
+        parser.feed('def f(a,\n')
+        self.assertRaises(Exception, parser.close)
+
+    def test_close_empty(self):
+        with self.assertRaises(SyntaxError) as cm:
+            grammar.parser().close()
+        self.assertEqual(cm.exception.lineno, 1)
+        parser = grammar.parser(recover=True)
+        parser.close()
+        self.assertEqual([e.lineno for e in parser.errors], [1])
+
+    def test_long_line(self):
+        src = 'x = [\n%s]\ns = """\n%s"""\n' % ('    1,\n' * 200,
+            'a \' \\\n' * 200)
+        tokenizer = LineTokenizer()
+        tokens = []
+        for line in src.splitlines(True):
+            tokens.extend(tokenizer.feed(line))
+            # the scan resumes after the last line, not at the first
+            if tokenizer.pending and not tokenizer.in_string:
+                self.assertEqual(tokenizer.state.row,
+                    len(tokenizer.pending) + 1)
+        tokens.extend(tokenizer.close())
+        self.assertEqual([tk[:4] for tk in tokens],
+            [tk[:4] for tk in scan(src)])
+
+    def test_stray_bracket(self):
+        src = 'x = 1)\ny = (2\n'
+        tokenizer = LineTokenizer()
+        tokens = []
+        for line in src.splitlines(True):
+            tokens.extend(tokenizer.feed(line))
+        # the stray bracket is still open in the next line, as in scan()
+        self.assertEqual(tokenizer.pending, [])
+        tokens.extend(tokenizer.close())
+        self.assertEqual([tk[:4] for tk in tokens],
+            [tk[:4] for tk in scan(src)])
+        tokenizer = LineTokenizer()
+        tokenizer.feed('x = 1)\n')
+        self.assertRaises(TokenError, tokenizer.close)
+
+
+class RecoveryTest(unittest.TestCase):
+    src = (
+        'a = = 1\n'
+        'b = 2\n'
+        'def f():\n'
+        '    x = 1\n'
+        '    y = = 2\n'
+        '    g(x=1, 2)\n'
+        '    z = 3\n'
+        'if x\n'
+        '    pass\n'
+        'c = 1\n'
+        '  d = 2\n'
+        'e = [\n')
+
+    def test_errors(self):
+        src = grammar.parse(self.src, recover=True)
+        self.assertEqual([e.lineno for e in src.errors], [1, 5, 8, 11, 13])
+        root = src.parse_tree.root
+        errors = [n for n in root if n == token.ERRORTOKEN]
+        self.assertEqual([leaves(n) for n in errors], [
+            ['a', '=', '=', '1', '\n'],
+            ['if', 'x', '\n', '    ', 'pass', '\n', ''],
+            ['  ', 'd', '=', '2', '\n', ''],
+            ['e', '=', '[']])
+        self.assertRaises(SyntaxError, grammar.parse, self.src)
+
+    def test_partial_ast(self):
+        builder = ASTBuilder(grammar.parse(self.src, recover=True),
+            recover=True)
+        self.assertEqual([e.lineno for e in builder.errors],
+            [1, 5, 8, 11, 13, 6])
+        body = builder.ast.body
+        self.assertEqual([type(n).__name__ for n in body],
+            ['Assign', 'FunctionDef', 'Assign'])
+        self.assertEqual([n.lineno for n in body[1].body], [4, 7])
+
+    def test_stray_bracket(self):
+        src = (
+            'class A:\n'
+            ' def f(self):\n'
+            '  return )\n'
+            '\n'
+            'def g(): pass\n'
+            'q = 1\n')
+        parsed = grammar.parse(src, recover=True)
+        self.assertEqual([e.lineno for e in parsed.errors], [3])
+        builder = ASTBuilder(parsed, recover=True)
+        self.assertEqual([type(n).__name__ for n in builder.ast.body],
+            ['ClassDef', 'FunctionDef', 'Assign'])
+        parser = grammar.parser(recover=True)
+        for line in src.splitlines(True):
+            parser.feed(line)
+        self.assertEqual(dump(parser.close().root),
+            dump(parsed.parse_tree.root))
+        self.assertRaises(SyntaxError, grammar.parse, src)
+
+    def test_builder_errors(self):
+        for src, init in (('x = = 1\n', 'single_input'),
+                (')\n', 'eval_input'), ('1 +\n', 'eval_input')):
+            parsed = grammar.parse(src, init=init, recover=True)
+            builder = ASTBuilder(parsed, recover=True)
+            self.assertEqual(builder.ast, None)
+            self.assertEqual([e.lineno for e in builder.errors], [1])
+        for src in ('f(a.b=1)\n', 'b"\xe9"\n', 'b"x" "y"\n'):
+            parsed = grammar.parse(src, init='eval_input', recover=True)
+            builder = ASTBuilder(parsed, recover=True)
+            self.assertEqual(builder.ast, None)
+            self.assertEqual(len(builder.errors), 1)
+            self.assertRaises(SyntaxError, ASTBuilder,
+                grammar.parse(src, init='eval_input'))
+        builder = ASTBuilder(grammar.parse('b"x\\n" b"y", br"\\d"\n',
+            init='eval_input'))
+        self.assertEqual([n.s for n in builder.ast.body.elts],
+            [b'x\ny', b'\\d'])
+
+    def test_valid(self):
+        text = test_codegen.CompiledParserTest.src
+        src = grammar.parse(text, recover=True)
+        self.assertEqual(src.errors, [])
+        self.assertEqual(dump(src.parse_tree.root),
+            dump(grammar.parse(text).parse_tree.root))
+
+    def test_push_parser(self):
+        src = self.src[:self.src.index('e = [')]
+        parser = grammar.parser(recover=True)
+        for line in src.splitlines(True):
+            parser.feed(line)
+        tree = parser.close()
+        self.assertEqual([e.lineno for e in parser.errors], [1, 5, 8, 11])
+        self.assertEqual(dump(tree.root),
+            dump(grammar.parse(src, recover=True).parse_tree.root))
+        parser = grammar.parser(recover=True)
+        parser.feed(self.src)
+        parser.close()
+        self.assertEqual([e.lineno for e in parser.errors],
+            [1, 5, 8, 11, 12])
@@ -0,0 +1,48 @@
+import unittest
+import os
+import gc
+from cpy.parser import pystates, prefork
+from cpy.parser.prefork import ParsePool
+
+
+class ParsePoolTest(unittest.TestCase):
+    def setUp(self):
+        gc.unfreeze()
+        prefork._preloaded = False
+
+    def tearDown(self):
+        gc.unfreeze()
+        prefork._preloaded = False
+
+    def test_map(self):
+        srcs = ['a = 1\n', 'def f(x):\n    return x\n',
+            'import a.b as c\n@d(1, *e)\nclass A(B):\n    pass\n']
+        with ParsePool(2) as pool:
+            asts = pool.map(srcs)
+        self.assertEqual([[type(n).__name__ for n in m.body] for m in asts],
+            [['Assign'], ['FunctionDef'], ['Import', 'ClassDef']])
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_preload(self):
+        with ParsePool(1, freeze=False) as pool:
+            self.assertEqual(pool.map(['a = 1\n'])[0].body[0].lineno, 1)
+        self.assertEqual(gc.get_freeze_count(), 0)
+        prefork.preload()
+        count = gc.get_freeze_count()
+        self.assertGreater(count, 0)
+        # frozen objects can still be freed, but none are frozen again
+        objects = [[] for i in range(1000)]
+        prefork.preload()
+        with ParsePool(1) as pool:
+            pool.map(['a = 1\n'])
+        self.assertLessEqual(gc.get_freeze_count(), count)
+
+    def test_func(self):
+        # the function reaches the workers by the fork, not by pickling
+        with ParsePool(2, lambda builder: len(builder.errors),
+                recover=True) as pool:
+            self.assertEqual(pool.map(['a = = 1\nb = 2\n', 'c = 3\n']),
+                [1, 0])
+            path = os.path.join(os.path.dirname(pystates.__file__),
+                'prefork.py')
+            self.assertEqual(pool.map(paths=[path]), [0])
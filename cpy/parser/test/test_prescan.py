@@ -0,0 +1,42 @@
+import unittest
+import os
+from cpy.parser import pystates
+from cpy.parser.grammar import prescan
+from cpy.parser.grammar.sourcefile import SourceFile
+
+
+class PrescanTest(unittest.TestCase):
+    src = (
+        'x = [1,  # (\n'
+        '     2]\n'
+        '\n'
+        'if x:\n'
+        '\ty = """(\n'
+        '  """ + \\\n'
+        '    \'#\'\n')
+
+    def test_lines(self):
+        for src in (self.src, self.src.encode('utf8'),
+                memoryview(self.src.encode('utf8'))):
+            self.assertEqual(list(prescan.line_starts(src)),
+                [0, 13, 21, 22, 28, 38, 48])
+        self.assertEqual(list(prescan.line_starts('a\nb')), [0, 2])
+        self.assertEqual(list(prescan.line_starts('')), [0])
+
+    @unittest.skipIf(prescan.numpy is None, 'needs numpy')
+    def test_vector_lines(self):
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'ast_builder.py')
+        with open(path, 'rb') as f:
+            data = f.read()
+        for src in (self.src.encode('utf8'), data, data[:-1], b'\n\n', b'a'):
+            self.assertEqual(list(prescan.vector_lines(src)),
+                list(prescan.lines(src)))
+        self.assertEqual(list(prescan.vector_lines(memoryview(data))),
+            list(prescan.lines(data)))
+
+    def test_get_line(self):
+        src = SourceFile(src=self.src.encode('utf8'))
+        self.assertEqual(src.get_line(1), 'x = [1,  # (')
+        self.assertEqual(src.get_line(7), "    '#'")
+        self.assertEqual(src.get_line(8), None)
@@ -0,0 +1,33 @@
+import unittest
+import os
+import tempfile
+from cpy.parser import pystates
+from cpy.parser.grammar import Grammar
+from cpy.parser.grammar.profile import Profile, ProfileError
+from cpy.parser.pygrammar import grammar
+from .tc import dump
+from . import test_codegen
+
+
+class ProfileTest(unittest.TestCase):
+    def test_profiled_parser(self):
+        src = test_codegen.CompiledParserTest.src
+        profile = Profile.collect(grammar, [src, 'f(a.b, c)\n'])
+        self.assertTrue(sum(profile.counts) > 0)
+        parser = grammar.compile(profile=profile)
+        self.assertEqual(dump(parser.parse(src).parse_tree.root),
+            dump(grammar.parse(src).parse_tree.root))
+        self.assertRaises(SyntaxError, parser.parse, 'a = = b\n')
+
+    def test_dump_load(self):
+        profile = Profile.collect(grammar, ['a.b(c)\n'])
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            profile.dump(path)
+            loaded = Profile.load(path, grammar.tables)
+            self.assertEqual(loaded.counts, profile.counts)
+            g = Grammar(pystates.symbols, {'file_input': pystates.file_input})
+            self.assertRaises(ProfileError, Profile.load, path, g.tables)
+        finally:
+            os.remove(path)
@@ -0,0 +1,52 @@
+import unittest
+import os
+import io
+import tokenize
+from cpy.parser import pystates
+from cpy.parser.grammar.scanner import scan
+
+
+class ScannerTest(unittest.TestCase):
+    src = (
+        '# comment\n'
+        'if x:\r\n'
+        '\ty = [1,\n'
+        '  # inside\n'
+        '    0x1f, 1.5e-3j, .5]  # trailing\n'
+        '\n'
+        '\tz = rb"a\\"b" + \'\'\'doc\n'
+        'string\'\'\' + u\'\\\n'
+        'x\' \\\n'
+        '        ; w -> a ... != b\n'
+        '\x0cdef f(*a, **k): return a $ k\n')
+
+    def stdlib(self, src):
+        return [tuple(tk) for tk in
+            tokenize.generate_tokens(io.StringIO(src).readline)
+            if tk.type not in (tokenize.NL, tokenize.COMMENT)]
+
+    def test_same_tokens(self):
+        self.assertEqual([tuple(tk) for tk in scan(self.src)],
+            self.stdlib(self.src))
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'ast_builder.py')
+        with open(path) as f:
+            src = f.read()
+        self.assertEqual([tuple(tk) for tk in scan(src)], self.stdlib(src))
+
+    def test_errors(self):
+        for src in ['x = (1,\n', 's = """a\n', 'x = \\\n']:
+            self.assertRaises(tokenize.TokenError, list, scan(src))
+        self.assertRaises(IndentationError, list, scan(
+            'if x:\n    a\n  b\n'))
+        self.assertEqual([tuple(tk) for tk in scan('s = \'a\n')],
+            self.stdlib('s = \'a\n'))
+
+    def test_recover(self):
+        src = 'x = 1)\ny = (2]\n'
+        self.assertRaises(tokenize.TokenError, list, scan(src))
+        tokens = [(tk.type, tk.string) for tk in scan(src, recover=True)]
+        self.assertEqual(tokens[3:5],
+            [(tokenize.ERRORTOKEN, ')'), (tokenize.NEWLINE, '\n')])
+        self.assertEqual(tokens[-3:-1],
+            [(tokenize.OP, ']'), (tokenize.NEWLINE, '\n')])
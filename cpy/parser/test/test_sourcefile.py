@@ -0,0 +1,48 @@
+import unittest
+import os
+import token
+import tempfile
+from cpy.parser.pygrammar import grammar
+from cpy.parser.grammar.scanner import scan
+from cpy.parser.grammar.sourcefile import SourceFile
+from .tc import dump
+
+
+class MappedSourceTest(unittest.TestCase):
+    src = (
+        '# -*- coding: utf-8 -*-\n'
+        'def f(\u00e9t\u00e9, x):\n'
+        '    return [\u00e9t\u00e9, """\u20ac\n\u20ac"""] + \u00e9\u20acx\n'
+        '\n'
+        '    ')
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.write(fd, self.src.encode('utf8'))
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_same_tokens(self):
+        tokens = list(scan(self.src))
+        src = SourceFile(path=self.path, mmap=True)
+        self.assertIsInstance(src.source, memoryview)
+        self.assertEqual(list(src.tokens()), tokens)
+        self.assertEqual(list(scan(memoryview(b'\xef\xbb\xbf' +
+            self.src.encode('utf8')), 'utf-8-sig')), tokens)
+        self.assertEqual(tokens[-1], (token.ENDMARKER, '', (7, 0), (7, 0),
+            ''))
+
+    def test_get_line(self):
+        src = SourceFile(path=self.path, mmap=True)
+        self.assertEqual(src.get_line(3),
+            '    return [\u00e9t\u00e9, """\u20ac')
+        self.assertEqual(src.get_line(6), '    ')
+        self.assertEqual(src.get_line(7), None)
+
+    def test_parse(self):
+        mapped = grammar.parse(path=self.path, mmap=True, recover=True)
+        self.assertEqual(dump(mapped.parse_tree.root),
+            dump(grammar.parse(self.src, recover=True).parse_tree.root))
+        self.assertEqual(len(mapped.errors), 1)
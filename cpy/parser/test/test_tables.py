@@ -0,0 +1,180 @@
+import unittest
+import os
+import threading
+import token
+from cpy.parser import pystates
+from cpy.parser.grammar import Grammar
+from cpy.parser.grammar.tables import Tables, POP
+from cpy.parser.pygrammar import grammar
+from cpy.parser.pygram_gen.grammar_parser import GrammarParser
+from cpy.parser.ast_builder import ASTBuilder
+from .tc import dump, ast_dump
+from . import test_codegen
+
+
+class TablesTest(unittest.TestCase):
+    def test_from_states(self):
+        g = Grammar(pystates.symbols, {
+            'single_input': pystates.single_input,
+            'file_input': pystates.file_input,
+            'eval_input': pystates.eval_input})
+        self.assertEqual(list(g.tables.actions), list(grammar.tables.actions))
+        self.assertEqual(g.tables.chains, grammar.tables.chains)
+        src = 'def f(a, *b):\n    return a.c[1] + -b\n'
+        self.assertEqual(dump(g.parse(src).parse_tree.root),
+            dump(grammar.parse(src).parse_tree.root))
+
+    def test_snapshot(self):
+        tables = Tables.from_snapshot(grammar.tables.snapshot())
+        self.assertIn('_snapshot', tables.__dict__)
+        self.assertEqual(tables.digest(), grammar.tables.digest())
+        self.assertNotIn('_snapshot', tables.__dict__)
+        g = Grammar(grammar.symbols, tables=tables)
+        src = test_codegen.CompiledParserTest.src
+        self.assertEqual(dump(g.parse(src).parse_tree.root),
+            dump(grammar.parse(src).parse_tree.root))
+        self.assertRaises(AttributeError, getattr, tables, 'missing')
+
+    def test_snapshot_threads(self):
+        errors = []
+
+        class ReadingTables(Tables):
+            # another thread reads the tables while they are hydrated
+            def __init__(self, *argv):
+                if 'reader' not in self.__dict__:
+                    self.reader = threading.Thread(target=self.read)
+                    self.reader.start()
+                    self.reader.join()
+                Tables.__init__(self, *argv)
+
+            def read(self):
+                try:
+                    self.actions
+                except AttributeError as e:
+                    errors.append(e)
+        tables = ReadingTables.from_snapshot(grammar.tables.snapshot())
+        self.assertEqual(list(tables.actions), list(grammar.tables.actions))
+        self.assertEqual(errors, [])
+        self.assertNotIn('_snapshot', tables.__dict__)
+
+    def test_chain(self):
+        # a NAME starting an expression descends testlist ... atom in the
+        # single chain action of the start state
+        tables = grammar.tables
+        label = tables.types[token.NAME]
+        action = tables.actions[tables.starts['eval_input'] * tables.nlabels
+            + label]
+        self.assertLess(action, POP)
+        nxt, syms, subs = tables.chains[-action - 2]
+        self.assertEqual(len(subs), len(syms))
+        # the same rules one step at a time, from the bootstraps
+        names = []
+        st = pystates.eval_input
+        while True:
+            if not hasattr(st, 'bootstrap'):
+                st.build_bootstrap()
+            sub, st = st.bootstrap[token.NAME][None]
+            if sub is None:
+                break
+            names.append(sub.name)
+            st = sub
+        self.assertEqual(list(syms), [tables.symbols[n] for n in names])
+        self.assertEqual(names[-1], 'atom')
+        node = grammar.parse('x\n', init='eval_input').parse_tree.root[0]
+        path = []
+        while node.subs:
+            path.append(node.type)
+            node = node[0]
+        self.assertEqual(path, list(syms))
+        self.assertEqual(node.val, 'x')
+
+    def test_single_input(self):
+        tree = grammar.parse('a = b\n', init='single_input').parse_tree
+        self.assertEqual(tree.root, grammar.symbols.single_input)
+
+    def test_syntax_error(self):
+        self.assertRaises(SyntaxError, grammar.parse, 'a = = b\n')
+        self.assertRaises(SyntaxError, grammar.parse, 'a\nb\n', None,
+            'single_input')
+
+
+class SubsetTest(unittest.TestCase):
+    expr_rules = ['testlist', 'test', 'or_test', 'and_test', 'not_test',
+        'comparison', 'comp_op', 'expr', 'xor_expr', 'and_expr',
+        'shift_expr', 'arith_expr', 'term', 'factor', 'power', 'atom',
+        'trailer', 'arglist', 'argument', 'subscriptlist', 'subscript',
+        'sliceop', 'exprlist', 'star_expr']
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'pygram_gen', 'Grammar3.3')
+        with open(path) as f:
+            cls.gramsrc = f.read()
+        cls.states = GrammarParser(cls.gramsrc).states
+
+    def named(self, symbols, node):
+        names = dict((v, k) for k, v in symbols.items())
+        return (names.get(node.type, node.type), node.val,
+            [self.named(symbols, n) for n in node.subs])
+
+    def test_eval_input(self):
+        tables = self.states.tables(['eval_input'], compact=True)
+        self.assertEqual(sorted(tables.symbols.values()),
+            list(range(257, 257 + len(tables.symbols))))
+        self.assertLess(len(tables.actions), len(grammar.tables.actions))
+        g = Grammar(tables.symbols, tables=tables, default_state='eval_input')
+        src = 'a.b(1, *c)[2:3] + -d ** 2 if x else (lambda y: y)\n'
+        tree = g.parse(src).parse_tree
+        self.assertEqual(self.named(tables.symbols, tree.root),
+            self.named(grammar.tables.symbols,
+                grammar.parse(src, init='eval_input').parse_tree.root))
+
+    def test_ast(self):
+        for start, src in [
+                ('eval_input', 'a.b(1, *c)[2:3] + -d if x else (y, z)\n'),
+                ('file_input', test_codegen.CompiledParserTest.src)]:
+            tables = self.states.tables([start], compact=True)
+            g = Grammar(tables.symbols, tables=tables, default_state=start)
+            self.assertEqual(ast_dump(ASTBuilder(g.parse(src)).ast),
+                ast_dump(ASTBuilder(grammar.parse(src, init=start)).ast))
+
+    def test_generate(self):
+        # the module can be saved anywhere, outside of the package too
+        tables = self.states.tables(['eval_input'], compact=True)
+        ns = {}
+        exec(compile(tables.generate(), '<tables>', 'exec'), ns)
+        self.assertEqual(ns['tables'].digest(), tables.digest())
+        self.assertEqual(ns['symbols'].eval_input,
+            tables.symbols['eval_input'])
+
+    def test_allow(self):
+        tables = self.states.tables(['eval_input'], self.expr_rules)
+        self.assertLessEqual(set(tables.symbols),
+            set(self.expr_rules) | set(['eval_input']))
+        self.assertIn('atom', tables.symbols)
+        g = Grammar(tables.symbols, tables=tables, default_state='eval_input')
+        g.parse('a[1] + f(b, *c) * 2\n')
+        self.assertRaises(SyntaxError, g.parse, 'lambda x: x\n')
+        self.assertRaises(SyntaxError, g.parse, '[x for x in y]\n')
+
+    def test_grammar_parser(self):
+        states = GrammarParser(self.gramsrc, ['eval_input']).states
+        self.assertEqual(list(states)[0], 'eval_input')
+        self.assertNotIn('file_input', list(states))
+
+    def test_minimal_dfa(self):
+        # both alternatives end the same way, so the DFA needs only the
+        # start and one final state after 'a' or 'b', looping on NAME, 'c'
+        g = GrammarParser("r: 'a' (NAME | 'c')* | 'b' (NAME | 'c')*\n")
+        self.assertEqual(len(g.dfas['r']), 2)
+        g = GrammarParser("r: 'a' NAME ['c'] | 'b' NAME ['c'] | 'd'\n")
+        self.assertEqual(len(g.dfas['r']), 4)
+        stats = g.timings['r']
+        self.assertGreaterEqual(stats['dfa'], stats['min'])
+        self.assertIn('r', g.timing_report())
+
+    def test_reproducible(self):
+        digests = [GrammarParser(self.gramsrc).states.tables(
+            ['file_input']).digest() for i in range(2)]
+        self.assertEqual(digests[0], digests[1])
@@ -0,0 +1,31 @@
+import unittest
+from cpy.parser.pygrammar import grammar
+from cpy.parser.grammar.sourcefile import SourceFile
+from .tc import dump
+from . import test_scanner, test_sourcefile
+
+
+class TokenArrayTest(unittest.TestCase):
+    def test_same_tokens(self):
+        for text in (test_scanner.ScannerTest.src,
+                test_sourcefile.MappedSourceTest.src,
+                's = """a\r\n"""  \\\n  + b'):
+            for src in (text, text.encode('utf8')):
+                tokens = list(SourceFile(src=src).tokens())
+                src = SourceFile(src=src)
+                array = src.keep_tokens()
+                self.assertEqual(len(array), len(tokens))
+                self.assertEqual(list(src.tokens()), tokens)
+                self.assertEqual(list(src.tokens()), tokens)
+
+    def test_parse(self):
+        src = SourceFile(src='a + b\n')
+        src.keep_tokens()
+        tree = grammar.parse(src).parse_tree
+        self.assertEqual(dump(tree.root),
+            dump(grammar.parse('a + b\n').parse_tree.root))
+        tree = grammar.parse(src, init='single_input').parse_tree
+        single = grammar.parse('a + b\n', init='single_input').parse_tree
+        self.assertEqual(dump(tree.root), dump(single.root))
+        self.assertEqual(src.token_array.strings,
+            ['a', '+', 'b', '\n', ''])
@@ -0,0 +1,51 @@
+import unittest
+import os
+import tokenize
+from cpy.parser import pystates
+from cpy.parser.pygrammar import grammar
+from cpy.parser.grammar.scanner import scan
+from cpy.parser.grammar.sourcefile import SourceFile
+from cpy.parser.grammar.tokenstream import TokenStream
+from .tc import dump
+
+
+class TokenStreamTest(unittest.TestCase):
+    def setUp(self):
+        path = os.path.join(os.path.dirname(pystates.__file__),
+            'ast_builder.py')
+        with open(path) as f:
+            self.src = f.read()
+
+    def check(self, stream, edit):
+        lines = stream.edit([edit])
+        self.assertEqual(list(stream), list(scan(stream.source)))
+        return lines
+
+    def test_edits(self):
+        stream = TokenStream(self.src, every=16)
+        list(stream)
+        middle = self.src.index('\n    def ', len(self.src) // 2) + 1
+        first, end = self.check(stream, (middle, middle, '    x = [1]\n'))
+        self.assertLessEqual(end - first, 20)
+        first, end = self.check(stream, (middle + 10, middle + 10, ',\n2'))
+        self.assertLessEqual(end - first, 20)
+        self.check(stream, (middle, middle + 15, ''))
+        self.assertEqual(stream.source, self.src)
+        self.check(stream, (0, 0, 'if x:\n'))
+        self.check(stream, (len(stream.source), len(stream.source), 'y'))
+
+    def test_errors(self):
+        stream = TokenStream(self.src)
+        list(stream)
+        middle = self.src.index('\n    def ', len(self.src) // 2) + 1
+        self.assertRaises(tokenize.TokenError, stream.edit,
+            [(middle, middle, '(')])
+        self.check(stream, (middle, middle + 1, ''))
+        self.assertEqual(stream.source, self.src)
+
+    def test_parse(self):
+        src = SourceFile(src='def f(a):\n    return a\n\nb = f(1)\n')
+        src.edit([(23, 23, '    c = 2\n')])
+        self.assertEqual(src.edit([(21, 22, 'c')]), (1, None))
+        self.assertEqual(dump(grammar.parse(src).parse_tree.root),
+            dump(grammar.parse(src.source).parse_tree.root))